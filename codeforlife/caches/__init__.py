@@ -6,3 +6,9 @@ Created on 28/01/2026 at 16:52:19(+00:00).
 from .base import BaseCache
 from .base_dynamic_key import BaseDynamicKeyCache
 from .base_fixed_key import BaseFixedKeyCache
+from .codecs import Codec, JsonCodec, MsgpackCodec, PickleCodec, ZlibCodec
+from .dek_aead import DekAeadCache, DekAeadCacheMetrics
+from .local import LocalCache
+from .model_version import ModelVersion, ModelVersionCache
+from .queryset_count import QuerySetCountCache
+from .response import ResponseCache
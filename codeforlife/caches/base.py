@@ -3,18 +3,73 @@
 Created on 28/01/2026 at 16:52:19(+00:00).
 """
 
+import threading
 import typing as t
 
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
 
+from .codecs import Codec
+from .local import LocalCache, publish_invalidation
+
 V = t.TypeVar("V")
 
+# Distinguishes a missing value from a cached None.
+_MISSING = object()
+
 
 class BaseCache(t.Generic[V]):
-    """Base class which helps to get and set cache values."""
+    """Base class which helps to get and set cache values.
+
+    Subclasses may opt in to an in-process tier in front of the shared cache by
+    setting `local_maxsize`. See `codeforlife.caches.local`.
+
+    Subclasses may also set a `codec` which encodes values before they're sent
+    to the shared cache. See `codeforlife.caches.codecs`.
+    """
 
     timeout: int | None = None
 
+    # Encodes values sent to the shared cache. None leaves values to the
+    # backend, which pickles them.
+    codec: t.Optional[Codec] = None
+
+    # The max number of values kept in each process's memory. 0 disables the
+    # in-process tier.
+    local_maxsize: int = 0
+    # The number of seconds values are kept in each process's memory. This is
+    # the longest a value can be stale if an invalidation is missed.
+    local_timeout: float = 5
+
+    _local_cache: t.Optional[LocalCache] = None
+    _local_cache_lock = threading.Lock()
+
+    @classmethod
+    def get_local_cache(cls):
+        """Get this cache's in-process tier, if it has one."""
+        if not cls.local_maxsize:
+            return None
+
+        # Each subclass has its own in-process tier.
+        if "_local_cache" not in cls.__dict__:
+            with cls._local_cache_lock:
+                if "_local_cache" not in cls.__dict__:
+                    cls._local_cache = LocalCache(
+                        maxsize=cls.local_maxsize, ttl=cls.local_timeout
+                    )
+
+        return cls._local_cache
+
+    @classmethod
+    def encode(cls, value: V) -> t.Any:
+        """Encode a value to send to the shared cache."""
+        return value if cls.codec is None else cls.codec.encode(value)
+
+    @classmethod
+    def decode(cls, value: t.Any) -> V:
+        """Decode a value fetched from the shared cache."""
+        return value if cls.codec is None else cls.codec.decode(value)
+
     @classmethod
     def get(
         cls,
@@ -26,11 +81,25 @@ class BaseCache(t.Generic[V]):
         Fetch a given key from the cache. If the key does not exist, return
         default, which itself defaults to None.
         """
-        return cache.get(
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            values = local_cache.get_many(keys=[key], version=version)
+            if key in values:
+                return values[key]
+
+        value = cache.get(
             key=key,
-            default=default,
+            default=_MISSING,
             version=version,
         )
+        if value is _MISSING:
+            return default
+
+        value = cls.decode(value)
+        if local_cache is not None:
+            local_cache.set_many(data={key: value}, version=version)
+
+        return value
 
     @classmethod
     def set(
@@ -46,11 +115,42 @@ class BaseCache(t.Generic[V]):
         """
         cache.set(
             key=key,
-            value=value,
+            value=cls.encode(value),
             timeout=timeout or cls.timeout,
             version=version,
         )
 
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.set_many(data={key: value}, version=version)
+            publish_invalidation(keys=[key], version=version)
+
+    @classmethod
+    def add(
+        cls,
+        key: str,
+        value: V,
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        """
+        Set a value in the cache if the key does not already exist. Return
+        whether the value was set.
+        """
+        added = cache.add(
+            key=key,
+            value=cls.encode(value),
+            timeout=timeout or cls.timeout,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if added and local_cache is not None:
+            local_cache.set_many(data={key: value}, version=version)
+            publish_invalidation(keys=[key], version=version)
+
+        return added
+
     @classmethod
     def delete(
         cls,
@@ -65,3 +165,255 @@ class BaseCache(t.Generic[V]):
             key=key,
             version=version,
         )
+
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.delete_many(keys=[key], version=version)
+            publish_invalidation(keys=[key], version=version)
+
+    @classmethod
+    def get_many(
+        cls,
+        keys: t.Iterable[str],
+        version: t.Optional[int] = None,
+    ) -> t.Dict[str, V]:
+        """
+        Fetch many keys from the cache in one round trip. Return a dict mapping
+        each key found in the cache to its value.
+        """
+        local_cache = cls.get_local_cache()
+        if local_cache is None:
+            return {
+                key: cls.decode(value)
+                for key, value in cache.get_many(
+                    keys=keys,
+                    version=version,
+                ).items()
+            }
+
+        keys = list(keys)
+        values: t.Dict[str, V] = local_cache.get_many(
+            keys=keys, version=version
+        )
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            missing_values: t.Dict[str, V] = {
+                key: cls.decode(value)
+                for key, value in cache.get_many(
+                    keys=missing_keys,
+                    version=version,
+                ).items()
+            }
+            local_cache.set_many(data=missing_values, version=version)
+            values.update(missing_values)
+
+        return values
+
+    @classmethod
+    def set_many(
+        cls,
+        data: t.Dict[str, V],
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        """
+        Set many values in the cache in one round trip. If timeout is given,
+        use that timeout for the keys; otherwise use the default cache timeout.
+        """
+        cache.set_many(
+            data={key: cls.encode(value) for key, value in data.items()},
+            timeout=timeout or cls.timeout,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.set_many(data=data, version=version)
+            publish_invalidation(keys=list(data), version=version)
+
+    @classmethod
+    def delete_many(
+        cls,
+        keys: t.Iterable[str],
+        version: t.Optional[int] = None,
+    ):
+        """Delete many keys from the cache in one round trip."""
+        keys = list(keys)
+        cache.delete_many(
+            keys=keys,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.delete_many(keys=keys, version=version)
+            publish_invalidation(keys=keys, version=version)
+
+    # Async counterparts, backed by Django's async cache API.
+
+    @classmethod
+    async def aget(
+        cls,
+        key: str,
+        default: t.Optional[V] = None,
+        version: t.Optional[int] = None,
+    ) -> t.Optional[V]:
+        """Async counterpart of `get`."""
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            values = local_cache.get_many(keys=[key], version=version)
+            if key in values:
+                return values[key]
+
+        value = await cache.aget(
+            key=key,
+            default=_MISSING,
+            version=version,
+        )
+        if value is _MISSING:
+            return default
+
+        value = cls.decode(value)
+        if local_cache is not None:
+            local_cache.set_many(data={key: value}, version=version)
+
+        return value
+
+    @classmethod
+    async def aset(
+        cls,
+        key: str,
+        value: V,
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        """Async counterpart of `set`."""
+        await cache.aset(
+            key=key,
+            value=cls.encode(value),
+            timeout=timeout or cls.timeout,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.set_many(data={key: value}, version=version)
+            await sync_to_async(publish_invalidation)(
+                keys=[key], version=version
+            )
+
+    @classmethod
+    async def aadd(
+        cls,
+        key: str,
+        value: V,
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        """Async counterpart of `add`."""
+        added = await cache.aadd(
+            key=key,
+            value=cls.encode(value),
+            timeout=timeout or cls.timeout,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if added and local_cache is not None:
+            local_cache.set_many(data={key: value}, version=version)
+            await sync_to_async(publish_invalidation)(
+                keys=[key], version=version
+            )
+
+        return added
+
+    @classmethod
+    async def adelete(
+        cls,
+        key: str,
+        version: t.Optional[int] = None,
+    ):
+        """Async counterpart of `delete`."""
+        await cache.adelete(
+            key=key,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.delete_many(keys=[key], version=version)
+            await sync_to_async(publish_invalidation)(
+                keys=[key], version=version
+            )
+
+    @classmethod
+    async def aget_many(
+        cls,
+        keys: t.Iterable[str],
+        version: t.Optional[int] = None,
+    ) -> t.Dict[str, V]:
+        """Async counterpart of `get_many`."""
+        keys = list(keys)
+        local_cache = cls.get_local_cache()
+        values: t.Dict[str, V] = (
+            {}
+            if local_cache is None
+            else local_cache.get_many(keys=keys, version=version)
+        )
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            missing_values: t.Dict[str, V] = {
+                key: cls.decode(value)
+                for key, value in (
+                    await cache.aget_many(
+                        keys=missing_keys,
+                        version=version,
+                    )
+                ).items()
+            }
+            if local_cache is not None:
+                local_cache.set_many(data=missing_values, version=version)
+            values.update(missing_values)
+
+        return values
+
+    @classmethod
+    async def aset_many(
+        cls,
+        data: t.Dict[str, V],
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        """Async counterpart of `set_many`."""
+        await cache.aset_many(
+            data={key: cls.encode(value) for key, value in data.items()},
+            timeout=timeout or cls.timeout,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.set_many(data=data, version=version)
+            await sync_to_async(publish_invalidation)(
+                keys=list(data), version=version
+            )
+
+    @classmethod
+    async def adelete_many(
+        cls,
+        keys: t.Iterable[str],
+        version: t.Optional[int] = None,
+    ):
+        """Async counterpart of `delete_many`."""
+        keys = list(keys)
+        await cache.adelete_many(
+            keys=keys,
+            version=version,
+        )
+
+        local_cache = cls.get_local_cache()
+        if local_cache is not None:
+            local_cache.delete_many(keys=keys, version=version)
+            await sync_to_async(publish_invalidation)(
+                keys=keys, version=version
+            )
@@ -47,6 +47,21 @@ class BaseDynamicKeyCache(BaseCache[V], t.Generic[K, V]):
             version=version,
         )
 
+    @classmethod
+    def add(  # type: ignore[override]
+        cls,
+        key: K,
+        value: V,
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        return super().add(
+            key=cls.make_key(key),
+            value=value,
+            timeout=timeout,
+            version=version,
+        )
+
     @classmethod
     def delete(  # type: ignore[override]
         cls,
@@ -57,3 +72,139 @@ class BaseDynamicKeyCache(BaseCache[V], t.Generic[K, V]):
             key=cls.make_key(key),
             version=version,
         )
+
+    @classmethod
+    def get_many(  # type: ignore[override]
+        cls,
+        keys: t.Iterable[K],
+        version: t.Optional[int] = None,
+    ) -> t.Dict[K, V]:
+        # Map each cache key back to its key.
+        cache_keys = {cls.make_key(key): key for key in keys}
+        values = super().get_many(
+            keys=cache_keys,
+            version=version,
+        )
+
+        return {
+            cache_keys[cache_key]: value for cache_key, value in values.items()
+        }
+
+    @classmethod
+    def set_many(  # type: ignore[override]
+        cls,
+        data: t.Dict[K, V],
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        super().set_many(
+            data={cls.make_key(key): value for key, value in data.items()},
+            timeout=timeout,
+            version=version,
+        )
+
+    @classmethod
+    def delete_many(  # type: ignore[override]
+        cls,
+        keys: t.Iterable[K],
+        version: t.Optional[int] = None,
+    ):
+        super().delete_many(
+            keys=[cls.make_key(key) for key in keys],
+            version=version,
+        )
+
+    @classmethod
+    async def aget(  # type: ignore[override]
+        cls,
+        key: K,
+        default: t.Optional[V] = None,
+        version: t.Optional[int] = None,
+    ) -> t.Optional[V]:
+        return await super().aget(
+            key=cls.make_key(key),
+            default=default,
+            version=version,
+        )
+
+    @classmethod
+    async def aset(  # type: ignore[override]
+        cls,
+        key: K,
+        value: V,
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        await super().aset(
+            key=cls.make_key(key),
+            value=value,
+            timeout=timeout,
+            version=version,
+        )
+
+    @classmethod
+    async def aadd(  # type: ignore[override]
+        cls,
+        key: K,
+        value: V,
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        return await super().aadd(
+            key=cls.make_key(key),
+            value=value,
+            timeout=timeout,
+            version=version,
+        )
+
+    @classmethod
+    async def adelete(  # type: ignore[override]
+        cls,
+        key: K,
+        version: t.Optional[int] = None,
+    ):
+        await super().adelete(
+            key=cls.make_key(key),
+            version=version,
+        )
+
+    @classmethod
+    async def aget_many(  # type: ignore[override]
+        cls,
+        keys: t.Iterable[K],
+        version: t.Optional[int] = None,
+    ) -> t.Dict[K, V]:
+        # Map each cache key back to its key.
+        cache_keys = {cls.make_key(key): key for key in keys}
+        values = await super().aget_many(
+            keys=cache_keys,
+            version=version,
+        )
+
+        return {
+            cache_keys[cache_key]: value for cache_key, value in values.items()
+        }
+
+    @classmethod
+    async def aset_many(  # type: ignore[override]
+        cls,
+        data: t.Dict[K, V],
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        await super().aset_many(
+            data={cls.make_key(key): value for key, value in data.items()},
+            timeout=timeout,
+            version=version,
+        )
+
+    @classmethod
+    async def adelete_many(  # type: ignore[override]
+        cls,
+        keys: t.Iterable[K],
+        version: t.Optional[int] = None,
+    ):
+        await super().adelete_many(
+            keys=[cls.make_key(key) for key in keys],
+            version=version,
+        )
@@ -0,0 +1,112 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 14:05:12(+01:00).
+"""
+
+import typing as t
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..tests import TestCase
+from .base_dynamic_key import BaseDynamicKeyCache
+
+# pylint: disable=missing-class-docstring
+
+
+class ExampleCache(BaseDynamicKeyCache[int, t.Dict[str, int]]):
+    timeout = 60
+
+    @staticmethod
+    def make_key(key):
+        return f"{key}.example"
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class TestBaseDynamicKeyCache(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_get_many(self):
+        """Gets the values of many keys, keyed by the original keys."""
+        cache.set("1.example", {"value": 1})
+        cache.set("2.example", {"value": 2})
+
+        with patch.object(cache, "get_many", wraps=cache.get_many) as get_many:
+            assert ExampleCache.get_many([1, 2, 3]) == {
+                1: {"value": 1},
+                2: {"value": 2},
+            }
+            get_many.assert_called_once()
+
+    def test_set_many(self):
+        """Sets the values of many keys."""
+        with patch.object(cache, "set_many", wraps=cache.set_many) as set_many:
+            ExampleCache.set_many({1: {"value": 1}, 2: {"value": 2}})
+            set_many.assert_called_once_with(
+                data={"1.example": {"value": 1}, "2.example": {"value": 2}},
+                timeout=ExampleCache.timeout,
+                version=None,
+            )
+
+        assert ExampleCache.get(1) == {"value": 1}
+        assert ExampleCache.get(2) == {"value": 2}
+
+    def test_add(self):
+        """Only sets a value if the key doesn't already exist."""
+        assert ExampleCache.add(1, {"value": 1})
+        assert not ExampleCache.add(1, {"value": 2})
+
+        assert ExampleCache.get(1) == {"value": 1}
+
+    def test_delete_many(self):
+        """Deletes many keys."""
+        ExampleCache.set_many({1: {"value": 1}, 2: {"value": 2}})
+
+        with patch.object(
+            cache, "delete_many", wraps=cache.delete_many
+        ) as delete_many:
+            ExampleCache.delete_many([1, 2])
+            delete_many.assert_called_once()
+
+        assert not ExampleCache.get_many([1, 2])
+
+    async def test_aget(self):
+        """Gets a value asynchronously."""
+        await ExampleCache.aset(1, {"value": 1})
+
+        assert await ExampleCache.aget(1) == {"value": 1}
+        assert await ExampleCache.aget(2, default={"value": 0}) == {"value": 0}
+
+    async def test_aadd(self):
+        """Only sets a value asynchronously if the key doesn't already exist."""
+        assert await ExampleCache.aadd(1, {"value": 1})
+        assert not await ExampleCache.aadd(1, {"value": 2})
+
+        assert await ExampleCache.aget(1) == {"value": 1}
+
+    async def test_adelete(self):
+        """Deletes a value asynchronously."""
+        await ExampleCache.aset(1, {"value": 1})
+        await ExampleCache.adelete(1)
+
+        assert await ExampleCache.aget(1) is None
+
+    async def test_aget_many(self):
+        """Gets many values asynchronously, keyed by the original keys."""
+        await ExampleCache.aset_many({1: {"value": 1}, 2: {"value": 2}})
+
+        assert await ExampleCache.aget_many([1, 2, 3]) == {
+            1: {"value": 1},
+            2: {"value": 2},
+        }
+
+        await ExampleCache.adelete_many([1, 2])
+        assert not await ExampleCache.aget_many([1, 2])
@@ -53,4 +53,40 @@ class BaseFixedKeyCache(BaseCache[V], t.Generic[V]):
             version=version,
         )
 
+    @classmethod
+    async def aget(  # type: ignore[override]
+        cls,
+        default: t.Optional[V] = None,
+        version: t.Optional[int] = None,
+    ) -> t.Optional[V]:
+        return await super().aget(
+            key=cls.key,
+            default=default,
+            version=version,
+        )
+
+    @classmethod
+    async def aset(  # type: ignore[override]
+        cls,
+        value: V,
+        timeout: t.Optional[int] = None,
+        version: t.Optional[int] = None,
+    ):
+        await super().aset(
+            key=cls.key,
+            value=value,
+            timeout=timeout,
+            version=version,
+        )
+
+    @classmethod
+    async def adelete(  # type: ignore[override]
+        cls,
+        version: t.Optional[int] = None,
+    ):
+        await super().adelete(
+            key=cls.key,
+            version=version,
+        )
+
     # pylint: enable=arguments-differ
@@ -0,0 +1,100 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 15:58:31(+01:00).
+
+Codecs which encode cache values to bytes before they are sent to the shared
+cache and decode them after they are fetched.
+
+By default, Django's Redis backend pickles values. Pickling is flexible but
+slow and verbose for JSON-like values, such as dicts of strings and numbers.
+JSON and MessagePack encode such values faster and into fewer bytes, and large
+values can be compressed before they are stored.
+
+JSON and MessagePack only support JSON-like values. For example, tuples are
+decoded as lists and datetimes are not supported by MessagePack.
+"""
+
+import pickle
+import typing as t
+import zlib
+
+import msgpack  # type: ignore[import-untyped]
+import orjson
+
+
+class Codec:
+    """Encodes values to bytes and decodes them back."""
+
+    def encode(self, value: t.Any) -> bytes:
+        """Encode a value to bytes."""
+        raise NotImplementedError()
+
+    def decode(self, data: bytes) -> t.Any:
+        """Decode a value from bytes."""
+        raise NotImplementedError()
+
+
+class PickleCodec(Codec):
+    """Encodes values with pickle, like Django's Redis backend."""
+
+    def encode(self, value):
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data):
+        return pickle.loads(data)
+
+
+class JsonCodec(Codec):
+    """Encodes JSON-like values with orjson."""
+
+    def encode(self, value):
+        return orjson.dumps(value)
+
+    def decode(self, data):
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """Encodes JSON-like values with MessagePack."""
+
+    def encode(self, value):
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data):
+        return msgpack.unpackb(data, raw=False)
+
+
+class ZlibCodec(Codec):
+    """Compresses the values encoded by another codec if they're large.
+
+    Each encoded value is prefixed with a byte which flags whether it's
+    compressed, so that small values don't pay for compression.
+    """
+
+    UNCOMPRESSED = b"\x00"
+    COMPRESSED = b"\x01"
+
+    def __init__(self, codec: Codec, threshold: int = 1024, level: int = 1):
+        """
+        Args:
+            codec: The codec which encodes the values before they're compressed.
+            threshold: The min number of encoded bytes which are compressed.
+            level: The level of compression, from 1 (fastest) to 9 (smallest).
+        """
+        self.codec = codec
+        self.threshold = threshold
+        self.level = level
+
+    def encode(self, value):
+        data = self.codec.encode(value)
+        if len(data) < self.threshold:
+            return self.UNCOMPRESSED + data
+
+        return self.COMPRESSED + zlib.compress(data, self.level)
+
+    def decode(self, data):
+        flag, data = data[:1], data[1:]
+        if flag == self.COMPRESSED:
+            data = zlib.decompress(data)
+
+        return self.codec.decode(data)
@@ -0,0 +1,143 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 15:58:31(+01:00).
+"""
+
+import logging
+import pickle
+import typing as t
+from time import perf_counter
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..tests import TestCase
+from .base_dynamic_key import BaseDynamicKeyCache
+from .codecs import Codec, JsonCodec, MsgpackCodec, PickleCodec, ZlibCodec
+
+# pylint: disable=missing-class-docstring
+
+
+class ExampleCache(BaseDynamicKeyCache[int, t.Dict[str, t.Any]]):
+    codec = ZlibCodec(MsgpackCodec(), threshold=64)
+
+    @staticmethod
+    def make_key(key):
+        return f"{key}.example.codec"
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class TestCodecs(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.value = {
+            "access_token": "ya29." + "a" * 200,
+            "token_type": "Bearer",
+            "scope": "openid email profile",
+            "classes": [{"id": i, "name": f"Class {i}"} for i in range(50)],
+        }
+
+    def _test_codec(self, codec: Codec):
+        assert codec.decode(codec.encode(self.value)) == self.value
+
+    def test_pickle(self):
+        """Values are encoded with pickle."""
+        self._test_codec(PickleCodec())
+
+    def test_json(self):
+        """Values are encoded as JSON."""
+        self._test_codec(JsonCodec())
+
+    def test_msgpack(self):
+        """Values are encoded with MessagePack."""
+        self._test_codec(MsgpackCodec())
+
+    def test_zlib(self):
+        """Large values are compressed and small values are not."""
+        codec = ZlibCodec(MsgpackCodec(), threshold=64)
+        self._test_codec(codec)
+        assert codec.encode(self.value)[:1] == ZlibCodec.COMPRESSED
+
+        value = {"id": 1}
+        data = codec.encode(value)
+        assert data[:1] == ZlibCodec.UNCOMPRESSED
+        assert codec.decode(data) == value
+
+    def test_cache(self):
+        """Values are encoded in the shared cache and decoded when fetched."""
+        ExampleCache.set(1, self.value)
+        ExampleCache.set_many({2: self.value})
+
+        assert isinstance(cache.get("1.example.codec"), bytes)
+        assert ExampleCache.get(1) == self.value
+        assert ExampleCache.get_many([1, 2, 3]) == {
+            1: self.value,
+            2: self.value,
+        }
+
+    def test_cache__local(self):
+        """Values are decoded once before they're kept in memory."""
+        with patch.object(ExampleCache, "local_maxsize", 10):
+            local_cache = ExampleCache.get_local_cache()
+            assert local_cache
+            local_cache.clear()
+
+            ExampleCache.set(1, self.value)
+            local_cache.clear()
+
+            with patch.object(
+                ExampleCache, "decode", wraps=ExampleCache.decode
+            ) as decode:
+                assert ExampleCache.get(1) == self.value
+                assert ExampleCache.get(1) == self.value
+                decode.assert_called_once()
+
+    def test_benchmark(self):
+        """
+        Benchmark the payload size and encode/decode time of each codec against
+        the backend's default, which pickles the values.
+        """
+        iterations = 2000
+        codecs: t.Dict[str, Codec] = {
+            "pickle": PickleCodec(),
+            "json": JsonCodec(),
+            "msgpack": MsgpackCodec(),
+            "json+zlib": ZlibCodec(JsonCodec()),
+            "msgpack+zlib": ZlibCodec(MsgpackCodec()),
+        }
+
+        sizes: t.Dict[str, int] = {}
+        for name, codec in codecs.items():
+            start = perf_counter()
+            for _ in range(iterations):
+                data = codec.encode(self.value)
+            encode_time = perf_counter() - start
+
+            # The backend pickles the encoded bytes.
+            sizes[name] = len(
+                data if name == "pickle" else pickle.dumps(data, -1)
+            )
+
+            start = perf_counter()
+            for _ in range(iterations):
+                codec.decode(data)
+            decode_time = perf_counter() - start
+
+            logging.info(
+                "%s: %d bytes, %.1fµs/encode, %.1fµs/decode",
+                name,
+                sizes[name],
+                encode_time / iterations * 1e6,
+                decode_time / iterations * 1e6,
+            )
+
+        assert sizes["msgpack"] < sizes["pickle"]
+        assert sizes["msgpack+zlib"] < sizes["msgpack"]
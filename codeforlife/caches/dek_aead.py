@@ -0,0 +1,234 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 10:12:37(+01:00).
+
+An in-memory cache of the AEAD primitives of decrypted data encryption keys
+(DEKs). Unwrapping a DEK requires a round trip to Cloud KMS, so each process
+keeps the primitives it has unwrapped for a while.
+
+On top of a `TTLCache`, the cache:
+
+- counts its hits, misses, loads and evictions so its effectiveness can be
+  measured;
+- coalesces concurrent misses for the same key so that only one thread unwraps
+  the DEK while the others wait for the result;
+- negatively caches failed loads for a short time so that a DEK which cannot be
+  unwrapped does not cause a KMS round trip on every access.
+
+The primitives are deliberately not shared between processes. Sharing them
+would mean storing plaintext key material outside of the process, which defeats
+the purpose of envelope encryption.
+"""
+
+import threading
+import typing as t
+from copy import copy
+from dataclasses import asdict, dataclass
+
+from cachetools import TTLCache
+
+if t.TYPE_CHECKING:
+    from tink.aead import Aead  # type: ignore[import]
+
+# Distinguishes a missing key from a cached value.
+_MISSING = object()
+
+
+@dataclass
+class DekAeadCacheMetrics:
+    """Counters of a DEK AEAD cache's activity."""
+
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+    loads: int = 0
+    load_failures: int = 0
+    evictions: int = 0
+
+    def as_dict(self):
+        """Get the counters as a dict."""
+        return asdict(self)
+
+
+class DekAeadCache(TTLCache[t.Any, "Aead"]):
+    """A thread-safe TTL cache of DEK AEAD primitives with metrics."""
+
+    def __init__(
+        self,
+        maxsize: float,
+        ttl: float,
+        negative_ttl: float = 30,
+        **kwargs,
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl, **kwargs)
+        self.metrics = DekAeadCacheMetrics()
+        self.failures: TTLCache[t.Any, Exception] = TTLCache(
+            maxsize=maxsize, ttl=negative_ttl
+        )
+        self.lock = threading.RLock()
+        self.key_locks: t.Dict[t.Any, threading.Lock] = {}
+
+    def popitem(self):
+        # Called when the cache is full.
+        item = super().popitem()
+        self.metrics.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self.metrics.evictions += len(expired)
+        return expired
+
+    def invalidate(self, key):
+        """Remove a key's primitive and any failure to load it."""
+        with self.lock:
+            self.pop(key, None)
+            self.failures.pop(key, None)
+
+    def _get(self, key):
+        """Get a key's primitive or raise the failure to load it.
+
+        Must be called while holding the lock.
+        """
+        # Each lookup freezes the timer, so a key can't expire mid-lookup.
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return True, value
+        failure = self.failures.get(key)
+        if failure is not None:
+            self.metrics.negative_hits += 1
+            # Raise a copy so that callers don't share (and extend the
+            # traceback of) the cached failure.
+            raise copy(failure).with_traceback(None) from failure
+
+        return False, None
+
+    def get_or_load(self, key, load: t.Callable[[], "Aead"]):
+        """Get a key's primitive, loading it if it's not cached.
+
+        Concurrent misses for the same key are coalesced so that only one of
+        them calls `load`. If loading fails, the failure is cached and raised
+        for all accesses to the key until the negative TTL expires.
+
+        Args:
+            key: The key of the primitive, such as the model's primary key.
+            load: Loads the primitive, such as by unwrapping the DEK.
+
+        Returns:
+            The primitive.
+        """
+        with self.lock:
+            found, value = self._get(key)
+            if found:
+                self.metrics.hits += 1
+                return t.cast("Aead", value)
+
+            self.metrics.misses += 1
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            try:
+                # Another thread may have loaded the key while this one waited.
+                with self.lock:
+                    found, value = self._get(key)
+                if found:
+                    return t.cast("Aead", value)
+
+                try:
+                    value = load()
+                except Exception as error:
+                    with self.lock:
+                        self.metrics.load_failures += 1
+                        self.failures[key] = error
+                    raise
+
+                with self.lock:
+                    self.metrics.loads += 1
+                    self[key] = value
+
+                return value
+            finally:
+                with self.lock:
+                    self.key_locks.pop(key, None)
+
+    def get_or_load_many(
+        self,
+        keys: t.Iterable[t.Any],
+        load_many: t.Callable[[t.List[t.Any]], t.Dict[t.Any, "Aead"]],
+    ):
+        """Get many keys' primitives, loading those which are not cached.
+
+        The keys which no other thread is loading are loaded together with one
+        call to `load_many`. The keys which another thread is already loading
+        are waited for instead, like in `get_or_load`. If loading fails, the
+        failure is cached for each key that was being loaded.
+
+        Args:
+            keys: The keys of the primitives, such as the models' primary keys.
+            load_many: Loads the primitives of many keys, such as by unwrapping
+                the DEKs together.
+
+        Returns:
+            The primitives by key.
+        """
+        values: t.Dict[t.Any, "Aead"] = {}
+        claimed_keys: t.Dict[t.Any, threading.Lock] = {}
+        waited_keys: t.Dict[t.Any, threading.Lock] = {}
+        with self.lock:
+            for key in set(keys):
+                found, value = self._get(key)
+                if found:
+                    self.metrics.hits += 1
+                    values[key] = t.cast("Aead", value)
+                    continue
+
+                self.metrics.misses += 1
+                key_lock = self.key_locks.get(key)
+                if key_lock is None:
+                    key_lock = threading.Lock()
+                    key_lock.acquire()  # pylint: disable=consider-using-with
+                    self.key_locks[key] = key_lock
+                    claimed_keys[key] = key_lock
+                else:
+                    waited_keys[key] = key_lock
+
+        if claimed_keys:
+            try:
+                try:
+                    loaded_values = load_many(list(claimed_keys))
+                except Exception as error:
+                    with self.lock:
+                        self.metrics.load_failures += len(claimed_keys)
+                        for key in claimed_keys:
+                            self.failures[key] = error
+                    raise
+
+                with self.lock:
+                    self.metrics.loads += len(loaded_values)
+                    for key, value in loaded_values.items():
+                        self.failures.pop(key, None)
+                        self[key] = value
+                values.update(loaded_values)
+            finally:
+                with self.lock:
+                    for key, key_lock in claimed_keys.items():
+                        self.key_locks.pop(key, None)
+                        key_lock.release()
+
+        for key, key_lock in waited_keys.items():
+            # Wait for the other thread to finish loading the key.
+            with key_lock:
+                pass
+
+            with self.lock:
+                found, value = self._get(key)
+            values[key] = (
+                t.cast("Aead", value)
+                if found
+                # The other thread's value was already evicted.
+                else self.get_or_load(
+                    key, lambda key=key: load_many([key])[key]
+                )
+            )
+
+        return values
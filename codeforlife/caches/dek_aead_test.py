@@ -0,0 +1,162 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 10:12:37(+01:00).
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from ..encryption import FakeAead
+from ..tests import TestCase
+from .dek_aead import DekAeadCache
+
+# pylint: disable=missing-class-docstring
+
+
+class TestDekAeadCache(TestCase):
+    def setUp(self):
+        self.cache = DekAeadCache(maxsize=2, ttl=60, negative_ttl=60)
+
+    def test_get_or_load__miss(self):
+        """Loads and caches the primitive on a miss."""
+        dek_aead = FakeAead()
+        load = MagicMock(return_value=dek_aead)
+
+        assert self.cache.get_or_load(1, load) is dek_aead
+        load.assert_called_once_with()
+        assert self.cache[1] is dek_aead
+        assert self.cache.metrics.misses == 1
+        assert self.cache.metrics.loads == 1
+
+    def test_get_or_load__hit(self):
+        """Returns the cached primitive on a hit."""
+        dek_aead = FakeAead()
+        self.cache[1] = dek_aead
+        load = MagicMock()
+
+        assert self.cache.get_or_load(1, load) is dek_aead
+        load.assert_not_called()
+        assert self.cache.metrics.hits == 1
+
+    def test_get_or_load__negative(self):
+        """Caches a failure to load and raises it until invalidated."""
+        error = ValueError("Cannot unwrap DEK.")
+        load = MagicMock(side_effect=error)
+
+        with self.assertRaises(ValueError) as context:
+            self.cache.get_or_load(1, load)
+        assert context.exception is error
+
+        for _ in range(2):
+            with self.assertRaises(ValueError) as context:
+                self.cache.get_or_load(1, load)
+            assert context.exception is not error
+            assert context.exception.__cause__ is error
+            assert context.exception.args == error.args
+
+        load.assert_called_once_with()
+        assert self.cache.metrics.load_failures == 1
+        assert self.cache.metrics.negative_hits == 2
+
+        self.cache.invalidate(1)
+        load.side_effect = None
+        load.return_value = FakeAead()
+        assert self.cache.get_or_load(1, load) is load.return_value
+
+    def test_get_or_load__coalesced(self):
+        """Concurrent misses for the same key only load once."""
+        loading, release = threading.Event(), threading.Event()
+        dek_aead = FakeAead()
+
+        def load():
+            loading.set()
+            release.wait(timeout=5)
+            return dek_aead
+
+        load_mock = MagicMock(side_effect=load)
+        results = []
+
+        def get():
+            results.append(self.cache.get_or_load(1, load_mock))
+
+        threads = [threading.Thread(target=get) for _ in range(4)]
+        threads[0].start()
+        loading.wait(timeout=5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        load_mock.assert_called_once_with()
+        assert results == [dek_aead] * 4
+        assert not self.cache.key_locks
+
+    def test_get_or_load_many(self):
+        """Loads the misses together and returns the hits as they are."""
+        cached_dek_aead, dek_aead = FakeAead(), FakeAead()
+        self.cache[1] = cached_dek_aead
+        load_many = MagicMock(return_value={2: dek_aead})
+
+        assert self.cache.get_or_load_many([1, 2], load_many) == {
+            1: cached_dek_aead,
+            2: dek_aead,
+        }
+        load_many.assert_called_once_with([2])
+        assert self.cache[2] is dek_aead
+        assert self.cache.metrics.hits == 1
+        assert self.cache.metrics.misses == 1
+        assert not self.cache.key_locks
+
+    def test_get_or_load_many__negative(self):
+        """Caches a failure to load for each key being loaded."""
+        load_many = MagicMock(side_effect=ValueError("Cannot unwrap DEK."))
+
+        with self.assertRaises(ValueError):
+            self.cache.get_or_load_many([1, 2], load_many)
+        with self.assertRaises(ValueError):
+            self.cache.get_or_load(2, MagicMock())
+
+        assert self.cache.metrics.load_failures == 2
+        assert self.cache.metrics.negative_hits == 1
+        assert not self.cache.key_locks
+
+    def test_get_or_load_many__coalesced(self):
+        """Waits for the keys another thread is already loading."""
+        loading, release = threading.Event(), threading.Event()
+        dek_aead = FakeAead()
+
+        def load():
+            loading.set()
+            release.wait(timeout=5)
+            return dek_aead
+
+        load_many = MagicMock(
+            side_effect=lambda keys: {key: FakeAead() for key in keys}
+        )
+        thread = threading.Thread(target=self.cache.get_or_load, args=(1, load))
+        thread.start()
+        loading.wait(timeout=5)
+
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(
+                self.cache.get_or_load_many([1, 2], load_many)
+            )
+        )
+        waiter.start()
+        release.set()
+        thread.join(timeout=5)
+        waiter.join(timeout=5)
+
+        load_many.assert_called_once_with([2])
+        assert results[0][1] is dek_aead
+        assert not self.cache.key_locks
+
+    def test_evictions(self):
+        """Counts the primitives evicted when the cache is full."""
+        for key in range(3):
+            self.cache[key] = FakeAead()
+
+        assert self.cache.metrics.evictions == 1
+        assert 0 not in self.cache
@@ -0,0 +1,206 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 14:48:03(+01:00).
+
+An in-process tier which sits in front of the shared (Redis) cache. Reading a
+hot value from the process's memory takes microseconds instead of a network
+round trip.
+
+When a process sets or deletes a key in the shared cache, it publishes an
+invalidation over Redis pub/sub. Every other process listens on a background
+thread and drops the key from its in-process tier. Values also expire from the
+in-process tier after a short timeout, which bounds how long a value can be
+stale if an invalidation is missed (e.g. while reconnecting to Redis).
+
+If the shared cache is not Redis (e.g. in tests), invalidations are not
+published and the timeout alone bounds staleness.
+
+Values are returned from the in-process tier as they are, without copying them,
+so they must not be mutated.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import typing as t
+from uuid import uuid4
+
+from cachetools import TTLCache
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.redis import RedisCache
+
+# The Redis pub/sub channel invalidations are published on.
+INVALIDATION_CHANNEL = "codeforlife.caches.invalidate"
+
+# How long to wait before resubscribing after losing the connection to Redis.
+RESUBSCRIBE_DELAY = 1
+
+# The key and version of a value.
+LocalCacheKey = t.Tuple[str, int]
+
+# Identifies this process so that it can ignore its own invalidations.
+_origin = uuid4().hex
+
+# The in-process tiers in this process.
+_local_caches: "t.List[LocalCache]" = []
+# The subscriber thread and the ID of the process that started it.
+_subscriber: t.Optional[t.Tuple[int, threading.Thread]] = None
+_subscriber_lock = threading.Lock()
+
+
+def _reset_subscriber():
+    """Forget the parent's subscriber and values in a forked child."""
+    # pylint: disable-next=global-statement
+    global _origin, _subscriber, _subscriber_lock
+    _origin = uuid4().hex
+    _subscriber = None
+    # The lock may have been held by another of the parent's threads.
+    _subscriber_lock = threading.Lock()
+    for local_cache in _local_caches:
+        local_cache.reset()
+
+
+os.register_at_fork(after_in_child=_reset_subscriber)
+
+
+def _get_redis_client():
+    """Get a client of the shared cache if it's Redis."""
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    if not isinstance(backend, RedisCache):
+        return None
+
+    # pylint: disable-next=protected-access
+    return backend._cache.get_client(write=True)
+
+
+def _resolve_version(version: t.Optional[int]) -> int:
+    """Resolve the shared cache's default version."""
+    return caches[DEFAULT_CACHE_ALIAS].version if version is None else version
+
+
+def handle_invalidation(message: bytes):
+    """Drop the invalidated keys from every in-process tier.
+
+    Args:
+        message: The invalidation published by another process.
+    """
+    invalidation = json.loads(message)
+    if invalidation["origin"] == _origin:
+        return
+
+    for local_cache in _local_caches:
+        local_cache.delete_many(invalidation["keys"], invalidation["version"])
+
+
+def _subscribe():
+    """Listen for invalidations until the process exits."""
+    while True:
+        try:
+            client = _get_redis_client()
+            if client is None:
+                return
+
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            for message in pubsub.listen():
+                handle_invalidation(message["data"])
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.exception("Lost the subscription to cache invalidations.")
+
+        # Invalidations may have been missed while not subscribed.
+        for local_cache in _local_caches:
+            local_cache.clear()
+
+        time.sleep(RESUBSCRIBE_DELAY)
+
+
+def ensure_subscribed():
+    """Start listening for invalidations if this process isn't already."""
+    global _subscriber  # pylint: disable=global-statement
+    if _subscriber is not None and _subscriber[0] == os.getpid():
+        return
+
+    with _subscriber_lock:
+        if _subscriber is None or _subscriber[0] != os.getpid():
+            thread = threading.Thread(
+                target=_subscribe,
+                name="cache-invalidation-subscriber",
+                daemon=True,
+            )
+            thread.start()
+            _subscriber = (os.getpid(), thread)
+
+
+def publish_invalidation(keys: t.List[str], version: t.Optional[int]):
+    """Tell the other processes to drop keys from their in-process tiers.
+
+    Args:
+        keys: The keys in the shared cache which were set or deleted.
+        version: The keys' version.
+    """
+    client = _get_redis_client()
+    if client is None:
+        return
+
+    client.publish(
+        INVALIDATION_CHANNEL,
+        json.dumps(
+            {
+                "origin": _origin,
+                "keys": keys,
+                "version": _resolve_version(version),
+            }
+        ),
+    )
+
+
+class LocalCache:
+    """A thread-safe, bounded TTL cache in the process's memory."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.values: TTLCache[LocalCacheKey, t.Any] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        _local_caches.append(self)
+
+    def reset(self):
+        """Replace the lock and values, such as after a fork."""
+        self.lock = threading.Lock()
+        self.values = TTLCache(maxsize=self.maxsize, ttl=self.ttl)
+
+    def clear(self):
+        """Drop all values."""
+        with self.lock:
+            self.values.clear()
+
+    def get_many(self, keys: t.Iterable[str], version: t.Optional[int]):
+        """Get the values of many keys. Uncached keys are left out."""
+        ensure_subscribed()
+
+        version = _resolve_version(version)
+        values: t.Dict[str, t.Any] = {}
+        with self.lock:
+            for key in keys:
+                if (key, version) in self.values:
+                    values[key] = self.values[(key, version)]
+
+        return values
+
+    def set_many(self, data: t.Dict[str, t.Any], version: t.Optional[int]):
+        """Set the values of many keys."""
+        version = _resolve_version(version)
+        with self.lock:
+            for key, value in data.items():
+                self.values[(key, version)] = value
+
+    def delete_many(self, keys: t.Iterable[str], version: t.Optional[int]):
+        """Drop the values of many keys, if they're cached."""
+        version = _resolve_version(version)
+        with self.lock:
+            for key in keys:
+                self.values.pop((key, version), None)
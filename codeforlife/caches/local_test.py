@@ -0,0 +1,124 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 14:48:03(+01:00).
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..tests import TestCase
+from . import local
+from .base_dynamic_key import BaseDynamicKeyCache
+
+# pylint: disable=missing-class-docstring
+
+
+class ExampleCache(BaseDynamicKeyCache[int, int]):
+    local_maxsize = 10
+
+    @staticmethod
+    def make_key(key):
+        return f"{key}.example.local"
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class TestLocalCache(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache = ExampleCache.get_local_cache()
+        assert local_cache
+        local_cache.clear()
+
+    def test_get(self):
+        """Values are read from the process's memory after the first read."""
+        cache.set("1.example.local", 1)
+
+        with patch.object(cache, "get", wraps=cache.get) as get:
+            assert ExampleCache.get(1) == 1
+            assert ExampleCache.get(1) == 1
+            get.assert_called_once()
+
+    def test_get__missing(self):
+        """Missing values are not kept in the process's memory."""
+        with patch.object(cache, "get", wraps=cache.get) as get:
+            assert ExampleCache.get(1, default=0) == 0
+            assert ExampleCache.get(1) is None
+            assert get.call_count == 2
+
+    def test_get_many(self):
+        """Only the values missing from the process's memory are fetched."""
+        ExampleCache.set(1, 1)
+        cache.set("2.example.local", 2)
+
+        with patch.object(cache, "get_many", wraps=cache.get_many) as get_many:
+            assert ExampleCache.get_many([1, 2, 3]) == {1: 1, 2: 2}
+            get_many.assert_called_once_with(
+                keys=["2.example.local", "3.example.local"], version=None
+            )
+
+    def test_set__publish_invalidation(self):
+        """Setting a value tells the other processes to drop it."""
+        client = MagicMock()
+        with patch.object(local, "_get_redis_client", return_value=client):
+            ExampleCache.set(1, 1)
+
+        client.publish.assert_called_once()
+        channel, message = client.publish.call_args.args
+        assert channel == local.INVALIDATION_CHANNEL
+        assert json.loads(message)["keys"] == ["1.example.local"]
+
+        # The value is kept in this process's memory.
+        with patch.object(cache, "get") as get:
+            assert ExampleCache.get(1) == 1
+            get.assert_not_called()
+
+    def test_handle_invalidation(self):
+        """Values invalidated by other processes are dropped."""
+        ExampleCache.set(1, 1)
+        cache.set("1.example.local", 2)
+
+        local.handle_invalidation(
+            json.dumps(
+                {
+                    "origin": "another-process",
+                    "keys": ["1.example.local"],
+                    "version": cache.version,
+                }
+            ).encode()
+        )
+
+        assert ExampleCache.get(1) == 2
+
+    def test_handle_invalidation__own(self):
+        """Values invalidated by this process are kept."""
+        ExampleCache.set(1, 1)
+
+        local.handle_invalidation(
+            json.dumps(
+                {
+                    "origin": local._origin,  # pylint: disable=protected-access
+                    "keys": ["1.example.local"],
+                    "version": cache.version,
+                }
+            ).encode()
+        )
+
+        with patch.object(cache, "get") as get:
+            assert ExampleCache.get(1) == 1
+            get.assert_not_called()
+
+    def test_delete(self):
+        """Deleting a value drops it from the process's memory."""
+        ExampleCache.set(1, 1)
+        ExampleCache.delete(1)
+
+        assert ExampleCache.get(1) is None
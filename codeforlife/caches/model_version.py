@@ -0,0 +1,93 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 20:31:48(+01:00).
+
+The versions of models' rows, used to tell if responses built from the rows
+have changed without querying them.
+
+Each tracked model has a version which is replaced with a new one whenever a
+row of the model is saved or deleted (see `codeforlife.models.signals.version`).
+Saves and deletes which don't send signals (e.g. `QuerySet.update`, raw SQL
+and writes by other services) don't replace the version, so versions also
+expire after a few minutes to bound how long a missed change can go unnoticed.
+"""
+
+import logging
+import typing as t
+from uuid import uuid4
+
+from django.db.models import Model
+
+from .base_dynamic_key import BaseDynamicKeyCache
+
+# A version's random token.
+ModelVersion = str
+
+
+def _get_label(model: t.Type[Model]):
+    # pylint: disable-next=protected-access
+    return t.cast(t.Type[Model], model._meta.concrete_model)._meta.label_lower
+
+
+class ModelVersionCache(BaseDynamicKeyCache[t.Type[Model], ModelVersion]):
+    """The version of each tracked model."""
+
+    timeout = 60 * 5
+
+    # Versions are read on every conditional request.
+    local_maxsize = 1024
+    local_timeout = 1
+
+    # The labels of the tracked models.
+    tracked: t.Set[str] = set()
+
+    @staticmethod
+    def make_key(key):
+        return f"model_version.{_get_label(key)}"
+
+    @classmethod
+    def track(cls, *models: t.Type[Model]):
+        """Start replacing the models' versions when their rows change."""
+        cls.tracked.update(_get_label(model) for model in models)
+
+    @classmethod
+    def is_tracked(cls, model: t.Type[Model]):
+        """Check if a model's version is replaced when its rows change."""
+        return _get_label(model) in cls.tracked
+
+    @classmethod
+    def bump(cls, *models: t.Type[Model]):
+        """Replace the models' versions, failing silently."""
+        try:
+            cls.set_many({model: uuid4().hex for model in models})
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.exception("Failed to bump model versions.")
+
+    @classmethod
+    def get_versions(cls, models: t.Iterable[t.Type[Model]]):
+        """Get the models' versions, creating those which don't exist.
+
+        Versions are created with `add` so that a version which was created or
+        bumped by another process since it was read is never overwritten.
+
+        Args:
+            models: The models to get the versions of.
+
+        Returns:
+            The version of each model or, if the cache failed, None.
+        """
+        models = list(models)
+        try:
+            versions = cls.get_many(models)
+            for model in models:
+                if model not in versions:
+                    version = uuid4().hex
+                    if not cls.add(model, version):
+                        # Another process created the version first.
+                        version = cls.get(model, default=version)
+                    versions[model] = t.cast(ModelVersion, version)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.exception("Failed to get model versions.")
+            return None
+
+        return versions
@@ -0,0 +1,88 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 20:31:48(+01:00).
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..tests import TestCase
+from ..user.models import Class, Student, StudentUser, User
+from .model_version import ModelVersionCache
+
+# pylint: disable=missing-class-docstring
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class TestModelVersionCache(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        cache.clear()
+        local_cache = ModelVersionCache.get_local_cache()
+        assert local_cache
+        local_cache.clear()
+
+    def test_make_key(self):
+        """Proxies share the version of their concrete model."""
+        assert ModelVersionCache.make_key(StudentUser) == (
+            ModelVersionCache.make_key(User)
+        )
+
+    def test_get_versions(self):
+        """Versions are created the first time they're read."""
+        versions = ModelVersionCache.get_versions([User, Class])
+        assert versions is not None
+        assert set(versions) == {User, Class}
+        assert ModelVersionCache.get_versions([User, Class]) == versions
+
+    def test_get_versions__concurrent(self):
+        """A version created by another process isn't overwritten."""
+        ModelVersionCache.set(User, "other-version")
+
+        with patch.object(ModelVersionCache, "get_many", return_value={}):
+            assert ModelVersionCache.get_versions([User]) == {
+                User: "other-version"
+            }
+
+        assert ModelVersionCache.get(User) == "other-version"
+
+    def test_get_versions__error(self):
+        """Cache errors are swallowed."""
+        with patch.object(cache, "get_many", side_effect=ConnectionError):
+            assert ModelVersionCache.get_versions([User]) is None
+
+    def test_bump__on_save(self):
+        """Saving a row of a tracked model replaces its version on commit."""
+        ModelVersionCache.track(Class)
+        versions = ModelVersionCache.get_versions([Class, Student])
+        assert versions is not None
+
+        klass = Class.objects.first()
+        assert klass
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            klass.save()
+        assert len(callbacks) == 1
+
+        new_versions = ModelVersionCache.get_versions([Class, Student])
+        assert new_versions is not None
+        assert new_versions[Class] != versions[Class]
+        assert new_versions[Student] == versions[Student]
+
+    def test_bump__untracked(self):
+        """Saving a row of an untracked model doesn't replace any version."""
+        with patch.object(ModelVersionCache, "tracked", set()):
+            klass = Class.objects.first()
+            assert klass
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                klass.save()
+
+        assert not callbacks
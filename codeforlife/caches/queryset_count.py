@@ -0,0 +1,23 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 19:08:44(+01:00).
+"""
+
+from hashlib import sha256
+
+from django.db.models.query import QuerySet
+
+from .base_dynamic_key import BaseDynamicKeyCache
+
+
+class QuerySetCountCache(BaseDynamicKeyCache[QuerySet, int]):
+    """Caches the number of rows a queryset's query matches."""
+
+    timeout = 60
+
+    @staticmethod
+    def make_key(key):
+        sql, params = key.query.sql_with_params()
+        digest = sha256(repr((key.db, sql, params)).encode()).hexdigest()
+
+        return f"queryset_count.{digest}"
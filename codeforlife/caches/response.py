@@ -0,0 +1,22 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 20:31:48(+01:00).
+"""
+
+import typing as t
+
+from .base_dynamic_key import BaseDynamicKeyCache
+
+
+class ResponseCache(BaseDynamicKeyCache[str, t.Any]):
+    """
+    The data of responses by their ETag. As a response's ETag changes with the
+    versions of the models it was built from, changes to the models invalidate
+    the response.
+    """
+
+    timeout = 60
+
+    @staticmethod
+    def make_key(key):
+        return f"response.{key}"
@@ -24,16 +24,30 @@ For unit tests, where you might need to assert that encryption or decryption
 methods were called, both fake classes provide an `as_mock()` class method. This
 method returns a `MagicMock` instance of the class, allowing you to use mock
 assertions like `assert_called_once()`.
+
+Building the KEK's AEAD primitive creates a KMS client, so the primitive is
+built at most once per process and reused by every operation with the KEK. The
+primitive is never shared across a fork (e.g. gunicorn or celery workers), as
+the client's connections cannot be shared between processes. If an operation
+fails with a transient KMS error, the primitive is discarded and the operation
+is retried with a new primitive after a backoff. Each attempt is timed and
+reported through the `kek_operation_timed` signal.
 """
 
+import os
+import threading
+import time
 import typing as t
 from base64 import b64decode, b64encode
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
 from unittest.mock import MagicMock, create_autospec
 
 from django.conf import settings
+from django.dispatch import Signal
 from django.utils.crypto import get_random_string
+from google.api_core import exceptions as core_exceptions
 from tink import (  # type: ignore[import-untyped]
     BinaryKeysetReader,
     BinaryKeysetWriter,
@@ -47,6 +61,22 @@ from tink.integration import gcpkms  # type: ignore[import-untyped]
 # Shortcut to the real GcpKmsClient class.
 _GcpKmsClient = gcpkms.GcpKmsClient
 
+T = t.TypeVar("T")
+
+# Sent after each attempt of an operation with the KEK. The kwargs are the
+# operation's name, the attempt's duration in seconds, the attempt's number and
+# the error raised, if any.
+kek_operation_timed = Signal()
+
+# KMS errors which are worth retrying.
+TRANSIENT_KMS_ERRORS = (
+    core_exceptions.Aborted,
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.InternalServerError,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.TooManyRequests,
+)
+
 
 @dataclass
 class FakeAead:
@@ -113,10 +143,122 @@ class FakeGcpKmsClient:
         return mock
 
 
+# The process's KEK primitive and the ID of the process that built it.
+_kek_aead: t.Optional[t.Tuple[int, Aead]] = None
+_kek_aead_lock = threading.Lock()
+
+
+def _reset_kek_aead():
+    """Forget the parent's KEK primitive in a forked child."""
+    global _kek_aead, _kek_aead_lock  # pylint: disable=global-statement
+    _kek_aead = None
+    # The lock may have been held by another of the parent's threads.
+    _kek_aead_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_kek_aead)
+
+
+def invalidate_kek_aead():
+    """Discard the KEK primitive so the next operation builds a new one."""
+    global _kek_aead  # pylint: disable=global-statement
+    with _kek_aead_lock:
+        _kek_aead = None
+
+
 def _get_kek_aead():
-    """Get the AEAD primitive for the key encryption key (KEK)."""
-    return GcpKmsClient(key_uri=settings.GCP_KMS_KEY_URI).get_aead(
-        key_uri=settings.GCP_KMS_KEY_URI
+    """
+    Get the AEAD primitive for the key encryption key (KEK), building it at
+    most once per process.
+    """
+    global _kek_aead  # pylint: disable=global-statement
+    with _kek_aead_lock:
+        if _kek_aead is None or _kek_aead[0] != os.getpid():
+            _kek_aead = (
+                os.getpid(),
+                GcpKmsClient(key_uri=settings.GCP_KMS_KEY_URI).get_aead(
+                    key_uri=settings.GCP_KMS_KEY_URI
+                ),
+            )
+
+        return _kek_aead[1]
+
+
+def _is_transient_kms_error(error: BaseException):
+    """Check if an error, or an error it wraps, is a transient KMS error."""
+    errors: t.List[BaseException] = [error]
+    seen: t.Set[int] = set()
+    while errors:
+        error = errors.pop()
+        if id(error) in seen:
+            continue
+        seen.add(id(error))
+
+        if isinstance(error, TRANSIENT_KMS_ERRORS):
+            return True
+
+        # Tink wraps KMS errors in a TinkError.
+        errors += [
+            wrapped_error
+            for wrapped_error in (
+                *error.args,
+                error.__cause__,
+                error.__context__,
+            )
+            if isinstance(wrapped_error, BaseException)
+        ]
+
+    return False
+
+
+def _with_kek_aead(operation: str, func: t.Callable[[Aead], T]) -> T:
+    """Run an operation with the KEK primitive.
+
+    Transient KMS errors are retried with exponential backoff, with a new KEK
+    primitive for each retry.
+
+    Args:
+        operation: The name of the operation, for timing.
+        func: The operation, which receives the KEK primitive.
+
+    Returns:
+        The operation's result.
+    """
+    attempt = 1
+    while True:
+        error: t.Optional[Exception] = None
+        start = time.perf_counter()
+        try:
+            return func(_get_kek_aead())
+        except Exception as _error:  # pylint: disable=broad-exception-caught
+            error = _error
+            if attempt >= settings.GCP_KMS_MAX_ATTEMPTS or (
+                not _is_transient_kms_error(error)
+            ):
+                raise
+
+            invalidate_kek_aead()
+        finally:
+            kek_operation_timed.send(
+                sender=GcpKmsClient,
+                operation=operation,
+                duration=time.perf_counter() - start,
+                attempt=attempt,
+                error=error,
+            )
+
+        time.sleep(settings.GCP_KMS_RETRY_BACKOFF * 2 ** (attempt - 1))
+        attempt += 1
+
+
+def _read_dek_aead(dek: bytes) -> Aead:
+    """Decrypts a DEK with the KEK and returns its AEAD primitive."""
+    return _with_kek_aead(
+        "read_dek",
+        lambda kek_aead: read_keyset_handle(
+            keyset_reader=BinaryKeysetReader(dek),
+            master_key_aead=kek_aead,
+        ).primitive(Aead),
     )
 
 
@@ -129,13 +271,20 @@ def create_dek():
     if settings.ENV == "local":
         return FakeAead.encrypt(get_random_string(32).encode())
 
-    stream = BytesIO()
-    new_keyset_handle(key_template=aead_key_templates.AES256_GCM).write(
-        keyset_writer=BinaryKeysetWriter(stream),
-        master_key_primitive=_get_kek_aead(),
+    keyset_handle = new_keyset_handle(
+        key_template=aead_key_templates.AES256_GCM
     )
 
-    return stream.getvalue()
+    def write_keyset(kek_aead: Aead):
+        stream = BytesIO()
+        keyset_handle.write(
+            keyset_writer=BinaryKeysetWriter(stream),
+            master_key_primitive=kek_aead,
+        )
+
+        return stream.getvalue()
+
+    return _with_kek_aead("create_dek", write_keyset)
 
 
 def get_dek_aead(dek: bytes) -> Aead:
@@ -150,10 +299,33 @@ def get_dek_aead(dek: bytes) -> Aead:
     if settings.ENV == "local":
         return FakeAead()
 
-    return read_keyset_handle(
-        keyset_reader=BinaryKeysetReader(dek),
-        master_key_aead=_get_kek_aead(),
-    ).primitive(Aead)
+    return _read_dek_aead(dek)
+
+
+def get_dek_aeads(deks: t.Iterable[bytes]) -> t.Dict[bytes, Aead]:
+    """
+    Takes many encrypted DEKs, decrypts them with the KEK, and returns the AEAD
+    primitive of each DEK. The DEKs are decrypted concurrently on a bounded
+    thread pool.
+    """
+    # Remove duplicates while preserving order.
+    deks = list(dict.fromkeys(deks))
+    if not all(deks):
+        raise ValueError("The data encryption key (DEK) is missing.")
+
+    # In local environment, return the fake AEAD primitives.
+    if settings.ENV == "local":
+        return {dek: FakeAead() for dek in deks}
+
+    if not deks:
+        return {}
+
+    # Build the KEK primitive once before it's shared by the threads.
+    _get_kek_aead()
+    with ThreadPoolExecutor(
+        max_workers=min(len(deks), settings.GCP_KMS_MAX_WORKERS)
+    ) as executor:
+        return dict(zip(deks, executor.map(_read_dek_aead, deks)))
 
 
 # Ensure Tink AEAD is registered.
@@ -0,0 +1,146 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 11:02:48(+01:00).
+"""
+
+import os
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from django.test import override_settings
+from google.api_core.exceptions import DeadlineExceeded, ServiceUnavailable
+from tink import (  # type: ignore[import-untyped]
+    BinaryKeysetWriter,
+    TinkError,
+    new_keyset_handle,
+)
+from tink.aead import aead_key_templates  # type: ignore[import-untyped]
+
+from .encryption import (
+    FakeAead,
+    FakeGcpKmsClient,
+    create_dek,
+    get_dek_aead,
+    get_dek_aeads,
+    invalidate_kek_aead,
+    kek_operation_timed,
+)
+from .tests import TestCase
+
+# pylint: disable=missing-class-docstring
+
+
+@override_settings(ENV="test")
+class TestKekAead(TestCase):
+    def setUp(self):
+        invalidate_kek_aead()
+        self.addCleanup(invalidate_kek_aead)
+
+        self.kms_client = FakeGcpKmsClient.as_mock()
+        self.gcp_kms_client = self.patch(
+            "codeforlife.encryption.GcpKmsClient",
+            return_value=self.kms_client,
+        )
+
+    @staticmethod
+    def create_dek():
+        """Create a DEK wrapped with the fake KEK."""
+        stream = BytesIO()
+        new_keyset_handle(key_template=aead_key_templates.AES256_GCM).write(
+            keyset_writer=BinaryKeysetWriter(stream),
+            master_key_primitive=FakeAead(),
+        )
+
+        return stream.getvalue()
+
+    def test_get_dek_aeads(self):
+        """Unwraps many DEKs with one KEK primitive."""
+        deks = [self.create_dek() for _ in range(3)]
+
+        dek_aeads = get_dek_aeads(deks + deks[:1])
+
+        self.gcp_kms_client.assert_called_once()
+        self.kms_client.get_aead.assert_called_once()
+        kek_aead: MagicMock = self.kms_client.get_aead.return_value
+        assert kek_aead.decrypt.call_count == 3
+
+        assert list(dek_aeads) == deks
+        for dek_aead in dek_aeads.values():
+            ciphertext = dek_aead.encrypt(b"plaintext", b"associated_data")
+            assert dek_aead.decrypt(ciphertext, b"associated_data") == (
+                b"plaintext"
+            )
+
+    def test_get_dek_aeads__none(self):
+        """Does not get the KEK primitive when there are no DEKs."""
+        assert not get_dek_aeads([])
+        self.gcp_kms_client.assert_not_called()
+
+    def test_get_dek_aeads__missing(self):
+        """Cannot unwrap a missing DEK."""
+        with self.assertRaises(ValueError):
+            get_dek_aeads([self.create_dek(), b""])
+
+    @override_settings(ENV="local")
+    def test_get_dek_aeads__local(self):
+        """Returns fake primitives in the local environment."""
+        dek_aeads = get_dek_aeads([b"dek"])
+        assert isinstance(dek_aeads[b"dek"], FakeAead)
+        self.gcp_kms_client.assert_not_called()
+
+    def test_kek_aead__memoized(self):
+        """Builds the KEK primitive once per process."""
+        get_dek_aead(create_dek())
+        get_dek_aeads([self.create_dek()])
+        self.gcp_kms_client.assert_called_once()
+
+        # A forked child builds its own KEK primitive.
+        with self.patch_object(os, "getpid", return_value=-1):
+            get_dek_aead(self.create_dek())
+        assert self.gcp_kms_client.call_count == 2
+
+        invalidate_kek_aead()
+        get_dek_aead(self.create_dek())
+        assert self.gcp_kms_client.call_count == 3
+
+    @override_settings(GCP_KMS_MAX_ATTEMPTS=3, GCP_KMS_RETRY_BACKOFF=0.1)
+    def test_kek_aead__retry(self):
+        """Retries transient KMS errors with a new KEK primitive."""
+        sleep = self.patch("time.sleep")
+        kek_aead: MagicMock = self.kms_client.get_aead.return_value
+        errors = [
+            TinkError(ServiceUnavailable("KMS is unavailable.")),
+            TinkError(DeadlineExceeded("KMS timed out.")),
+        ]
+
+        def decrypt(*args, **kwargs):
+            if errors:
+                raise errors.pop(0)
+            return FakeAead.decrypt(*args, **kwargs)
+
+        kek_aead.decrypt.side_effect = decrypt
+        receiver = MagicMock()
+        kek_operation_timed.connect(receiver, weak=False)
+        self.addCleanup(kek_operation_timed.disconnect, receiver)
+
+        get_dek_aead(self.create_dek())
+
+        assert self.gcp_kms_client.call_count == 3
+        assert [call.args[0] for call in sleep.call_args_list] == [0.1, 0.2]
+        assert [
+            (call.kwargs["operation"], call.kwargs["attempt"])
+            for call in receiver.call_args_list
+        ] == [("read_dek", 1), ("read_dek", 2), ("read_dek", 3)]
+        assert receiver.call_args.kwargs["error"] is None
+
+    def test_kek_aead__not_transient(self):
+        """Does not retry errors which are not transient."""
+        sleep = self.patch("time.sleep")
+        kek_aead: MagicMock = self.kms_client.get_aead.return_value
+        kek_aead.decrypt.side_effect = TinkError("Decryption failed.")
+
+        with self.assertRaises(TinkError):
+            get_dek_aead(self.create_dek())
+
+        kek_aead.decrypt.assert_called_once()
+        sleep.assert_not_called()
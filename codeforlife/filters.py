@@ -3,6 +3,12 @@
 Created on 26/07/2024 at 11:26:14(+01:00).
 """
 
+import typing as t
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from django.db.models import Q
+from django.db.models.functions import Greatest
 from django.db.models.query import QuerySet
 
 # pylint: disable-next=line-too-long
@@ -11,6 +17,52 @@ from django_filters.rest_framework import (  # type: ignore[import-untyped] # is
 )
 
 
+AnyQuerySet = t.TypeVar("AnyQuerySet", bound=QuerySet)
+
+
+def search(queryset: AnyQuerySet, terms: t.Dict[str, str]) -> AnyQuerySet:
+    """Get the rows where any of the fields contain their search term.
+
+    On PostgreSQL, the searched columns have trigram indexes (see the user app's
+    migrations) which icontains uses instead of scanning the table. The rows are
+    also annotated with how similar their fields are to the search terms as
+    `search_rank`, and ordered by it, most similar first. Ties keep the
+    queryset's ordering, or the model's default ordering, and then the primary
+    key so that pages of results are stable.
+
+    On other databases (e.g. SQLite), the rows are only filtered.
+
+    Args:
+        queryset: The rows to search.
+        terms: The search term of each field.
+
+    Returns:
+        The matching rows.
+    """
+    q = Q()
+    for field, term in terms.items():
+        q |= Q(**{f"{field}__icontains": term})
+    queryset = queryset.filter(q)
+
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset
+
+    similarities = [
+        TrigramWordSimilarity(term, field) for field, term in terms.items()
+    ]
+    ordering = [
+        *(queryset.query.order_by or queryset.model._meta.ordering),
+        "pk",
+    ]
+    return queryset.annotate(
+        search_rank=(
+            Greatest(*similarities)
+            if len(similarities) > 1
+            else similarities[0]
+        )
+    ).order_by("-search_rank", *dict.fromkeys(ordering))
+
+
 class FilterSet(_FilterSet):
     """Base filter set all other filter sets must inherit."""
 
@@ -31,3 +83,20 @@ class FilterSet(_FilterSet):
             )
 
         return method
+
+    @staticmethod
+    def make_search_method(*fields: str):
+        """Make a class-method that searches fields for a value.
+
+        Args:
+            fields: The fields to search.
+
+        Returns:
+            A class-method.
+        """
+
+        # pylint: disable-next=unused-argument
+        def method(self: FilterSet, queryset: QuerySet, name: str, value: str):
+            return search(queryset, {field: value for field in fields})
+
+        return method
@@ -0,0 +1,61 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 19:37:52(+01:00).
+"""
+
+from unittest.mock import patch
+
+from django.db import connection
+
+from .filters import search
+from .tests import TestCase
+from .user.models import User
+
+# pylint: disable=missing-class-docstring
+
+
+class TestSearch(TestCase):
+    fixtures = ["school_1"]
+
+    def test_search(self):
+        """Gets the rows where any field contains its search term."""
+        user = User.objects.exclude(first_name="").order_by("pk").first()
+        assert user
+        term = user.first_name[1:].upper()
+
+        self.assertQuerySetEqual(
+            search(
+                User.objects.order_by("pk"),
+                {"first_name": term, "last_name": "no match"},
+            ),
+            User.objects.filter(first_name__icontains=term).order_by("pk"),
+        )
+
+    def test_search__postgresql(self):
+        """Ranks the rows by similarity on PostgreSQL."""
+        with patch.object(connection, "vendor", "postgresql"):
+            queryset = search(
+                User.objects.order_by("pk"),
+                {"first_name": "john", "last_name": "doe"},
+            )
+
+        assert "search_rank" in queryset.query.annotations
+        assert queryset.query.order_by == ("-search_rank", "pk")
+
+    def test_search__postgresql__ordering(self):
+        """Breaks ties by the queryset's ordering and then the primary key."""
+        with patch.object(connection, "vendor", "postgresql"):
+            queryset = search(
+                User.objects.order_by("last_name"), {"first_name": "john"}
+            )
+
+        assert queryset.query.order_by == ("-search_rank", "last_name", "pk")
+
+    def test_search__postgresql__default_ordering(self):
+        """Breaks ties by the model's default ordering without an ordering."""
+        with patch.object(connection, "vendor", "postgresql"), patch.object(
+            User._meta, "ordering", ["first_name"]
+        ):
+            queryset = search(User.objects.all(), {"first_name": "john"})
+
+        assert queryset.query.order_by == ("-search_rank", "first_name", "pk")
@@ -6,7 +6,9 @@ Created on 19/01/2024 at 15:20:45(+00:00).
 from .abstract_base_session import AbstractBaseSession
 from .abstract_base_user import AbstractBaseUser
 from .base import *
+from .base_cached_session_store import BaseCachedSessionStore
 from .base_data_encryption_key import BaseDataEncryptionKeyModel
 from .base_session_store import BaseSessionStore
 from .data_encryption_key import DataEncryptionKeyModel
 from .encrypted import EncryptedModel
+from .proxy import as_proxy
@@ -0,0 +1,163 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 16:41:27(+01:00).
+"""
+
+import logging
+import typing as t
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.backends.base import UpdateError
+from django.contrib.sessions.backends.cached_db import (
+    SessionStore as CachedDBStore,
+)
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+
+from .base_session_store import (
+    AnyAbstractBaseSession,
+    AnyAbstractBaseUser,
+    BaseSessionStore,
+)
+
+# The data of a session and when it expires in the database.
+CachedSession = t.Tuple[t.Dict[str, t.Any], datetime]
+
+
+class BaseCachedSessionStore(
+    BaseSessionStore[AnyAbstractBaseSession, AnyAbstractBaseUser],
+    CachedDBStore,
+):
+    """
+    A write-through cached variant of the base session store. Sessions are
+    loaded from the cache and only read from the database on a miss. Saves are
+    written to the database and then to the cache.
+
+    A session which was loaded already belonging to its user is saved with a
+    single UPDATE, instead of looking up the user's session first.
+
+    Each session is cached until it expires in the database, so that cached
+    sessions expire at the same time as the database's sessions.
+    """
+
+    cache_key_prefix = "codeforlife.sessions.cached_db"
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # The key and user of the session as last loaded or saved.
+        self._loaded: t.Optional[t.Tuple[str, t.Optional[int]]] = None
+        # The session last saved to the database.
+        self._saved: t.Optional[AnyAbstractBaseSession] = None
+
+    @property
+    def key_salt(self):
+        # Sign the data like the uncached stores so that either can decode it.
+        return "django.contrib.sessions.SessionStore"
+
+    @staticmethod
+    def get_user_id(data: t.Dict[str, t.Any]):
+        """Get the ID of the user a session's data belongs to, if any."""
+        try:
+            return int(data.get(SESSION_KEY))  # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            return None
+
+    def set_cached_session(self, data: t.Dict[str, t.Any], expiry: datetime):
+        """Cache this session's data until it expires."""
+        self._loaded = (self.session_key, self.get_user_id(data))
+        self.loaded_expire_date = expiry
+        try:
+            self._cache.set(
+                self.cache_key,
+                (data, expiry),
+                self.get_expiry_age(expiry=expiry),
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.exception("Failed to cache session.")
+
+    def load(self):
+        try:
+            cached_session: t.Optional[CachedSession] = self._cache.get(
+                self.cache_key
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            cached_session = None
+
+        if cached_session is None:
+            session = self._get_session_from_db()
+            if session is None:
+                return {}
+
+            data = self.decode(session.session_data)
+            self.set_cached_session(data, session.expire_date)
+
+            return data
+
+        data, expiry = cached_session
+        self._loaded = (self.session_key, self.get_user_id(data))
+        self.loaded_expire_date = expiry
+
+        return data
+
+    async def aload(self):
+        return await sync_to_async(self.load)()
+
+    def create_model_instance(self, data):
+        session = super().create_model_instance(data)
+        self._saved = session
+
+        return session
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+
+        data = self._get_session(no_load=must_create)
+        if not must_create and not self.must_save():
+            return None
+
+        user_id = self.get_user_id(data)
+        if (
+            not must_create
+            and user_id is not None
+            and self._loaded == (self.session_key, user_id)
+        ):
+            expire_date = t.cast(datetime, self.loaded_expire_date)
+            if settings.SESSION_TOUCH_THRESHOLD is not None:
+                expire_date = self.get_expiry_date()
+
+            # The session already belongs to the user so update it in place.
+            if not (
+                self.model.objects.filter(
+                    session_key=self.session_key, user_id=user_id
+                ).update(
+                    session_data=self.encode(data), expire_date=expire_date
+                )
+            ):
+                raise UpdateError
+
+            self.set_cached_session(data, expire_date)
+            return None
+
+        self._saved = None
+        DBStore.save(self, must_create)
+        session = t.cast(AnyAbstractBaseSession, self._saved)
+
+        if session.session_key == self.session_key:
+            self.set_cached_session(data, session.expire_date)
+        else:
+            # The user's existing session was saved instead of this one.
+            self._loaded = None
+            self._cache.delete_many(
+                [
+                    self.cache_key,
+                    self.cache_key_prefix + session.session_key,
+                ]
+            )
+
+        return None
+
+    async def asave(self, must_create=False):
+        return await sync_to_async(self.save)(must_create)
@@ -5,18 +5,20 @@ Created on 26/01/2026 at 10:32:18(+00:00).
 This abstract model brings the `EncryptedModel` and `DataEncryptionKeyField`
 together. It also implements the `dek_aead` property, which retrieves and caches
 the decrypted DEK's AEAD primitive for use in encryption/decryption operations.
+The cache is pluggable by setting `dek_aead_cache_class` on a subclass.
 """
 
 import typing as t
 
-from cachetools import TTLCache
 from django.core.exceptions import ValidationError
 
-from ..encryption import create_dek, get_dek_aead
+from ..caches import DekAeadCache
+from ..encryption import create_dek, get_dek_aead, get_dek_aeads
 from .encrypted import EncryptedModel
 
 if t.TYPE_CHECKING:
     from django_stubs_ext.db.models import TypedModelMeta
+    from tink.aead import Aead  # type: ignore[import]
 
     from .fields import DataEncryptionKeyField
 else:
@@ -27,16 +29,20 @@ class BaseDataEncryptionKeyModel(EncryptedModel):
     """Model to store and manage a data encryption key."""
 
     # Cache configuration for data encryption keys.
+    dek_aead_cache_class: t.Type[DekAeadCache] = DekAeadCache
     dek_aead_cache_maxsize: float = 1024
     dek_aead_cache_ttl: float = 900  # 15 minutes
+    dek_aead_cache_negative_ttl: float = 30
 
     # In-memory cache for the decrypted DEK AEAD primitive.
-    DEK_AEAD_CACHE: TTLCache
+    DEK_AEAD_CACHE: DekAeadCache
 
     def __init_subclass__(cls):
         super().__init_subclass__()
-        cls.DEK_AEAD_CACHE = TTLCache(
-            maxsize=cls.dek_aead_cache_maxsize, ttl=cls.dek_aead_cache_ttl
+        cls.DEK_AEAD_CACHE = cls.dek_aead_cache_class(
+            maxsize=cls.dek_aead_cache_maxsize,
+            ttl=cls.dek_aead_cache_ttl,
+            negative_ttl=cls.dek_aead_cache_negative_ttl,
         )
 
     # A class-level reference to the DataEncryptionKeyField instance.
@@ -62,17 +68,68 @@ class BaseDataEncryptionKeyModel(EncryptedModel):
         if self.DEK_FIELD is None:
             return None
 
-        # Check the cache for the DEK AEAD.
-        if self.pk in self.DEK_AEAD_CACHE:
-            return self.DEK_AEAD_CACHE[self.pk]
+        # Get the AEAD primitive for the data encryption key, unless cached.
+        dek = self.DEK_FIELD
+        return self.DEK_AEAD_CACHE.get_or_load(
+            self.pk, lambda: get_dek_aead(dek)
+        )
+
+    @classmethod
+    def get_dek_aeads(cls, instances):
+        if cls.DEK_FIELD is None:
+            return [instance.dek_aead for instance in instances]
+
+        saved_deks = {
+            instance.pk: t.cast(bytes, instance.DEK_FIELD)
+            for instance in instances
+            if instance.pk is not None
+        }
+        # New instances' DEKs are not cached as they have no primary key.
+        new_deks = [
+            t.cast(bytes, instance.DEK_FIELD)
+            for instance in instances
+            if instance.pk is None
+        ]
+        dek_aeads: t.Dict[bytes, "Aead"] = {}
+
+        def load_many(pks: t.List[t.Any]):
+            # Unwrap the new instances' DEKs together with the cache's misses.
+            dek_aeads.update(
+                get_dek_aeads(
+                    [saved_deks[pk] for pk in pks]
+                    + [dek for dek in new_deks if dek not in dek_aeads]
+                )
+            )
+            return {pk: dek_aeads[saved_deks[pk]] for pk in pks}
 
-        # Get the AEAD primitive for the data encryption key.
-        dek_aead = get_dek_aead(self.DEK_FIELD)
+        # Concurrent misses for the same instances are coalesced.
+        saved_dek_aeads = cls.DEK_AEAD_CACHE.get_or_load_many(
+            saved_deks, load_many
+        )
+        missing_new_deks = [dek for dek in new_deks if dek not in dek_aeads]
+        if missing_new_deks:
+            dek_aeads.update(get_dek_aeads(missing_new_deks))
+
+        return [
+            (
+                saved_dek_aeads[instance.pk]
+                if instance.pk is not None
+                else dek_aeads[t.cast(bytes, instance.DEK_FIELD)]
+            )
+            for instance in instances
+        ]
 
-        # Cache the DEK AEAD for future access.
-        self.DEK_AEAD_CACHE[self.pk] = dek_aead
+    @classmethod
+    def encrypt_instances(cls, instances, fields=None):
+        # Lazily create a new DEK for new instances in the same pass.
+        if cls.DEK_FIELD is not None:
+            for instance in instances:
+                if instance.pk is None and instance.DEK_FIELD is None:
+                    instance.__dict__[cls.DEK_FIELD.field.attname] = (
+                        create_dek()
+                    )
 
-        return dek_aead
+        super().encrypt_instances(instances, fields)
 
     def save(
         self,
@@ -83,7 +140,11 @@ class BaseDataEncryptionKeyModel(EncryptedModel):
         update_fields=None,
     ):
         # Lazily create a new DEK for new instances.
-        if self.pk is None and self.__class__.DEK_FIELD is not None:
+        if (
+            self.pk is None
+            and self.__class__.DEK_FIELD is not None
+            and self.DEK_FIELD is None
+        ):
             self.__dict__[self.__class__.DEK_FIELD.field.attname] = create_dek()
 
         return super().save(  # type: ignore[misc]
@@ -114,3 +114,53 @@ class TestDataEncryptionKeyModel(ModelTestCase[BaseDataEncryptionKeyModel]):
         )
 
         assert instance.dek is not None
+
+    @patch("codeforlife.models.base_data_encryption_key.get_dek_aeads")
+    def test_get_dek_aeads(self, get_dek_aeads_mock: MagicMock):
+        """Unwraps all uncached DEKs together and caches saved instances'."""
+        model_class = self.get_model_class()
+        cached_instance = model_class(pk=1)
+        cached_instance.set_dek_for_test()
+        saved_instance = model_class(pk=2)
+        saved_instance.set_dek_for_test()
+        new_instance = model_class()
+        new_instance.set_dek_for_test()
+
+        cached_dek_aead = FakeAead.as_mock()
+        model_class.DEK_AEAD_CACHE[cached_instance.pk] = cached_dek_aead
+        saved_dek_aead, new_dek_aead = FakeAead.as_mock(), FakeAead.as_mock()
+        get_dek_aeads_mock.return_value = {
+            saved_instance.dek: saved_dek_aead,
+            new_instance.dek: new_dek_aead,
+        }
+
+        dek_aeads = model_class.get_dek_aeads(
+            [cached_instance, saved_instance, new_instance]
+        )
+        assert dek_aeads == [cached_dek_aead, saved_dek_aead, new_dek_aead]
+
+        get_dek_aeads_mock.assert_called_once()
+        assert list(get_dek_aeads_mock.call_args.args[0]) == [
+            saved_instance.dek,
+            new_instance.dek,
+        ]
+        assert dict(model_class.DEK_AEAD_CACHE) == {
+            cached_instance.pk: cached_dek_aead,
+            saved_instance.pk: saved_dek_aead,
+        }
+
+    @patch(
+        "codeforlife.models.base_data_encryption_key.create_dek",
+        autospec=True,
+    )
+    def test_encrypt_instances__creates_dek(self, create_dek_mock: MagicMock):
+        """Creates a DEK for new instances without one."""
+        create_dek_mock.side_effect = create_dek
+        saved_instance = self.get_model_instance(pk=1, dek=None)
+        new_instance = self.get_model_instance()
+
+        self.get_model_class().encrypt_instances([saved_instance, new_instance])
+
+        create_dek_mock.assert_called_once_with()
+        assert saved_instance.dek is None
+        assert new_instance.dek is not None
@@ -4,10 +4,11 @@ Created on 06/11/2024 at 17:31:32(+00:00).
 """
 
 import typing as t
+from datetime import datetime
 
+from django.conf import settings
 from django.contrib.auth import SESSION_KEY
 from django.contrib.sessions.backends.db import SessionStore
-from django.utils import timezone
 
 from ..types import get_arg
 
@@ -33,8 +34,17 @@ class BaseSessionStore(
     """
     Base session store class to be inherited by all session store classes.
     https://docs.djangoproject.com/en/5.1/topics/http/sessions/#example
+
+    If SESSION_TOUCH_THRESHOLD is set, a session whose data is unchanged is
+    only saved to the database when it's about to expire. Saving the session
+    extends its expiry, so the session keeps sliding while it's in use.
     """
 
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # When the loaded session expires in the database.
+        self.loaded_expire_date: t.Optional[datetime] = None
+
     @classmethod
     def get_model_class(cls) -> t.Type[AnyAbstractBaseSession]:
         return get_arg(cls, 0)
@@ -44,6 +54,32 @@ class BaseSessionStore(
         """Get the user class."""
         return get_arg(cls, 1)
 
+    def _get_session_from_db(self):
+        session = super()._get_session_from_db()
+        self.loaded_expire_date = session.expire_date if session else None
+
+        return session
+
+    def must_save(self):
+        """Whether saving the session must write it to the database."""
+        touch_threshold: t.Optional[int] = settings.SESSION_TOUCH_THRESHOLD
+        return (
+            touch_threshold is None
+            or self.modified
+            or self.loaded_expire_date is None
+            or self.get_expiry_age(expiry=self.loaded_expire_date)
+            < touch_threshold
+        )
+
+    def save(self, must_create=False):
+        if not must_create and self.session_key is not None:
+            # Load the session to know when it expires.
+            self._get_session()
+            if not self.must_save():
+                return
+
+        super().save(must_create)
+
     def associate_session_to_user(
         self, session: AnyAbstractBaseSession, user_id: int
     ):
@@ -69,6 +105,11 @@ class BaseSessionStore(
             session = model_class.objects.get(
                 user_id=user_id,  # type: ignore[misc]
             )
+
+            # The user's expired session may not have been purged yet.
+            if session.is_expired:
+                session.delete()
+                raise model_class.DoesNotExist()
         except model_class.DoesNotExist:
             session = model_class.objects.get(session_key=self.session_key)
             self.associate_session_to_user(
@@ -76,16 +117,7 @@ class BaseSessionStore(
             )
 
         session.session_data = self.encode(data)
+        if settings.SESSION_TOUCH_THRESHOLD is not None:
+            session.expire_date = self.get_expiry_date()
 
         return session
-
-    @classmethod
-    def clear_expired(cls, user_id=None):
-        session_query = cls.get_model_class().objects.filter(
-            expire_date__lt=timezone.now()
-        )
-
-        if user_id is not None:
-            session_query = session_query.filter(user_id=user_id)
-
-        session_query.delete()
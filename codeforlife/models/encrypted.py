@@ -3,27 +3,36 @@
 Created on 19/01/2026 at 09:56:25(+00:00).
 
 This is the base class for any model that will contain encrypted fields. Its
-primary role is to override the default manager to disable bulk operations that
-could otherwise bypass the field-level encryption logic, potentially leading to
-data corruption or leaks. It also uses Django's `check` framework to validate
-the model's configuration.
+primary role is to override the default manager to disable or secure bulk
+operations that could otherwise bypass the field-level encryption logic,
+potentially leading to data corruption or leaks. It also uses Django's `check`
+framework to validate the model's configuration.
 
 A critical security measure in this architecture is the custom `Manager` within
-`EncryptedModel`. Standard Django bulk operations like `bulk_create()` and
+`EncryptedModel`. Standard Django bulk operations like `bulk_update()` and
 `update()` bypass the individual model's `save()` method and, by extension, our
-custom field's `pre_save` logic. If these methods were allowed, it would be
-possible to insert or update data without it being properly encrypted, or to
+custom field's `pre_save` logic. If these methods were allowed as is, it would
+be possible to insert or update data without it being properly encrypted, or to
 corrupt existing encrypted data.
 
-To prevent this, the `Manager` explicitly disables these operations by setting
-them to `None`. The `update()` method is given a special implementation that
-actively checks if any of the fields being updated are encrypted fields and
-raises a `ValidationError` if they are. This forces developers to fetch model
-instances and update their properties individually, ensuring the encryption
-logic is always triggered. Furthermore, the model's `check` framework includes a
-validation step to ensure that any subclass of `EncryptedModel` is using a
-manager that inherits from `EncryptedModel.Manager`, guaranteeing these security
-measures are always enforced.
+To prevent this, the `Manager` explicitly disables the operations that cannot be
+secured by setting them to `None`. The `update()` method is given a special
+implementation that actively checks if any of the fields being updated are
+encrypted fields and raises a `ValidationError` if they are. `bulk_create()` and
+`bulk_update()` are instead made encryption-aware by the custom `QuerySet`: the
+pending values of all instances are encrypted in one pass, with each DEK looked
+up only once, before a single multi-row INSERT or UPDATE is issued. Furthermore,
+the model's `check` framework includes a validation step to ensure that any
+subclass of `EncryptedModel` is using a manager that inherits from
+`EncryptedModel.Manager`, guaranteeing these security measures are always
+enforced.
+
+Reading many instances is the opposite problem. Each encrypted field decrypts
+itself lazily on first access, which means rendering a list of instances would
+look up each instance's DEK and decrypt each value one at a time. The custom
+`QuerySet` offers `with_decrypted()` and `decrypt()` to decrypt the encrypted
+fields of every fetched instance in one pass, looking up each DEK only once, and
+to cache the results on the instances before they are accessed.
 """
 
 import typing as t
@@ -32,6 +41,8 @@ from django.apps import apps
 from django.core import checks
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Value
+from django.db.models.query import ModelIterable
 
 from .base import Model
 
@@ -46,6 +57,9 @@ else:
 
 AnyEncryptedModel = t.TypeVar("AnyEncryptedModel", bound="EncryptedModel")
 
+# Distinguishes a missing decrypted value from a decrypted None.
+_MISSING = object()
+
 
 class EncryptedModel(Model):
     """Base for all models with encrypted fields."""
@@ -64,6 +78,133 @@ class EncryptedModel(Model):
         # Each subclass gets its own list of encrypted fields.
         cls.ENCRYPTED_FIELDS = []
 
+    class QuerySet(
+        models.QuerySet[AnyEncryptedModel], t.Generic[AnyEncryptedModel]
+    ):
+        """
+        Base query set for models with encrypted fields. Supports decrypting the
+        encrypted fields of all fetched instances in one pass.
+        """
+
+        # The names of the encrypted fields to decrypt once the query set is
+        # evaluated. None means nothing is decrypted in bulk.
+        _decrypted_field_names: t.Optional[t.List[str]] = None
+
+        def _clone(self):
+            clone = super()._clone()
+            # pylint: disable-next=protected-access
+            clone._decrypted_field_names = self._decrypted_field_names
+            return clone
+
+        def _fetch_all(self):
+            fetched = self._result_cache is not None
+            super()._fetch_all()
+
+            # Decrypt the instances only after they are first fetched.
+            if (
+                not fetched
+                and self._decrypted_field_names is not None
+                and issubclass(self._iterable_class, ModelIterable)
+            ):
+                self.model.decrypt_instances(
+                    t.cast(t.List[AnyEncryptedModel], self._result_cache),
+                    fields=self._decrypted_field_names,
+                )
+
+        def with_decrypted(self, fields: t.Optional[t.Iterable[str]] = None):
+            """Decrypt the encrypted fields of all instances in one pass when
+            the query set is evaluated.
+
+            Args:
+                fields: The names of the encrypted fields to decrypt. If not
+                    set, all encrypted fields are decrypted.
+
+            Returns:
+                A copy of the query set which decrypts when evaluated.
+            """
+            clone = self._chain()
+            # pylint: disable-next=protected-access
+            clone._decrypted_field_names = [
+                field.name for field in self.model.get_encrypted_fields(fields)
+            ]
+            return clone
+
+        def decrypt(self, fields: t.Optional[t.Iterable[str]] = None):
+            """Evaluate the query set and decrypt the encrypted fields of all
+            instances in one pass.
+
+            Args:
+                fields: The names of the encrypted fields to decrypt. If not
+                    set, all encrypted fields are decrypted.
+
+            Returns:
+                The instances with their decrypted values cached.
+            """
+            return list(self.with_decrypted(fields))
+
+        def bulk_create(self, objs, *args, **kwargs):
+            """
+            Encrypt the pending values of all instances in one pass before
+            inserting them.
+            """
+            objs = list(objs)
+            self.model.encrypt_instances(objs)
+
+            return super().bulk_create(objs, *args, **kwargs)
+
+        def bulk_update(self, objs, fields, batch_size=None):
+            """
+            Encrypt the pending values of all instances in one pass before
+            updating them.
+
+            Django's implementation reads each value with getattr(), which
+            returns the plaintext of an encrypted field. Therefore, while the
+            instances are being updated, their encrypted fields return their
+            ciphertexts as expressions, which Django writes as they are.
+            """
+            objs = tuple(objs)
+            encrypted_fields = [
+                field
+                for field in self.model.ENCRYPTED_FIELDS
+                if field.name in fields
+            ]
+            if not encrypted_fields or not objs:
+                return super().bulk_update(objs, fields, batch_size)
+
+            self.model.encrypt_instances(
+                objs, fields=[field.name for field in encrypted_fields]
+            )
+
+            # The decrypted values replaced by ciphertexts, to restore after.
+            decrypted_values: t.List[t.Tuple[EncryptedModel, str, t.Any]] = []
+            try:
+                for obj in objs:
+                    for field in encrypted_fields:
+                        ciphertext = field.pre_save(obj, add=False)
+                        if ciphertext is None:
+                            continue
+
+                        decrypted_values.append(
+                            (
+                                obj,
+                                field.attname,
+                                obj.__decrypted_values__.get(
+                                    field.attname, _MISSING
+                                ),
+                            )
+                        )
+                        obj.__decrypted_values__[field.attname] = Value(
+                            ciphertext, output_field=field
+                        )
+
+                return super().bulk_update(objs, fields, batch_size)
+            finally:
+                for obj, attname, value in decrypted_values:
+                    if value is _MISSING:
+                        obj.__decrypted_values__.pop(attname, None)
+                    else:
+                        obj.__decrypted_values__[attname] = value
+
     # pylint: disable-next=too-few-public-methods
     class Manager(
         models.Manager[AnyEncryptedModel], t.Generic[AnyEncryptedModel]
@@ -73,6 +214,19 @@ class EncryptedModel(Model):
         that would bypass field-level encryption.
         """
 
+        def get_queryset(self) -> "EncryptedModel.QuerySet[AnyEncryptedModel]":
+            return EncryptedModel.QuerySet(
+                model=self.model, using=self._db, hints=self._hints
+            )
+
+        def with_decrypted(self, fields: t.Optional[t.Iterable[str]] = None):
+            """Shortcut to 'get_queryset().with_decrypted(fields)'."""
+            return self.get_queryset().with_decrypted(fields)
+
+        def decrypt(self, fields: t.Optional[t.Iterable[str]] = None):
+            """Shortcut to 'get_queryset().decrypt(fields)'."""
+            return self.get_queryset().decrypt(fields)
+
         def update(self, **kwargs):
             """Ensure encrypted fields are not updated via 'update()'."""
             for name in kwargs:
@@ -90,10 +244,6 @@ class EncryptedModel(Model):
 
         # Disable bulk operations that would bypass field-level encryption.
         aupdate: t.Never = None  # type: ignore[assignment]
-        bulk_update: t.Never = None  # type: ignore[assignment]
-        abulk_update: t.Never = None  # type: ignore[assignment]
-        bulk_create: t.Never = None  # type: ignore[assignment]
-        abulk_create: t.Never = None  # type: ignore[assignment]
         in_bulk: t.Never = None  # type: ignore[assignment]
         ain_bulk: t.Never = None  # type: ignore[assignment]
 
@@ -197,3 +347,153 @@ class EncryptedModel(Model):
     def dek_aead(self) -> "Aead":
         """Gets the AEAD primitive for this model's DEK."""
         raise NotImplementedError()
+
+    @classmethod
+    def get_encrypted_fields(cls, names: t.Optional[t.Iterable[str]] = None):
+        """Get this model's encrypted fields by name.
+
+        Args:
+            names: The names of the encrypted fields. If not set, all encrypted
+                fields are returned.
+
+        Raises:
+            ValidationError: If a name is not an encrypted field's name.
+
+        Returns:
+            The encrypted fields.
+        """
+        if names is None:
+            return list(cls.ENCRYPTED_FIELDS)
+
+        fields: t.List["BaseEncryptedField"] = []
+        for name in names:
+            field = next(
+                (field for field in cls.ENCRYPTED_FIELDS if field.name == name),
+                None,
+            )
+            if field is None:
+                raise ValidationError(
+                    f"'{name}' is not an encrypted field on"
+                    f" {cls.__module__}.{cls.__name__}.",
+                    code="not_encrypted_field",
+                )
+
+            fields.append(field)
+
+        return fields
+
+    @classmethod
+    def get_dek_aeads(cls, instances: t.Sequence[t.Self]) -> t.List["Aead"]:
+        """Get the AEAD primitive for each instance's DEK.
+
+        Subclasses should override this to look up each distinct DEK only once
+        when many instances share the same DEK.
+
+        Args:
+            instances: The instances to get the DEK AEAD primitives for.
+
+        Returns:
+            The DEK AEAD primitives, in the same order as the instances.
+        """
+        return [instance.dek_aead for instance in instances]
+
+    @classmethod
+    def encrypt_instances(
+        cls,
+        instances: t.Sequence[t.Self],
+        fields: t.Optional[t.Iterable[str]] = None,
+    ):
+        """Encrypt the pending values of many instances in one pass.
+
+        The DEK AEAD primitives are looked up for all instances at once. Each
+        pending value is replaced with its ciphertext, so saving the instances
+        does not encrypt them again, and its plaintext is cached on the
+        instance.
+
+        Args:
+            instances: The instances to encrypt.
+            fields: The names of the encrypted fields to encrypt. If not set,
+                all encrypted fields are encrypted.
+        """
+        encrypted_fields = cls.get_encrypted_fields(fields)
+
+        # Collect the plaintexts pending encryption for each instance.
+        pending_instances: t.List[t.Self] = []
+        pending_plaintexts: t.List[
+            t.List[t.Tuple["BaseEncryptedField", t.Any]]
+        ] = []
+        for instance in instances:
+            plaintexts = [
+                (field, plaintext)
+                for field in encrypted_fields
+                if (plaintext := field.get_plaintext(instance)) is not None
+            ]
+            if plaintexts:
+                pending_instances.append(instance)
+                pending_plaintexts.append(plaintexts)
+
+        if not pending_instances:
+            return
+
+        # Encrypt all pending plaintexts and store them on their instance.
+        for instance, plaintexts, dek_aead in zip(
+            pending_instances,
+            pending_plaintexts,
+            cls.get_dek_aeads(pending_instances),
+        ):
+            for field, plaintext in plaintexts:
+                field.set_ciphertext(
+                    instance,
+                    ciphertext=field.encrypt_value(
+                        instance, plaintext, dek_aead
+                    ),
+                    plaintext=plaintext,
+                )
+
+    @classmethod
+    def decrypt_instances(
+        cls,
+        instances: t.Iterable[t.Self],
+        fields: t.Optional[t.Iterable[str]] = None,
+    ):
+        """Decrypt the encrypted fields of many instances in one pass.
+
+        The DEK AEAD primitives are looked up for all instances at once and the
+        decrypted values are cached on each instance, so accessing the fields
+        afterwards does not decrypt them again.
+
+        Args:
+            instances: The instances to decrypt.
+            fields: The names of the encrypted fields to decrypt. If not set,
+                all encrypted fields are decrypted.
+        """
+        encrypted_fields = cls.get_encrypted_fields(fields)
+
+        # Collect the ciphertexts pending decryption for each instance.
+        pending_instances: t.List[t.Self] = []
+        pending_ciphertexts: t.List[
+            t.List[t.Tuple["BaseEncryptedField", bytes]]
+        ] = []
+        for instance in instances:
+            ciphertexts = [
+                (field, ciphertext)
+                for field in encrypted_fields
+                if (ciphertext := field.get_ciphertext(instance)) is not None
+            ]
+            if ciphertexts:
+                pending_instances.append(instance)
+                pending_ciphertexts.append(ciphertexts)
+
+        if not pending_instances:
+            return
+
+        # Decrypt all pending ciphertexts and cache them on their instance.
+        for instance, ciphertexts, dek_aead in zip(
+            pending_instances,
+            pending_ciphertexts,
+            cls.get_dek_aeads(pending_instances),
+        ):
+            for field, ciphertext in ciphertexts:
+                instance.__decrypted_values__[field.attname] = (
+                    field.decrypt_value(instance, ciphertext, dek_aead)
+                )
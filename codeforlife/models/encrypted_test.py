@@ -4,13 +4,16 @@ Created on 19/01/2026 at 09:56:31(+00:00).
 """
 
 import typing as t
+from unittest.mock import PropertyMock, patch
 
 from django.db import models
 
+from ..encryption import FakeAead
 from ..tests import ModelTestCase
-from ..user.models import OtpBypassToken
+from ..user.models import OtpBypassToken, User
 from .encrypted import EncryptedModel
 from .fields import EncryptedTextField
+from .fields.base_encrypted import _TrustedCiphertext
 
 if t.TYPE_CHECKING:
     from django_stubs_ext.db.models import TypedModelMeta
@@ -31,7 +34,43 @@ class Person(EncryptedModel):
         app_label = "codeforlife.user"
 
 
+# pylint: disable-next=abstract-method
+class Contact(EncryptedModel):
+    associated_data = "contact"
+
+    email = EncryptedTextField(associated_data="email")
+    phone = EncryptedTextField(associated_data="phone")
+
+    dek_aead = FakeAead.as_mock()
+
+    class Meta(TypedModelMeta):
+        app_label = "codeforlife.user"
+
+    @classmethod
+    def from_plaintext(cls, **plaintexts: str):
+        """Create an instance as if its ciphertexts were loaded from the DB."""
+        instance = cls()
+        for field in cls.ENCRYPTED_FIELDS:
+            instance.__dict__[field.attname] = _TrustedCiphertext(
+                FakeAead.encrypt(
+                    field.value_to_bytes(plaintexts[field.name]),
+                    associated_data=field.full_associated_data,
+                )
+            )
+
+        return instance
+
+
 class TestEncryptedModel(ModelTestCase[EncryptedModel]):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        Contact.dek_aead.reset_mock()
+
+        user = User.objects.first()
+        assert user
+        self.user = user
+
     def test_objects___update__cannot_update(self):
         """Cannot update encrypted field via objects.update()."""
         with self.assert_raises_validation_error(code="cannot_update"):
@@ -41,21 +80,103 @@ class TestEncryptedModel(ModelTestCase[EncryptedModel]):
         """Cannot aupdate encrypted field via objects.aupdate()."""
         assert Person.objects.aupdate is None
 
-    def test_objects___bulk_update(self):
-        """Cannot bulk update encrypted field via objects.bulk_update()."""
-        assert Person.objects.bulk_update is None
-
-    def test_objects___abulk_update(self):
-        """Cannot abulk_update encrypted field via objects.abulk_update()."""
-        assert Person.objects.abulk_update is None
+    def _bulk_create_otp_bypass_tokens(self, *tokens: str):
+        return OtpBypassToken.objects.get_queryset().bulk_create(
+            [OtpBypassToken(user=self.user, token=token) for token in tokens]
+        )
+
+    def _assert_stored_otp_bypass_tokens(self, *tokens: str):
+        ciphertexts = OtpBypassToken.objects.order_by("id").values_list(
+            "token", flat=True
+        )
+        assert [
+            t.cast(_TrustedCiphertext, ciphertext).ciphertext
+            for ciphertext in ciphertexts
+        ] == [
+            FakeAead.encrypt(
+                token.encode(),
+                associated_data=OtpBypassToken.token.field.full_associated_data,
+            )
+            for token in tokens
+        ]
 
     def test_objects___bulk_create(self):
-        """Cannot bulk create encrypted field via objects.bulk_create()."""
-        assert Person.objects.bulk_create is None
+        """Encrypts pending values in one pass before bulk creating."""
+        OtpBypassToken.objects.all().delete()
+
+        dek_aead = self.patch_object(
+            OtpBypassToken, "dek_aead", new_callable=PropertyMock
+        )
+        dek_aead.return_value = FakeAead.as_mock()
 
-    def test_objects___abulk_create(self):
-        """Cannot abulk_create encrypted field via objects.abulk_create()."""
-        assert Person.objects.abulk_create is None
+        with self.assertNumQueries(1):
+            otp_bypass_tokens = self._bulk_create_otp_bypass_tokens(
+                "aaaaaaaa", "bbbbbbbb"
+            )
+
+        # The user's DEK was only looked up once.
+        dek_aead.assert_called_once_with()
+        token_field = OtpBypassToken.token.field
+        for otp_bypass_token in otp_bypass_tokens:
+            assert token_field.get_plaintext(otp_bypass_token) is None
+
+        self._assert_stored_otp_bypass_tokens("aaaaaaaa", "bbbbbbbb")
+
+    def test_objects___bulk_update(self):
+        """Encrypts pending values in one pass before bulk updating."""
+        OtpBypassToken.objects.all().delete()
+
+        dek_aead = self.patch_object(
+            OtpBypassToken, "dek_aead", new_callable=PropertyMock
+        )
+        dek_aead.return_value = FakeAead.as_mock()
+
+        self._bulk_create_otp_bypass_tokens("aaaaaaaa", "bbbbbbbb")
+        otp_bypass_tokens = list(OtpBypassToken.objects.order_by("id"))
+        otp_bypass_tokens[0].token = "cccccccc"
+        otp_bypass_tokens[1].token = "dddddddd"
+
+        with self.assertNumQueries(1):
+            rows_updated = OtpBypassToken.objects.bulk_update(
+                otp_bypass_tokens, fields=["token"]
+            )
+
+        assert rows_updated == 2
+        self._assert_stored_otp_bypass_tokens("cccccccc", "dddddddd")
+        assert [
+            otp_bypass_token.token for otp_bypass_token in otp_bypass_tokens
+        ] == ["cccccccc", "dddddddd"]
+
+    def test_objects___bulk_update__invalid(self):
+        """Rejects what Django's bulk update rejects."""
+        dek_aead = self.patch_object(
+            OtpBypassToken, "dek_aead", new_callable=PropertyMock
+        )
+        dek_aead.return_value = FakeAead.as_mock()
+
+        user = User.objects.first()
+        assert user
+        with self.assertRaises(ValueError):
+            OtpBypassToken.objects.bulk_update(
+                [OtpBypassToken(user=user, token="aaaaaaaa")], fields=["token"]
+            )
+
+        self._bulk_create_otp_bypass_tokens("aaaaaaaa")
+        otp_bypass_token = OtpBypassToken.objects.first()
+        assert otp_bypass_token
+        otp_bypass_token.token = "bbbbbbbb"
+        with self.assertRaises(ValueError):
+            OtpBypassToken.objects.bulk_update(
+                [otp_bypass_token], fields=["token", "id"]
+            )
+
+    def test_objects___bulk_update__not_encrypted_fields(self):
+        """Bulk updates as normal when no encrypted fields are updated."""
+        with patch.object(
+            models.QuerySet, "bulk_update", return_value=0
+        ) as bulk_update:
+            OtpBypassToken.objects.bulk_update([], fields=["user"])
+            bulk_update.assert_called_once_with((), ["user"], None)
 
     def test_objects__in_bulk(self):
         """Cannot in_bulk encrypted field via objects.in_bulk()."""
@@ -130,3 +251,92 @@ class TestEncryptedModel(ModelTestCase[EncryptedModel]):
                 app_label = "codeforlife.user"
 
         self.assert_check(error_id="encrypted.E005", model_class=E005)
+
+    def test_get_encrypted_fields(self):
+        """Gets all encrypted fields or only the named ones."""
+        email = Contact.ENCRYPTED_FIELDS[0]
+        self.assertListEqual(
+            Contact.get_encrypted_fields(), Contact.ENCRYPTED_FIELDS
+        )
+        self.assertListEqual(Contact.get_encrypted_fields(["email"]), [email])
+
+    def test_get_encrypted_fields__not_encrypted_field(self):
+        """Cannot get a field that is not encrypted."""
+        with self.assert_raises_validation_error(code="not_encrypted_field"):
+            Contact.get_encrypted_fields(["id"])
+
+    def test_decrypt_instances(self):
+        """Decrypts and caches the values of all instances in one pass."""
+        instances = [
+            Contact.from_plaintext(email=f"{i}@example.com", phone=str(i))
+            for i in range(3)
+        ]
+
+        with patch.object(
+            Contact, "get_dek_aeads", wraps=Contact.get_dek_aeads
+        ) as get_dek_aeads:
+            Contact.decrypt_instances(instances)
+            get_dek_aeads.assert_called_once_with(instances)
+
+        assert Contact.dek_aead.decrypt.call_count == 6
+        for i, instance in enumerate(instances):
+            self.assertDictEqual(
+                instance.__decrypted_values__,
+                {"email": f"{i}@example.com", "phone": str(i)},
+            )
+
+        # Accessing the fields does not decrypt them again.
+        Contact.dek_aead.decrypt.reset_mock()
+        assert [instance.email for instance in instances] == [
+            f"{i}@example.com" for i in range(3)
+        ]
+        Contact.dek_aead.decrypt.assert_not_called()
+
+    def test_decrypt_instances__fields(self):
+        """Decrypts only the named fields and skips cached values."""
+        cached = Contact.from_plaintext(email="cached", phone="1")
+        cached.__decrypted_values__["email"] = "cached"
+        pending = Contact.from_plaintext(email="pending", phone="2")
+
+        Contact.decrypt_instances([cached, pending], fields=["email"])
+
+        Contact.dek_aead.decrypt.assert_called_once()
+        self.assertDictEqual(cached.__decrypted_values__, {"email": "cached"})
+        self.assertDictEqual(pending.__decrypted_values__, {"email": "pending"})
+
+    def test_decrypt_instances__nothing_pending(self):
+        """Does not look up any DEKs when there is nothing to decrypt."""
+        instance = Contact(email="plaintext", phone=None)
+
+        with patch.object(Contact, "get_dek_aeads") as get_dek_aeads:
+            Contact.decrypt_instances([instance])
+            get_dek_aeads.assert_not_called()
+
+    def test_objects__with_decrypted(self):
+        """Decrypts all fetched instances when the query set is evaluated."""
+        instances = [Contact.from_plaintext(email="a", phone="1")]
+
+        def fetch_all(queryset: models.QuerySet):
+            queryset._result_cache = instances  # type: ignore[misc]
+
+        queryset = Contact.objects.with_decrypted(fields=["phone"]).filter(
+            id__gt=0
+        )
+        assert isinstance(queryset, EncryptedModel.QuerySet)
+
+        with patch.object(
+            models.QuerySet, "_fetch_all", autospec=True, side_effect=fetch_all
+        ), patch.object(
+            Contact, "decrypt_instances", wraps=Contact.decrypt_instances
+        ) as decrypt_instances:
+            assert list(queryset) == instances
+            decrypt_instances.assert_called_once_with(
+                instances, fields=["phone"]
+            )
+
+        self.assertDictEqual(instances[0].__decrypted_values__, {"phone": "1"})
+
+    def test_objects__with_decrypted__not_encrypted_field(self):
+        """Cannot decrypt a field that is not encrypted."""
+        with self.assert_raises_validation_error(code="not_encrypted_field"):
+            Contact.objects.with_decrypted(fields=["id"])
@@ -59,6 +59,9 @@ from ...types import Args, KwArgs
 from ..encrypted import EncryptedModel
 from .deferred_attribute import DeferredAttribute
 
+if t.TYPE_CHECKING:
+    from tink.aead import Aead  # type: ignore[import]
+
 T = t.TypeVar("T")
 
 
@@ -330,26 +333,76 @@ class BaseEncryptedField(BinaryField, t.Generic[T]):
         """Returns the fully qualified associated data for this field."""
         return f"{self.model.associated_data}:{self.associated_data}".encode()
 
+    def get_ciphertext(self, instance: EncryptedModel):
+        """
+        Gets the ciphertext stored on an instance if it has yet to be decrypted.
+        Returns None if there is nothing to decrypt.
+        """
+        if self.attname in instance.__decrypted_values__:
+            return None
+
+        value: t.Optional[Value[T]] = instance.__dict__.get(self.attname)
+        if isinstance(value, _TrustedCiphertext):
+            return value.ciphertext
+
+        return None
+
+    def get_plaintext(self, instance: EncryptedModel):
+        """
+        Gets the plaintext stored on an instance if it is pending encryption.
+        Returns None if there is nothing to encrypt.
+        """
+        value: t.Optional[Value[T]] = instance.__dict__.get(self.attname)
+        if isinstance(value, _PendingEncryption):
+            return t.cast(T, value.value)
+
+        return None
+
+    def set_ciphertext(
+        self, instance: EncryptedModel, ciphertext: bytes, plaintext: T
+    ):
+        """
+        Replaces the value pending encryption on an instance with its
+        ciphertext so it is not encrypted again on save. The plaintext is cached
+        on the instance so it does not need to be decrypted when accessed.
+        """
+        instance.__dict__[self.attname] = _TrustedCiphertext(ciphertext)
+        instance.__decrypted_values__[self.attname] = plaintext
+
     def decrypt_value(
-        self, instance: EncryptedModel, ciphertext: t.Optional[bytes]
+        self,
+        instance: EncryptedModel,
+        ciphertext: t.Optional[bytes],
+        dek_aead: t.Optional["Aead"] = None,
     ):
-        """Decrypts a single value using the DEK and associated data."""
+        """
+        Decrypts a single value using the DEK and associated data. The DEK's
+        AEAD primitive may be passed in if it was already looked up.
+        """
         if ciphertext is None:
             return None
 
-        data = instance.dek_aead.decrypt(
+        data = (dek_aead or instance.dek_aead).decrypt(
             ciphertext=ciphertext,
             associated_data=self.full_associated_data,
         )
 
         return self.bytes_to_value(data)
 
-    def encrypt_value(self, instance: EncryptedModel, plaintext: t.Optional[T]):
-        """Encrypts a single value using the DEK and associated data."""
+    def encrypt_value(
+        self,
+        instance: EncryptedModel,
+        plaintext: t.Optional[T],
+        dek_aead: t.Optional["Aead"] = None,
+    ):
+        """
+        Encrypts a single value using the DEK and associated data. The DEK's
+        AEAD primitive may be passed in if it was already looked up.
+        """
         return (
             None
             if plaintext is None
-            else instance.dek_aead.encrypt(
+            else (dek_aead or instance.dek_aead).encrypt(
                 plaintext=self.value_to_bytes(plaintext),
                 associated_data=self.full_associated_data,
             )
@@ -258,6 +258,32 @@ class TestBaseEncryptedField(TestCase):
             decrypted_bytes
         )
 
+    def test_decrypt_value__dek_aead(self):
+        """decrypt_value uses the given DEK AEAD primitive."""
+        instance = self._get_model_instance()
+        dek_aead = FakeAead.as_mock()
+
+        ciphertext = FakeAead.encrypt(b"value")
+        assert self.field.decrypt_value(instance, ciphertext, dek_aead) == (
+            "value"
+        )
+        dek_aead.decrypt.assert_called_once_with(
+            ciphertext=ciphertext,
+            associated_data=self.field.full_associated_data,
+        )
+        instance.dek_aead.decrypt.assert_not_called()
+
+    def test_get_ciphertext(self):
+        """get_ciphertext returns ciphertext that is pending decryption."""
+        instance = self._get_model_instance()
+        assert self.field.get_ciphertext(instance) is None  # Pending encryption
+
+        instance.set_stored_value(self.field, _TrustedCiphertext(b"data"))
+        assert self.field.get_ciphertext(instance) == b"data"
+
+        instance.__decrypted_values__[self.field.attname] = "value"
+        assert self.field.get_ciphertext(instance) is None  # Already decrypted
+
     def test_encrypt_value(self):
         """encrypt_value encrypts the given plaintext."""
         # Create instance and mock shorthands.
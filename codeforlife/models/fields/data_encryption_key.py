@@ -57,8 +57,8 @@ class DataEncryptionKeyAttribute(
         value: t.Optional[_TrustedDek],  # type: ignore[override]
     ):
         # Clear any cached DEK AEAD.
-        if instance.pk is not None and instance.pk in instance.DEK_AEAD_CACHE:
-            instance.DEK_AEAD_CACHE.pop(instance.pk, None)
+        if instance.pk is not None:
+            instance.DEK_AEAD_CACHE.invalidate(instance.pk)
 
         if isinstance(value, _TrustedDek):  # From DB.
             internal_value = value.dek
@@ -0,0 +1,47 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 17:58:42(+01:00).
+
+Views of model instances as proxy models.
+
+Converting an instance to a proxy model by creating a new instance copies every
+field and loses the caches of the instance's related objects and prefetched
+querysets, which are then fetched from the database again. Instead, a view is
+created without calling the model's constructor and shares the instance's
+attributes, including its state and caches.
+"""
+
+import typing as t
+
+from django.db import models
+
+AnyModel = t.TypeVar("AnyModel", bound=models.Model)
+
+
+def as_proxy(instance: models.Model, proxy_class: t.Type[AnyModel]):
+    """View a model instance as another model of the same concrete model.
+
+    The view and the instance share their attributes, so changes to one (e.g.
+    setting a field or loading a relation) are visible through the other.
+
+    Args:
+        instance: The instance to view.
+        proxy_class: The model to view the instance as.
+
+    Returns:
+        A view of the instance as the proxy model.
+    """
+    # pylint: disable-next=protected-access
+    if proxy_class._meta.concrete_model is not instance._meta.concrete_model:
+        raise ValueError(
+            f"{proxy_class.__name__} is not a proxy of"
+            f" {instance.__class__.__name__}'s concrete model."
+        )
+
+    if type(instance) is proxy_class:
+        return t.cast(AnyModel, instance)
+
+    view = proxy_class.__new__(proxy_class)
+    view.__dict__ = instance.__dict__
+
+    return view
@@ -0,0 +1,59 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 17:58:42(+01:00).
+"""
+
+from ..tests import TestCase
+from ..user.models import (
+    NonSchoolTeacher,
+    SchoolTeacher,
+    Session,
+    TeacherUser,
+    User,
+)
+from .proxy import as_proxy
+
+# pylint: disable=missing-class-docstring
+
+
+class TestAsProxy(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        teacher_user = TeacherUser.objects.first()
+        assert teacher_user
+        self.user = User.objects.select_related("new_teacher__school").get(
+            pk=teacher_user.pk
+        )
+
+    def test_as_proxy(self):
+        """Views an instance as a proxy without copying it or querying."""
+        with self.assertNumQueries(0):
+            teacher_user = as_proxy(self.user, TeacherUser)
+            assert isinstance(teacher_user, TeacherUser)
+            assert teacher_user == self.user
+            assert teacher_user.teacher == self.user.teacher
+
+        teacher_user.first_name = "Changed"
+        assert self.user.first_name == "Changed"
+
+    def test_as_proxy__same_class(self):
+        """Returns the instance if it's already of the proxy model."""
+        assert as_proxy(self.user, User) is self.user
+
+    def test_as_proxy__other_model(self):
+        """Cannot view an instance as a model of another concrete model."""
+        with self.assertRaises(ValueError):
+            as_proxy(self.user, Session)
+
+    def test_as_proxy__teacher(self):
+        """Typed teachers are views too."""
+        teacher = self.user.teacher
+        assert teacher
+
+        typed_teacher_class = (
+            SchoolTeacher if teacher.school_id else NonSchoolTeacher
+        )
+        with self.assertNumQueries(0):
+            typed_teacher = as_proxy(teacher, typed_teacher_class)
+            assert typed_teacher.school == teacher.school
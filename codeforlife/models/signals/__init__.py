@@ -8,3 +8,4 @@ https://docs.djangoproject.com/en/5.1/ref/signals/#module-django.db.models.signa
 
 from .general import UpdateFields, update_fields_includes
 from .receiver import model_receiver
+from .version import bump_model_versions
@@ -0,0 +1,64 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 20:31:48(+01:00).
+
+Replaces the versions of tracked models when their rows change. See
+`codeforlife.caches.ModelVersionCache`.
+
+Versions are replaced once the transaction which changed the rows commits, so
+that requests reading the new version also read the changed rows.
+"""
+
+import typing as t
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ...caches import ModelVersionCache
+
+
+def bump_model_versions(*models: t.Type[Model], using: t.Optional[str] = None):
+    """Replace the versions of the tracked models once the transaction commits.
+
+    Args:
+        models: The models whose rows changed.
+        using: The alias of the database the rows changed in.
+    """
+    models = tuple(
+        {model: None for model in models if ModelVersionCache.is_tracked(model)}
+    )
+    if models:
+        transaction.on_commit(
+            partial(ModelVersionCache.bump, *models), using=using
+        )
+
+
+@receiver(post_save)
+def bump_on_save(sender: t.Type[Model], raw: bool, using: str, **_):
+    """Replace the version of the saved row's model."""
+    # Rows loaded from fixtures are saved as they are.
+    if not raw:
+        bump_model_versions(sender, using=using)
+
+
+@receiver(post_delete)
+def bump_on_delete(sender: t.Type[Model], using: str, **_):
+    """Replace the version of the deleted row's model."""
+    bump_model_versions(sender, using=using)
+
+
+@receiver(m2m_changed)
+def bump_on_m2m_change(
+    sender: t.Type[Model],
+    instance: Model,
+    action: str,
+    model: t.Type[Model],
+    using: str,
+    **_,
+):
+    """Replace the versions of the models on both sides of the relation."""
+    if action.startswith("post_"):
+        bump_model_versions(sender, type(instance), model, using=using)
@@ -3,12 +3,20 @@
 Created on 11/04/2024 at 11:22:25(+01:00).
 """
 
+import json
+import typing as t
+
 from django.conf import settings
+from django.db import connections
+from django.db.models.query import QuerySet
+from rest_framework.pagination import CursorPagination as _CursorPagination
 from rest_framework.pagination import (
     LimitOffsetPagination as _LimitOffsetPagination,
 )
 from rest_framework.response import Response
 
+from .caches import QuerySetCountCache
+
 
 class LimitOffsetPagination(_LimitOffsetPagination):
     """Default pagination class for all list actions."""
@@ -28,3 +36,98 @@ class LimitOffsetPagination(_LimitOffsetPagination):
                 "data": data,
             }
         )
+
+
+def estimate_count(queryset: QuerySet):
+    """Estimate the number of rows a queryset's query matches.
+
+    On PostgreSQL, the estimate is the query planner's, which doesn't scan the
+    rows. On other databases, the rows are counted.
+
+    Args:
+        queryset: The queryset to count.
+
+    Returns:
+        The (estimated) number of rows.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CursorPagination(_CursorPagination):
+    """Keyset pagination for large lists.
+
+    Instead of counting all rows and skipping to an offset, each page is
+    fetched with a filter on the ordering field's value after (or before) the
+    previous page's. Fetching a deep page costs the same as the first page.
+
+    The ordering is the view's lookup field or, if the view has none, the
+    primary key. It must be unique.
+    """
+
+    page_size = LimitOffsetPagination.default_limit
+    page_size_query_param = "limit"
+    max_page_size = LimitOffsetPagination.max_limit
+    ordering: t.Optional[str] = None  # type: ignore[assignment]
+
+    # How to count the rows. If None, the rows aren't counted.
+    # - "cached": count exactly and cache the count (see QuerySetCountCache).
+    # - "estimated": estimate the count (see estimate_count).
+    count_mode: t.Optional[t.Literal["cached", "estimated"]] = None
+
+    count: t.Optional[int] = None
+
+    def get_ordering(self, request, queryset, view):
+        if self.ordering is not None:
+            return super().get_ordering(request, queryset, view)
+
+        return (getattr(view, "lookup_field_name", None) or "pk",)
+
+    def get_count(self, queryset: QuerySet):
+        """Count the rows of the queryset as set by the count mode.
+
+        Args:
+            queryset: The queryset to count.
+
+        Returns:
+            The number of rows, or None if they're not counted.
+        """
+        if self.count_mode == "estimated":
+            return estimate_count(queryset)
+        if self.count_mode == "cached":
+            count = QuerySetCountCache.get(queryset)
+            if count is None:
+                count = queryset.count()
+                QuerySetCountCache.set(queryset, count)
+
+            return count
+
+        return None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = self.get_count(queryset)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "limit": self.page_size,
+                "max_limit": self.max_page_size,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "data": data,
+            }
+        )
@@ -0,0 +1,92 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 19:02:15(+01:00).
+"""
+
+import typing as t
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .caches import QuerySetCountCache
+from .pagination import CursorPagination
+from .tests import TestCase
+from .user.models import User
+
+# pylint: disable=missing-class-docstring
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class TestCursorPagination(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        cache.clear()
+        self.queryset = User.objects.all()
+        self.view = SimpleNamespace(lookup_field_name="id")
+
+    def paginate(self, pagination: CursorPagination, query: str = ""):
+        """Paginate the users and get the response's data."""
+        request = Request(APIRequestFactory().get(f"/users/?{query}"))
+        page = t.cast(
+            t.List[User],
+            pagination.paginate_queryset(self.queryset, request, self.view),
+        )
+
+        return t.cast(
+            t.Dict[str, t.Any],
+            pagination.get_paginated_response([user.pk for user in page]).data,
+        )
+
+    def test_paginate_queryset(self):
+        """Can page through all users with the cursors."""
+        user_ids = list(
+            self.queryset.order_by("id").values_list("id", flat=True)
+        )
+        assert len(user_ids) > 2
+
+        data = self.paginate(CursorPagination(), "limit=2")
+        assert data["count"] is None
+        assert data["limit"] == 2
+        assert data["previous"] is None
+        paged_user_ids = data["data"]
+
+        while data["next"]:
+            query = parse_qs(urlparse(data["next"]).query)
+            data = self.paginate(
+                CursorPagination(),
+                f"limit=2&cursor={query['cursor'][0]}",
+            )
+            assert data["previous"]
+            paged_user_ids += data["data"]
+
+        assert paged_user_ids == user_ids
+
+    def test_get_count__cached(self):
+        """Caches the count of the rows."""
+        pagination = CursorPagination()
+        pagination.count_mode = "cached"
+
+        assert self.paginate(pagination)["count"] == self.queryset.count()
+        assert QuerySetCountCache.get(self.queryset) == self.queryset.count()
+
+        with patch.object(QuerySetCountCache, "get", return_value=1):
+            assert self.paginate(pagination)["count"] == 1
+
+    def test_get_count__estimated(self):
+        """Counts the rows if the database can't estimate them."""
+        pagination = CursorPagination()
+        pagination.count_mode = "estimated"
+
+        assert self.paginate(pagination)["count"] == self.queryset.count()
@@ -4,5 +4,11 @@ Created on 20/01/2024 at 11:19:12(+00:00).
 """
 
 from .base import BaseSerializer
-from .model import BaseModelSerializer, ModelSerializer
+from .model import (
+    BaseModelSerializer,
+    FieldSelection,
+    ModelSerializer,
+    parse_field_selection,
+)
 from .model_list import BaseModelListSerializer, ModelListSerializer
+from .related import RelatedPlan
@@ -8,6 +8,7 @@ Base model serializers.
 import typing as t
 
 from django.db.models import Model
+from rest_framework.serializers import ListSerializer
 from rest_framework.serializers import ModelSerializer as _ModelSerializer
 
 from ..request import BaseRequest, Request
@@ -31,6 +32,47 @@ AnyModel = t.TypeVar("AnyModel", bound=Model)
 AnyBaseRequest = t.TypeVar("AnyBaseRequest", bound=BaseRequest)
 # pylint: enable=duplicate-code
 
+# The names of the fields to serialize. Each name maps to the selection of its
+# nested serializer's fields or, if None, all of them.
+FieldSelection = t.Dict[str, t.Optional["FieldSelection"]]
+
+
+def parse_field_selection(
+    fields: t.Optional[str], expand: t.Optional[str] = None
+) -> t.Optional[FieldSelection]:
+    """Parse which fields to serialize from comma-separated lists.
+
+    Example: fields="id,student.klass" and expand="teacher" selects the ID, the
+    student's class and all of the teacher's fields.
+
+    Args:
+        fields: The fields to serialize. Nested fields are selected with dots
+            and a nested serializer's name selects all its fields.
+        expand: The nested serializers to serialize in full, in addition to
+            the fields.
+
+    Returns:
+        The selected fields or, if no fields were given, None.
+    """
+    if not fields:
+        return None
+
+    selection: FieldSelection = {}
+    for name in [*fields.split(","), *(expand or "").split(",")]:
+        path = [attr for attr in name.strip().split(".") if attr]
+        if not path:
+            continue
+
+        node: t.Optional[FieldSelection] = selection
+        for attr in path[:-1]:
+            node = t.cast(FieldSelection, node).setdefault(attr, {})
+            if node is None:  # Already selected in full.
+                break
+        else:
+            t.cast(FieldSelection, node)[path[-1]] = None
+
+    return selection
+
 
 class BaseModelSerializer(
     BaseSerializer[AnyBaseRequest],
@@ -42,6 +84,34 @@ class BaseModelSerializer(
     instance: t.Optional[AnyModel]
     view: AnyBaseModelViewSet
 
+    def __init__(
+        self,
+        *args,
+        field_selection: t.Optional[FieldSelection] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        # The fields to serialize. If None, all fields are serialized.
+        self.field_selection = field_selection
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.field_selection is None:
+            return fields
+
+        fields = {
+            name: field
+            for name, field in fields.items()
+            if name in self.field_selection
+        }
+        for name, field in fields.items():
+            if isinstance(field, ListSerializer):
+                field = field.child
+            if isinstance(field, BaseModelSerializer):
+                field.field_selection = self.field_selection[name]
+
+        return fields
+
     @property
     def non_none_instance(self):
         """Casts the instance to not None."""
@@ -0,0 +1,58 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 20:04:31(+01:00).
+"""
+
+from ..tests import TestCase
+from ..user.models import User
+from ..user.serializers import UserSerializer
+from .model import parse_field_selection
+
+# pylint: disable=missing-class-docstring
+
+
+class TestParseFieldSelection(TestCase):
+    def test_parse_field_selection(self):
+        """Parses the fields, nested fields and expanded fields."""
+        assert parse_field_selection(
+            "id,student.klass, student.school", "teacher"
+        ) == {
+            "id": None,
+            "student": {"klass": None, "school": None},
+            "teacher": None,
+        }
+
+    def test_parse_field_selection__full(self):
+        """Selecting a nested serializer selects all its fields."""
+        assert parse_field_selection("student.klass,student") == {
+            "student": None
+        }
+        assert parse_field_selection("student,student.klass") == {
+            "student": None
+        }
+
+    def test_parse_field_selection__none(self):
+        """Nothing is selected if no fields are given."""
+        assert parse_field_selection(None, "teacher") is None
+        assert parse_field_selection("") is None
+
+
+class TestBaseModelSerializer(TestCase):
+    fixtures = ["school_1"]
+
+    def test_get_fields(self):
+        """Only the selected fields and nested fields are serialized."""
+        user = User.objects.filter(new_student__isnull=False).first()
+        assert user
+
+        serializer = UserSerializer[User](
+            user,
+            field_selection={"id": None, "student": {"klass": None}},
+        )
+
+        assert serializer.data == {
+            "id": user.pk,
+            "student": {
+                "klass": user.new_student.class_field.access_code,
+            },
+        }
@@ -0,0 +1,214 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 18:21:36(+01:00).
+
+Plans which relations to select and prefetch for a serializer.
+
+The planner walks a serializer's readable fields and the paths of their sources
+(e.g. `source="new_student.class_field.access_code"`) through the model's
+relations. Paths of forward and one-to-one relations are selected in the same
+query as the instances (`select_related`). Paths which pass through a
+many-relation are prefetched in a query per relation (`prefetch_related`).
+Nested serializers are walked as if their fields were declared on the parent.
+
+Sources which are not model fields (e.g. properties and methods) end the path,
+since the planner cannot know what they read. Related fields which only render
+the related instance's primary key (e.g. `PrimaryKeyRelatedField`) read the
+foreign key's column and so are not selected.
+
+If the serializer's fields were selected (see `parse_field_selection`), only
+the columns the selected fields read are loaded. This requires every field to
+read a model field. If one doesn't, all columns are loaded.
+"""
+
+import typing as t
+from dataclasses import dataclass, field
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from rest_framework.fields import Field
+from rest_framework.relations import RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+AnyModel = t.TypeVar("AnyModel", bound=Model)
+
+# The names of the relations along a path and whether each is a many-relation.
+RelatedPath = t.List[t.Tuple[str, bool]]
+
+
+@dataclass
+class RelatedPlan:
+    """The relations to select and prefetch for a serializer."""
+
+    select_related: t.Set[str] = field(default_factory=set)
+    prefetch_related: t.Set[str] = field(default_factory=set)
+    # The only columns to load. If None, all columns are loaded.
+    only: t.Optional[t.Set[str]] = None
+
+    @classmethod
+    def from_serializer(
+        cls, serializer: BaseSerializer, model: t.Optional[t.Type[Model]] = None
+    ):
+        """Plan the relations a serializer reads.
+
+        Args:
+            serializer: The serializer to plan for.
+            model: The model of the serialized instances. Defaults to the
+                serializer's model.
+
+        Returns:
+            The relations to select and prefetch.
+        """
+        plan = cls()
+        if isinstance(serializer, ListSerializer):
+            serializer = serializer.child
+
+        if model is None:
+            model = getattr(getattr(serializer, "Meta", None), "model", None)
+        if model is not None:
+            plan.add_serializer(serializer, model, [])
+            if getattr(serializer, "field_selection", None) is not None:
+                plan.only = plan.get_only(serializer, model)
+
+        return plan
+
+    def add_serializer(
+        self,
+        serializer: BaseSerializer,
+        model: t.Type[Model],
+        path: RelatedPath,
+    ):
+        """Add the relations a serializer's fields read."""
+        for serializer_field in getattr(serializer, "fields", {}).values():
+            if serializer_field.write_only:
+                continue
+
+            if serializer_field.source == "*":
+                if isinstance(serializer_field, BaseSerializer):
+                    self.add_serializer(serializer_field, model, path)
+            else:
+                self.add_field(serializer_field, model, path)
+
+    def add_field(
+        self, serializer_field: Field, model: t.Type[Model], path: RelatedPath
+    ):
+        """Add the relations along a field's source."""
+        path = path.copy()
+        for index, attr in enumerate(serializer_field.source_attrs):
+            try:
+                # pylint: disable-next=protected-access
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break
+
+            related_model = model_field.related_model
+            if not model_field.is_relation or not isinstance(
+                related_model, type
+            ):
+                break
+
+            many = bool(model_field.many_to_many or model_field.one_to_many)
+            if (
+                index == len(serializer_field.source_attrs) - 1
+                and isinstance(serializer_field, RelatedField)
+                and serializer_field.use_pk_only_optimization()
+                and model_field.concrete
+                and not many
+            ):
+                # Only the foreign key's column is read.
+                break
+
+            path.append((attr, many))
+            model = related_model
+        else:
+            if isinstance(serializer_field, ListSerializer):
+                serializer_field = serializer_field.child
+            if isinstance(serializer_field, BaseSerializer):
+                self.add_serializer(serializer_field, model, path)
+
+        self.add_path(path)
+
+    def add_path(self, path: RelatedPath):
+        """Add a path of relations to select or prefetch."""
+        names = [name for name, _ in path]
+        many = [index for index, (_, is_many) in enumerate(path) if is_many]
+        if not many:
+            if names:
+                self.select_related.add("__".join(names))
+            return
+
+        # Select the relations up to the first many-relation.
+        if many[0]:
+            self.select_related.add("__".join(names[: many[0]]))
+        self.prefetch_related.add("__".join(names))
+
+    def get_only(self, serializer: BaseSerializer, model: t.Type[Model]):
+        """Get the only columns to load for a serializer.
+
+        Args:
+            serializer: The serializer to load the columns for.
+            model: The model of the serialized instances.
+
+        Returns:
+            The columns of the model and selected relations the serializer's
+            fields read or, if a field doesn't read a model field, None.
+        """
+        # pylint: disable=protected-access
+        only = {model._meta.pk.name}  # type: ignore[union-attr]
+        for serializer_field in getattr(serializer, "fields", {}).values():
+            if serializer_field.write_only:
+                continue
+            if serializer_field.source == "*":
+                return None
+
+            try:
+                model_field = model._meta.get_field(
+                    serializer_field.source_attrs[0]
+                )
+            except FieldDoesNotExist:
+                return None
+            if model_field.concrete:
+                only.add(model_field.name)
+
+        # Load all the columns of the selected relations.
+        for path in self.select_related:
+            names = path.split("__")
+            related_model = model
+            for index, name in enumerate(names):
+                model_field = related_model._meta.get_field(name)
+                if index == 0 and model_field.concrete:
+                    only.add(name)
+
+                related_model = t.cast(t.Type[Model], model_field.related_model)
+                prefix = "__".join(names[: index + 1])
+                only.update(
+                    f"{prefix}__{related_field.name}"
+                    for related_field in related_model._meta.concrete_fields
+                )
+        # pylint: enable=protected-access
+
+        return only
+
+    def apply(self, queryset: QuerySet[AnyModel]):
+        """Select and prefetch the planned relations of a queryset.
+
+        Args:
+            queryset: The queryset to apply the plan to.
+
+        Returns:
+            The queryset with the relations selected and prefetched. Querysets
+            which return values instead of instances are returned as they are.
+        """
+        # pylint: disable-next=protected-access
+        if queryset._fields is not None or queryset.query.combinator:
+            return queryset
+
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(self.prefetch_related))
+        if self.only is not None:
+            queryset = queryset.only(*sorted(self.only))
+
+        return queryset
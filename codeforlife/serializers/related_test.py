@@ -0,0 +1,93 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 18:21:36(+01:00).
+"""
+
+from ..tests import TestCase
+from ..user.models import Teacher, User
+from ..user.serializers import ClassSerializer, UserSerializer
+from .model import ModelSerializer
+from .related import RelatedPlan
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=too-many-ancestors
+
+
+class TeacherClassesSerializer(ModelSerializer[User, Teacher]):
+    classes = ClassSerializer(source="class_teacher", many=True, read_only=True)
+
+    class Meta:
+        model = Teacher
+        fields = ["id", "school", "classes"]
+
+
+class TestRelatedPlan(TestCase):
+    fixtures = ["school_1"]
+
+    def test_from_serializer(self):
+        """Selects the relations of the fields' sources and nested fields."""
+        plan = RelatedPlan.from_serializer(UserSerializer[User]())
+
+        assert plan.select_related == {
+            "new_student",
+            "new_student__class_field",
+            "new_student__class_field__teacher__school",
+            "new_student__pending_class_request",
+            "new_teacher",
+        }
+        assert not plan.prefetch_related
+
+    def test_from_serializer__many(self):
+        """Prefetches the relations after a many-relation."""
+        plan = RelatedPlan.from_serializer(TeacherClassesSerializer())
+
+        assert not plan.select_related
+        assert plan.prefetch_related == {
+            "class_teacher",
+            "class_teacher__teacher__school",
+        }
+
+    def test_apply(self):
+        """Serializing the planned queryset doesn't query each instance."""
+        serializer = UserSerializer[User](many=True)
+        queryset = RelatedPlan.from_serializer(serializer).apply(
+            User.objects.order_by("pk")
+        )
+
+        with self.assertNumQueries(1):
+            serializer.to_representation(queryset)
+
+    def test_from_serializer__field_selection(self):
+        """Only loads the columns of the selected fields."""
+        plan = RelatedPlan.from_serializer(
+            UserSerializer[User](
+                field_selection={"first_name": None, "teacher": None}
+            )
+        )
+
+        assert plan.select_related == {"new_teacher"}
+        assert plan.only == {
+            "id",
+            "first_name",
+            *(
+                f"new_teacher__{field.name}"
+                # pylint: disable-next=protected-access
+                for field in Teacher._meta.concrete_fields
+            ),
+        }
+
+        queryset = plan.apply(User.objects.order_by("pk"))
+        with self.assertNumQueries(1):
+            assert UserSerializer[User](
+                queryset,
+                many=True,
+                field_selection={"first_name": None, "teacher": None},
+            ).data
+
+    def test_apply__values(self):
+        """Querysets of values are returned as they are."""
+        queryset = User.objects.values("pk")
+
+        assert RelatedPlan(select_related={"new_teacher"}).apply(queryset) is (
+            queryset
+        )
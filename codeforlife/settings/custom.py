@@ -88,6 +88,15 @@ SESSION_METADATA_COOKIE_PATH = "/"
 SESSION_METADATA_COOKIE_DOMAIN = SERVICE_EXTERNAL_DOMAIN
 SESSION_METADATA_COOKIE_SAMESITE: "CookieSamesite" = "Strict"
 
+# How many seconds before a session expires that it's saved to the database
+# when its data is unchanged. Saving also extends the session's expiry. If not
+# set, sessions are saved to the database on every request.
+SESSION_TOUCH_THRESHOLD: t.Optional[int] = (
+    int(os.environ["SESSION_TOUCH_THRESHOLD"])
+    if "SESSION_TOUCH_THRESHOLD" in os.environ
+    else None
+)
+
 
 def get_redis_url():
     """Get the Redis URL for the current environment.
@@ -39,3 +39,23 @@ GCP_KMS_KEY_URI = (
     f"keyRings/{GCP_KMS_KEY_RING_NAME}/"
     f"cryptoKeys/{GCP_KMS_KEY_NAME}"
 )
+# The max number of threads used to unwrap many data encryption keys (DEKs)
+# concurrently with the KEK.
+GCP_KMS_MAX_WORKERS = int(os.getenv("GCP_KMS_MAX_WORKERS", "8"))
+# The max number of attempts of an operation with the KEK and the backoff, in
+# seconds, before the first retry. The backoff doubles after each retry.
+GCP_KMS_MAX_ATTEMPTS = int(os.getenv("GCP_KMS_MAX_ATTEMPTS", "3"))
+GCP_KMS_RETRY_BACKOFF = float(os.getenv("GCP_KMS_RETRY_BACKOFF", "0.2"))
+
+# OAuth 2.0 tokens
+# https://developers.google.com/identity/protocols/oauth2/web-server#offline
+
+# How many seconds before a user's access-token expires that it's renewed.
+GOOGLE_OAUTH2_TOKEN_RENEWAL_MARGIN = int(
+    os.getenv("GOOGLE_OAUTH2_TOKEN_RENEWAL_MARGIN", "300")
+)
+# How many seconds a user's access-token keeps being renewed after it was last
+# refreshed on demand. 0 disables renewals.
+GOOGLE_OAUTH2_TOKEN_RENEWAL_PERIOD = int(
+    os.getenv("GOOGLE_OAUTH2_TOKEN_RENEWAL_PERIOD", str(60 * 60 * 8))
+)
@@ -52,6 +52,10 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_BROKER_URL = "sqs://"
 CELERY_BROKER_TRANSPORT_OPTIONS = {
     "region": OTP_AWS_REGION if ENV != "local" else AWS_REGION,
+    # How many seconds a received task is hidden from other workers before SQS
+    # redelivers it. This must be longer than the longest countdown of any task
+    # (e.g. renewing a Google OAuth 2.0 token) so that it only runs once.
+    "visibility_timeout": 60 * 60 * 2,
     "predefined_queues": {
         SERVICE_NAME: {
             "url": (
@@ -64,3 +68,5 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {
 }
 CELERY_TASK_DEFAULT_QUEUE = SERVICE_NAME
 CELERY_TASK_TIME_LIMIT = 60 * 30
+# Tasks defined by this package, which aren't in the service's source module.
+CELERY_IMPORTS = ["codeforlife.user.tasks"]
@@ -4,22 +4,44 @@ Created on 06/10/2025 at 17:15:37(+01:00).
 """
 
 import csv
+import gzip
 import io
+import json
 import logging
+import os
+import shutil
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timezone
-from tempfile import NamedTemporaryFile, _TemporaryFileWrapper
+from functools import partial
+from hashlib import sha256
+from itertools import islice
+from tempfile import (
+    NamedTemporaryFile,
+    TemporaryFile,
+    _TemporaryFileWrapper,
+    gettempdir,
+)
 
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
 from celery import Task
 from celery import shared_task as _shared_task
 from django.conf import settings as django_settings
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Field, Model
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.query import QuerySet
+from google.api_core.exceptions import NotFound
 from google.cloud.bigquery import (
     Client,
     CreateDisposition,
     LoadJobConfig,
+    SchemaField,
     SourceFormat,
     WriteDisposition,
 )
@@ -30,6 +52,60 @@ from .utils import get_task_name
 
 if t.TYPE_CHECKING:
     CsvFile = _TemporaryFileWrapper[bytes]
+    ExportFile = _TemporaryFileWrapper[bytes]
+
+# The Arrow types of the Django model fields, by the fields' internal types.
+# Fields with an internal type not listed here are exported as strings.
+ARROW_TYPES: t.Dict[str, "pa.DataType"] = {
+    "AutoField": pa.int64(),
+    "BigAutoField": pa.int64(),
+    "SmallAutoField": pa.int64(),
+    "IntegerField": pa.int64(),
+    "BigIntegerField": pa.int64(),
+    "SmallIntegerField": pa.int64(),
+    "PositiveIntegerField": pa.int64(),
+    "PositiveBigIntegerField": pa.int64(),
+    "PositiveSmallIntegerField": pa.int64(),
+    "BooleanField": pa.bool_(),
+    "FloatField": pa.float64(),
+    # Datetimes are converted to UTC and stored without a timezone, the same
+    # as in the CSV format.
+    "DateTimeField": pa.timestamp("us"),
+    "DateField": pa.date32(),
+    "TimeField": pa.time64("us"),
+    "BinaryField": pa.binary(),
+    "CharField": pa.string(),
+    "TextField": pa.string(),
+    "SlugField": pa.string(),
+}
+
+# The internal types of the Django model fields whose values are written to CSV
+# files as they are. The CSV writer converts them to strings and None to "".
+CSV_NATIVE_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "SmallAutoField",
+    "IntegerField",
+    "BigIntegerField",
+    "SmallIntegerField",
+    "PositiveIntegerField",
+    "PositiveBigIntegerField",
+    "PositiveSmallIntegerField",
+    "BooleanField",
+    "FloatField",
+    "DecimalField",
+    "CharField",
+    "TextField",
+    "SlugField",
+    "UUIDField",
+}
+
+# The compression codec of the Parquet files' row groups.
+PARQUET_COMPRESSION = "snappy"
+
+# The compression level of gzip-compressed CSV files. Lower than gzip's default
+# as the higher levels are much slower for little gain.
+GZIP_COMPRESSLEVEL = 6
 
 
 # pylint: disable-next=abstract-method
@@ -39,8 +115,12 @@ class BigQueryTask(Task):
     TABLE_NAMES: t.Set[str] = set()
 
     WriteDisposition: t.TypeAlias = WriteDisposition  # shorthand
+    SourceFormat: t.TypeAlias = SourceFormat  # shorthand
     GetQuerySet: t.TypeAlias = t.Callable[..., QuerySet[t.Any]]
 
+    # The formats a queryset can be exported to.
+    SUPPORTED_FORMATS = {SourceFormat.CSV, SourceFormat.PARQUET}
+
     @dataclass(frozen=True)
     # pylint: disable-next=too-many-instance-attributes
     class Settings:
@@ -50,10 +130,34 @@ class BigQueryTask(Task):
         write_disposition: str
         # The number of rows to write at a time. Must be a multiple of 10.
         chunk_size: int
-        # The [Django model] fields to include in the CSV.
+        # The [Django model] fields to include in the export.
         fields: t.List[str]
+        # The format of the file the queryset is exported to before it's loaded
+        # into BigQuery. Must be one of SUPPORTED_FORMATS.
+        format: str = SourceFormat.CSV
         # The name of the field used to identify each row.
         id_field: str = "id"
+        # The name of the field used to export rows incrementally, such as
+        # "last_login" or "id". If set, only the rows whose value is greater
+        # than the greatest value already in the BigQuery table are exported.
+        # If merging, the rows whose value equals the greatest value are also
+        # exported again. Limitations:
+        # - Rows committed late, with a value less than the greatest value
+        #   already exported, are never exported.
+        # - Rows whose value is NULL are never exported incrementally.
+        watermark_field: t.Optional[str] = None
+        # Whether to compress the CSV file with gzip before it's uploaded.
+        # Compressed CSV files are smaller to upload but slower for BigQuery to
+        # load, as BigQuery cannot read them in parallel.
+        gzip: bool = False
+        # The number of key ranges of the ID field to split the export into.
+        # The shards are exported concurrently, each over its own database
+        # connection, and then loaded into BigQuery by one load job.
+        shards: int = 1
+        # Whether to merge incrementally exported rows into the BigQuery table
+        # by their ID, updating the rows that were exported before. Otherwise,
+        # the rows are appended to the table.
+        merge: bool = False
         # The maximum amount of time this task is allowed to take before it's
         # hard-killed.
         time_limit: int = 3600
@@ -75,6 +179,9 @@ class BigQueryTask(Task):
             # Ensure the ID field is always present.
             if self.id_field not in self.fields:
                 self.fields.append(self.id_field)
+            # Ensure the watermark field is present if exporting incrementally.
+            if self.watermark_field and self.watermark_field not in self.fields:
+                self.fields.append(self.watermark_field)
 
             # Validate args.
             if not self.write_disposition.startswith("WRITE_") or not hasattr(
@@ -85,6 +192,35 @@ class BigQueryTask(Task):
                     " does not exist.",
                     code="write_disposition_does_not_exist",
                 )
+            if self.format not in BigQueryTask.SUPPORTED_FORMATS:
+                raise ValidationError(
+                    f'The format "{self.format}" is not supported.',
+                    code="format_not_supported",
+                )
+            if (
+                self.watermark_field
+                and self.write_disposition != WriteDisposition.WRITE_APPEND
+            ):
+                raise ValidationError(
+                    "The write disposition must be WRITE_APPEND when exporting"
+                    " incrementally.",
+                    code="watermark_write_disposition_not_append",
+                )
+            if self.merge and not self.watermark_field:
+                raise ValidationError(
+                    "Must provide a watermark field to merge.",
+                    code="merge_without_watermark_field",
+                )
+            if self.gzip and self.format != SourceFormat.CSV:
+                raise ValidationError(
+                    "Only CSV files can be compressed with gzip.",
+                    code="gzip_not_csv",
+                )
+            if self.shards < 1:
+                raise ValidationError(
+                    "The number of shards must be >= 1.",
+                    code="shards_lt_1",
+                )
             if self.chunk_size <= 0:
                 raise ValidationError(
                     "The chunk size must be > 0.",
@@ -176,6 +312,21 @@ class BigQueryTask(Task):
 
         return queryset
 
+    @staticmethod
+    def format_datetime_for_csv(value: datetime):
+        """Format a datetime for inclusion in a CSV file.
+
+        Args:
+            value: The datetime to format.
+
+        Returns:
+            The datetime in UTC, in ISO 8601 format with a space separator.
+        """
+
+        # Chop off the "+00:00" offset. This is faster than removing the
+        # timezone and then converting the datetime to a string.
+        return str(value.astimezone(timezone.utc))[:-6]
+
     @staticmethod
     def format_value_for_csv(value: t.Any) -> str:
         """Format a value for inclusion in a CSV file.
@@ -190,11 +341,7 @@ class BigQueryTask(Task):
         if value is None:
             return ""  # BigQuery treats an empty string as NULL/None.
         if isinstance(value, datetime):
-            return (
-                value.astimezone(timezone.utc)
-                .replace(tzinfo=None)
-                .isoformat(sep=" ")
-            )
+            return BigQueryTask.format_datetime_for_csv(value)
         if isinstance(value, (date, time)):
             return value.isoformat()
         if not isinstance(value, str):
@@ -202,6 +349,47 @@ class BigQueryTask(Task):
 
         return value
 
+    @classmethod
+    def get_csv_formatters(cls, fields: t.List[str], queryset: QuerySet[t.Any]):
+        """Get the functions which format the exported fields' values for
+        inclusion in a CSV file.
+
+        The formatters are chosen once from the model fields' types so that
+        values don't need to be checked for their type. Fields which don't
+        resolve to a model field are formatted by checking each value's type.
+
+        Args:
+            fields: The list of fields to include in the CSV.
+            queryset: The queryset being exported.
+
+        Returns:
+            For each field, a function to format its non-null values, if they
+            need to be formatted.
+        """
+
+        formatters: t.List[t.Optional[t.Callable[[t.Any], str]]] = []
+        for field_name in fields:
+            model_field = cls.get_model_field(queryset, field_name)
+            internal_type = (
+                None if model_field is None else model_field.get_internal_type()
+            )
+
+            formatter: t.Optional[t.Callable[[t.Any], str]]
+            if internal_type == "DateTimeField":
+                formatter = cls.format_datetime_for_csv
+            elif internal_type == "DateField":
+                formatter = date.isoformat
+            elif internal_type == "TimeField":
+                formatter = time.isoformat
+            elif internal_type in CSV_NATIVE_TYPES:
+                formatter = None
+            else:
+                formatter = cls.format_value_for_csv
+
+            formatters.append(formatter)
+
+        return formatters
+
     @classmethod
     def write_queryset_to_csv(
         cls,
@@ -222,6 +410,15 @@ class BigQueryTask(Task):
             Whether any values were written to the CSV file.
         """
 
+        # Only the columns with a formatter are formatted.
+        formatters = [
+            (column_index, formatter)
+            for column_index, formatter in enumerate(
+                cls.get_csv_formatters(fields, queryset)
+            )
+            if formatter is not None
+        ]
+
         text_wrapper = io.TextIOWrapper(csv_file, encoding="utf-8", newline="")
 
         csv_writer = csv.writer(
@@ -229,22 +426,29 @@ class BigQueryTask(Task):
         )
         csv_writer.writerow(fields)  # Write the headers.
 
+        # Iterate chunks to avoid OOM for large querysets.
+        rows = t.cast(
+            t.Iterator[t.Tuple[t.Any, ...]],
+            queryset.values_list(*fields).iterator(chunk_size),
+        )
+
         chunk_index = 1  # 1 based index. For logging.
         wrote_values = False  # Track if any values were written.
 
-        for row_index, values in enumerate(
-            t.cast(
-                t.Iterator[t.Tuple[t.Any, ...]],
-                # Iterate chunks to avoid OOM for large querysets.
-                queryset.values_list(*fields).iterator(chunk_size),
-            )
-        ):
-            if row_index % chunk_size == 0:
-                logging.info("Writing chunk %d", chunk_index)
-                chunk_index += 1
+        while chunk := list(islice(rows, chunk_size)):
+            logging.info("Writing chunk %d", chunk_index)
+            chunk_index += 1
 
-            csv_row = [cls.format_value_for_csv(value) for value in values]
-            csv_writer.writerow(csv_row)
+            if formatters:
+                columns = list(zip(*chunk))
+                for column_index, formatter in formatters:
+                    columns[column_index] = tuple(
+                        None if value is None else formatter(value)
+                        for value in columns[column_index]
+                    )
+                chunk = list(zip(*columns))
+
+            csv_writer.writerows(chunk)
             wrote_values = True
 
         # Move back 1 byte (because lineterminator is "\n").
@@ -257,29 +461,371 @@ class BigQueryTask(Task):
         return wrote_values
 
     @staticmethod
-    def load_csv_into_bq(
-        write_disposition: str,
-        time_limit: int,
-        table_name: str,
-        csv_file: "CsvFile",
+    def get_model_field(
+        queryset: QuerySet[t.Any], field_name: str
+    ) -> t.Optional[Field]:
+        """Get the model field whose values are exported for a field name.
+
+        Args:
+            queryset: The queryset being exported.
+            field_name: The name of an exported field. May be an annotation or
+                span relationships (e.g. "teacher__school__name").
+
+        Returns:
+            The model field. Relations resolve to the field they point to. If
+            the name doesn't resolve to a model field, such as when it ends in
+            a transform (e.g. "date_joined__year"), None is returned.
+        """
+
+        annotation = queryset.query.annotations.get(field_name)
+        if annotation is not None:
+            return annotation.output_field
+
+        model: t.Optional[t.Type[Model]] = queryset.model
+        model_field = None
+        for name in field_name.split(LOOKUP_SEP):
+            if model_field is not None:
+                # Only relations can be followed. Anything else is a transform.
+                model = model_field.related_model
+            if model is None:
+                return None
+
+            try:
+                model_field = (
+                    model._meta.pk
+                    if name == "pk"
+                    else model._meta.get_field(name)
+                )
+            except FieldDoesNotExist:
+                return None
+
+        # Values of relations are the values of the fields they point to.
+        while model_field.is_relation:
+            model_field = model_field.target_field
+
+        return t.cast(Field, model_field)
+
+    @classmethod
+    def get_arrow_schema(cls, fields: t.List[str], queryset: QuerySet[t.Any]):
+        """Get the Arrow schema of the exported fields.
+
+        Args:
+            fields: The list of fields to include in the export.
+            queryset: The queryset being exported.
+
+        Returns:
+            The schema and, for each field, a function to convert its non-null
+            values to the schema's type, if they need to be converted. Fields
+            which don't resolve to a model field are strings.
+        """
+
+        arrow_fields: t.List["pa.Field"] = []
+        converters: t.List[t.Optional[t.Callable[[t.Any], t.Any]]] = []
+        for field_name in fields:
+            model_field = cls.get_model_field(queryset, field_name)
+            internal_type = (
+                None if model_field is None else model_field.get_internal_type()
+            )
+
+            converter: t.Optional[t.Callable[[t.Any], t.Any]] = None
+            if model_field is None:
+                # The type is unknown so the values are exported as text.
+                arrow_type = pa.string()
+                converter = cls.format_value_for_csv
+            elif internal_type == "DecimalField":
+                arrow_type = pa.decimal128(
+                    model_field.max_digits,  # type: ignore[attr-defined]
+                    model_field.decimal_places,  # type: ignore[attr-defined]
+                )
+            elif internal_type in ARROW_TYPES:
+                arrow_type = ARROW_TYPES[internal_type]
+            else:
+                arrow_type = pa.string()
+                converter = (
+                    partial(json.dumps, cls=DjangoJSONEncoder)
+                    if internal_type == "JSONField"
+                    else str
+                )
+
+            arrow_fields.append(pa.field(field_name, arrow_type))
+            converters.append(converter)
+
+        return pa.schema(arrow_fields), converters
+
+    @classmethod
+    def write_queryset_to_parquet(
+        cls,
+        fields: t.List[str],
+        chunk_size: int,
+        queryset: QuerySet[t.Any],
+        parquet_file: "ExportFile",
     ):
-        """Load a CSV file into a BigQuery table.
+        """Write a queryset to a Parquet file.
+
+        Each chunk of rows is written as a typed, compressed row group.
 
         Args:
-            write_disposition: Write disposition for the BigQuery table.
-            time_limit: The maximum time to wait for the load job to complete.
-            table_name: The table name in BigQuery.
-            csv_file: The CSV file to load into BigQuery.
+            fields: The list of fields to include in the Parquet file.
+            chunk_size: The number of rows to write at a time.
+            queryset: The queryset to write.
+            parquet_file: The Parquet file to write to.
+
+        Returns:
+            Whether any values were written to the Parquet file.
+        """
+
+        schema, converters = cls.get_arrow_schema(fields, queryset)
+
+        # Iterate chunks to avoid OOM for large querysets.
+        rows = t.cast(
+            t.Iterator[t.Tuple[t.Any, ...]],
+            queryset.values_list(*fields).iterator(chunk_size),
+        )
+
+        chunk_index = 1  # 1 based index. For logging.
+        wrote_values = False  # Track if any values were written.
+
+        with pq.ParquetWriter(
+            parquet_file, schema, compression=PARQUET_COMPRESSION
+        ) as parquet_writer:
+            while chunk := list(islice(rows, chunk_size)):
+                logging.info("Writing chunk %d", chunk_index)
+                chunk_index += 1
+
+                columns: t.List["pa.Array"] = []
+                for values, converter, arrow_field in zip(
+                    zip(*chunk), converters, schema
+                ):
+                    if converter is not None:
+                        values = tuple(
+                            None if value is None else converter(value)
+                            for value in values
+                        )
+                    columns.append(pa.array(values, type=arrow_field.type))
+
+                parquet_writer.write_batch(
+                    pa.record_batch(columns, schema=schema)
+                )
+                wrote_values = True
+
+        return wrote_values
+
+    @staticmethod
+    def combine_csv_files(csv_files: t.List["CsvFile"], csv_file: "CsvFile"):
+        """Combine CSV files with the same headers into one CSV file.
+
+        Args:
+            csv_files: The CSV files to combine.
+            csv_file: The CSV file to write to.
+        """
+
+        for index, _csv_file in enumerate(csv_files):
+            _csv_file.seek(0)
+            if index != 0:
+                _csv_file.readline()  # Skip the headers.
+                csv_file.write(b"\n")  # The trailing newline was chopped off.
+            shutil.copyfileobj(_csv_file, csv_file)
+
+    @staticmethod
+    def combine_parquet_files(
+        parquet_files: t.List["ExportFile"], parquet_file: "ExportFile"
+    ):
+        """Combine Parquet files with the same schema into one Parquet file.
+
+        Args:
+            parquet_files: The Parquet files to combine.
+            parquet_file: The Parquet file to write to.
+        """
+
+        parquet_writer: t.Optional[pq.ParquetWriter] = None
+        for _parquet_file in parquet_files:
+            _parquet_file.seek(0)
+            _parquet_file = pq.ParquetFile(_parquet_file)
+            if parquet_writer is None:
+                parquet_writer = pq.ParquetWriter(
+                    parquet_file,
+                    _parquet_file.schema_arrow,
+                    compression=PARQUET_COMPRESSION,
+                )
+            for row_group in range(_parquet_file.num_row_groups):
+                parquet_writer.write_table(
+                    _parquet_file.read_row_group(row_group)
+                )
+
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    @staticmethod
+    def get_shard_querysets(
+        queryset: QuerySet[t.Any], id_field: str, shards: int
+    ):
+        """Split a queryset into querysets of consecutive ID ranges.
+
+        The ranges' bounds are chosen so that each shard has about the same
+        number of rows.
+
+        Args:
+            queryset: The queryset to split.
+            id_field: The name of the field used to identify each row.
+            shards: The number of shards to split the queryset into.
+
+        Returns:
+            The querysets of the shards. There are fewer shards than requested
+            if there are fewer rows than shards.
+        """
+
+        ids = queryset.order_by(id_field).values_list(id_field, flat=True)
+        count = ids.count()
+        shards = min(shards, count)
+
+        # The first ID of each shard, excluding the first shard's. Each bound
+        # is found by stepping from the previous bound, so that finding all the
+        # bounds scans the IDs once instead of once per bound.
+        bounds: t.List[t.Any] = []
+        previous_index = 0
+        for shard in range(1, shards):
+            index = count * shard // shards
+            step_ids = (
+                ids.filter(**{f"{id_field}__gte": bounds[-1]})
+                if bounds
+                else ids
+            )
+            bound = step_ids[index - previous_index]
+            if not bounds or bound != bounds[-1]:
+                bounds.append(bound)
+            previous_index = index
+
+        shard_querysets: t.List[QuerySet[t.Any]] = []
+        for lower_bound, upper_bound in zip([None, *bounds], [*bounds, None]):
+            shard_queryset = queryset
+            if lower_bound is not None:
+                shard_queryset = shard_queryset.filter(
+                    **{f"{id_field}__gte": lower_bound}
+                )
+            if upper_bound is not None:
+                shard_queryset = shard_queryset.filter(
+                    **{f"{id_field}__lt": upper_bound}
+                )
+            shard_querysets.append(shard_queryset)
+
+        return shard_querysets
+
+    def export_queryset(
+        self, queryset: QuerySet[t.Any], export_file: "ExportFile"
+    ):
+        """Export a queryset to a file in this task's format.
+
+        If this task is sharded, each shard is exported to a separate file in
+        its own thread and the files are then combined.
+
+        Args:
+            queryset: The queryset to export.
+            export_file: The file to export to.
+
+        Returns:
+            Whether any values were exported.
         """
 
-        bq_client = Client(
+        if self.settings.format == SourceFormat.PARQUET:
+            write_queryset, combine_files = (
+                self.write_queryset_to_parquet,
+                self.combine_parquet_files,
+            )
+        else:
+            write_queryset, combine_files = (
+                self.write_queryset_to_csv,
+                self.combine_csv_files,
+            )
+
+        if self.settings.shards == 1:
+            return write_queryset(
+                self.settings.fields,
+                self.settings.chunk_size,
+                queryset,
+                export_file,
+            )
+
+        def write_shard(
+            shard: int, shard_queryset: QuerySet[t.Any], shard_file
+        ):
+            connection = connections[shard_queryset.db]
+            try:
+                logging.info("Writing shard %d", shard)
+                return write_queryset(
+                    self.settings.fields,
+                    self.settings.chunk_size,
+                    shard_queryset,
+                    shard_file,
+                )
+            finally:
+                # Close the thread's connection, unless it's in a transaction.
+                if not connection.in_atomic_block:
+                    connection.close()
+
+        shard_querysets = self.get_shard_querysets(
+            queryset, self.settings.id_field, self.settings.shards
+        )
+
+        with ExitStack() as stack:
+            shard_files = [
+                stack.enter_context(TemporaryFile(mode="w+b"))
+                for _ in shard_querysets
+            ]
+
+            with ThreadPoolExecutor(
+                max_workers=len(shard_querysets)
+            ) as executor:
+                wrote_values = list(
+                    executor.map(
+                        write_shard,
+                        range(1, len(shard_querysets) + 1),
+                        shard_querysets,
+                        shard_files,
+                    )
+                )
+
+            shard_files = [
+                shard_file
+                for shard_file, _wrote_values in zip(shard_files, wrote_values)
+                if _wrote_values
+            ]
+            if not shard_files:
+                return False
+
+            combine_files(shard_files, export_file)
+
+        return True
+
+    @staticmethod
+    def get_bq_client(time_limit: int):
+        """Get a BigQuery client.
+
+        Args:
+            time_limit: The lifetime of the client's credentials.
+
+        Returns:
+            The BigQuery client.
+        """
+
+        return Client(
             project=django_settings.GOOGLE_CLOUD_PROJECT_ID,
             credentials=get_gcp_service_account_credentials(
                 token_lifetime_seconds=time_limit
             ),
         )
 
-        full_table_id = ".".join(
+    @staticmethod
+    def get_full_table_id(table_name: str):
+        """Get the fully qualified ID of a BigQuery table.
+
+        Args:
+            table_name: The table name in BigQuery.
+
+        Returns:
+            The table's ID in the format: "{PROJECT}.{DATASET}.{TABLE}".
+        """
+
+        return ".".join(
             [
                 django_settings.GOOGLE_CLOUD_PROJECT_ID,
                 django_settings.GOOGLE_CLOUD_BIGQUERY_DATASET_ID,
@@ -287,13 +833,176 @@ class BigQueryTask(Task):
             ]
         )
 
-        csv_file.seek(0)  # Reset file pointer to the start.
+    @classmethod
+    def get_watermark(
+        cls, watermark_field: str, time_limit: int, table_name: str
+    ) -> t.Any:
+        """Get the greatest value of the watermark field in a BigQuery table.
+
+        Args:
+            watermark_field: The name of the watermark field.
+            time_limit: The maximum time to wait for the query to complete.
+            table_name: The table name in BigQuery.
+
+        Returns:
+            The watermark, or None if the table does not exist or is empty.
+        """
+
+        bq_client = cls.get_bq_client(time_limit)
+        full_table_id = cls.get_full_table_id(table_name)
+
+        try:
+            rows = bq_client.query(
+                f"SELECT MAX(`{watermark_field}`) FROM `{full_table_id}`"
+            ).result()
+        except NotFound:
+            return None
+
+        watermark = next(iter(rows))[0]
+        # BigQuery returns DATETIME values without a timezone. They're in UTC.
+        if isinstance(watermark, datetime) and watermark.tzinfo is None:
+            watermark = watermark.replace(tzinfo=timezone.utc)
+
+        return watermark
+
+    @classmethod
+    def merge_into_bq(
+        cls,
+        fields: t.List[str],
+        id_field: str,
+        time_limit: int,
+        table_name: str,
+        staging_table_name: str,
+    ):
+        """Merge the rows of a staging table into a BigQuery table by their ID.
+
+        Args:
+            fields: The list of fields in the tables.
+            id_field: The name of the field used to identify each row.
+            time_limit: The maximum time to wait for the query to complete.
+            table_name: The table name in BigQuery.
+            staging_table_name: The staging table's name in BigQuery.
+        """
+
+        bq_client = cls.get_bq_client(time_limit)
+        full_table_id = cls.get_full_table_id(table_name)
+
+        columns = ", ".join(f"`{field}`" for field in fields)
+        updates = ", ".join(
+            f"`{field}` = S.`{field}`" for field in fields if field != id_field
+        )
+
+        logging.info("Starting BigQuery merge job.")
+        bq_merge_job = bq_client.query(
+            f"MERGE `{full_table_id}` T"
+            f" USING `{cls.get_full_table_id(staging_table_name)}` S"
+            f" ON T.`{id_field}` = S.`{id_field}`"
+            f" WHEN MATCHED THEN UPDATE SET {updates}"
+            f" WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({columns})"
+        )
+
+        bq_merge_job.result()
+        logging.info(
+            "Successfully merged %d rows into to BigQuery table %s.",
+            bq_merge_job.num_dml_affected_rows,
+            full_table_id,
+        )
+
+    @classmethod
+    def get_table_schema(
+        cls, fields: t.List[str], time_limit: int, table_name: str
+    ):
+        """Get the schema of some fields of a BigQuery table.
+
+        Args:
+            fields: The list of fields to get the schema of, in order.
+            time_limit: The maximum time to wait for the request to complete.
+            table_name: The table name in BigQuery.
+
+        Returns:
+            The schema of each field.
+        """
+
+        bq_client = cls.get_bq_client(time_limit)
+        schema = {
+            schema_field.name: schema_field
+            for schema_field in bq_client.get_table(
+                cls.get_full_table_id(table_name)
+            ).schema
+        }
+
+        return [schema[field] for field in fields]
+
+    @classmethod
+    def delete_table(cls, time_limit: int, table_name: str):
+        """Delete a BigQuery table, if it exists.
+
+        Args:
+            time_limit: The maximum time to wait for the request to complete.
+            table_name: The table name in BigQuery.
+        """
+
+        bq_client = cls.get_bq_client(time_limit)
+        bq_client.delete_table(
+            cls.get_full_table_id(table_name), not_found_ok=True
+        )
+
+    @classmethod
+    def _load_file_into_bq(
+        cls,
+        time_limit: int,
+        table_name: str,
+        file: "ExportFile",
+        job_config: LoadJobConfig,
+        schema: t.Optional[t.List[SchemaField]],
+    ):
+        bq_client = cls.get_bq_client(time_limit)
+        full_table_id = cls.get_full_table_id(table_name)
+
+        # The schema is required to create a table from a CSV file.
+        if schema is not None:
+            job_config.schema = schema
+
+        file.seek(0)  # Reset file pointer to the start.
 
         logging.info("Starting BigQuery load job.")
-        # Load the temporary CSV file into BigQuery.
+        # Load the temporary file into BigQuery.
         bq_load_job = bq_client.load_table_from_file(
-            file_obj=csv_file,
+            file_obj=file,
             destination=full_table_id,
+            job_config=job_config,
+        )
+
+        bq_load_job.result()
+        logging.info(
+            "Successfully loaded %d rows into to BigQuery table %s.",
+            bq_load_job.output_rows,
+            full_table_id,
+        )
+
+    @classmethod
+    def load_csv_into_bq(
+        cls,
+        write_disposition: str,
+        time_limit: int,
+        table_name: str,
+        csv_file: "CsvFile",
+        schema: t.Optional[t.List[SchemaField]] = None,
+    ):
+        """Load a CSV file into a BigQuery table.
+
+        Args:
+            write_disposition: Write disposition for the BigQuery table.
+            time_limit: The maximum time to wait for the load job to complete.
+            table_name: The table name in BigQuery.
+            csv_file: The CSV file to load into BigQuery.
+            schema: The schema of the table, if it may need to be created.
+        """
+
+        cls._load_file_into_bq(
+            time_limit=time_limit,
+            table_name=table_name,
+            file=csv_file,
             job_config=LoadJobConfig(
                 create_disposition=CreateDisposition.CREATE_IF_NEEDED,
                 source_format=SourceFormat.CSV,
@@ -304,15 +1013,135 @@ class BigQueryTask(Task):
                 time_format="HH24:MI:SS",
                 datetime_format="YYYY-MM-DD HH24:MI:SS",
             ),
+            schema=schema,
         )
 
-        bq_load_job.result()
-        logging.info(
-            "Successfully loaded %d rows into to BigQuery table %s.",
-            bq_load_job.output_rows,
-            full_table_id,
+    @classmethod
+    def load_parquet_into_bq(
+        cls,
+        write_disposition: str,
+        time_limit: int,
+        table_name: str,
+        parquet_file: "ExportFile",
+        schema: t.Optional[t.List[SchemaField]] = None,
+    ):
+        """Load a Parquet file into a BigQuery table.
+
+        Args:
+            write_disposition: Write disposition for the BigQuery table.
+            time_limit: The maximum time to wait for the load job to complete.
+            table_name: The table name in BigQuery.
+            parquet_file: The Parquet file to load into BigQuery.
+            schema: The schema of the table, if it may need to be created.
+        """
+
+        cls._load_file_into_bq(
+            time_limit=time_limit,
+            table_name=table_name,
+            file=parquet_file,
+            job_config=LoadJobConfig(
+                create_disposition=CreateDisposition.CREATE_IF_NEEDED,
+                source_format=SourceFormat.PARQUET,
+                write_disposition=write_disposition,
+            ),
+            schema=schema,
         )
 
+    def get_export_file_path(
+        self,
+        table_name: str,
+        task_args: t.Tuple[t.Any, ...],
+        task_kwargs: KwArgs,
+    ):
+        """Get the path of the file this task's queryset is exported to.
+
+        The path is the same for each retry of the task so that the file can be
+        reused if the task is retried after the queryset was exported. If the
+        task has no ID, such as when it's called directly, the path is derived
+        from the task's arguments instead.
+
+        Args:
+            table_name: The table name in BigQuery.
+            task_args: The task's positional arguments.
+            task_kwargs: The task's keyword arguments.
+
+        Returns:
+            The path of the export file in the temporary directory.
+        """
+
+        suffix = f".{self.settings.format.lower()}"
+        if self.settings.gzip:
+            suffix += ".gz"
+
+        task_id = self.request.id
+        if not task_id:
+            task_id = sha256(
+                repr(
+                    (self.name, task_args, sorted(task_kwargs.items()))
+                ).encode()
+            ).hexdigest()
+
+        return os.path.join(
+            gettempdir(), f"bigquery.{table_name}.{task_id}{suffix}"
+        )
+
+    @staticmethod
+    def gzip_file(file_path: str, gzip_file_path: str):
+        """Compress a file with gzip.
+
+        Args:
+            file_path: The path of the file to compress.
+            gzip_file_path: The path of the compressed file to create.
+        """
+
+        # Write to a partial file first so that a compressed file is never left
+        # half-written.
+        partial_file_path = f"{gzip_file_path}.partial"
+        with open(file_path, "rb") as file, gzip.open(
+            partial_file_path, "wb", compresslevel=GZIP_COMPRESSLEVEL
+        ) as gzip_file:
+            shutil.copyfileobj(file, gzip_file)
+
+        os.replace(partial_file_path, gzip_file_path)
+
+    def export_queryset_to_file_path(
+        self, queryset: QuerySet[t.Any], export_file_path: str
+    ):
+        """Export a queryset to a file which is kept until it's deleted.
+
+        The file is only created once the export is complete.
+
+        Args:
+            queryset: The queryset to export.
+            export_file_path: The path of the file to create.
+
+        Returns:
+            Whether any values were exported. If not, no file is created.
+        """
+
+        # pylint: disable-next=consider-using-with
+        export_file = NamedTemporaryFile(
+            mode="w+b",
+            suffix=f".{self.settings.format.lower()}",
+            dir=os.path.dirname(export_file_path),
+            delete=False,
+        )
+
+        try:
+            with export_file:
+                wrote_values = self.export_queryset(queryset, export_file)
+
+            if wrote_values:
+                if self.settings.gzip:
+                    self.gzip_file(export_file.name, export_file_path)
+                else:
+                    os.replace(export_file.name, export_file_path)
+        finally:
+            if os.path.exists(export_file.name):
+                os.remove(export_file.name)
+
+        return wrote_values
+
     @staticmethod
     # pylint: disable-next=too-many-locals,bad-staticmethod-argument
     def _load_data_into_bq(
@@ -320,22 +1149,83 @@ class BigQueryTask(Task):
     ):
         queryset = self.get_ordered_queryset(*task_args, **task_kwargs)
 
-        with NamedTemporaryFile(
-            mode="w+b", suffix=".csv", delete=True
-        ) as csv_file:
-            if self.write_queryset_to_csv(
-                fields=self.settings.fields,
-                chunk_size=self.settings.chunk_size,
-                queryset=queryset,
-                csv_file=csv_file,
-            ):
-                self.load_csv_into_bq(
-                    write_disposition=self.settings.write_disposition,
+        write_disposition = self.settings.write_disposition
+        load_table_name = table_name
+        schema: t.Optional[t.List[SchemaField]] = None
+        merge = False
+        if self.settings.watermark_field:
+            watermark = self.get_watermark(
+                watermark_field=self.settings.watermark_field,
+                time_limit=self.settings.time_limit,
+                table_name=table_name,
+            )
+            if watermark is not None:
+                # Merging dedupes the rows at the watermark, so they're exported
+                # again in case more rows with the same value were committed.
+                lookup = "gte" if self.settings.merge else "gt"
+                logging.info(
+                    "Exporting rows from watermark %s (%s).", watermark, lookup
+                )
+                queryset = queryset.filter(
+                    **{f"{self.settings.watermark_field}__{lookup}": watermark}
+                )
+
+                # Merge the new rows through a staging table. If there's no
+                # watermark, the table is empty or missing so there's nothing
+                # to merge with.
+                if self.settings.merge:
+                    write_disposition = WriteDisposition.WRITE_TRUNCATE
+                    load_table_name = f"{table_name}__staging"
+                    # The staging table is created with the table's schema.
+                    schema = self.get_table_schema(
+                        fields=self.settings.fields,
+                        time_limit=self.settings.time_limit,
+                        table_name=table_name,
+                    )
+                    merge = True
+
+        load_into_bq = (
+            self.load_parquet_into_bq
+            if self.settings.format == SourceFormat.PARQUET
+            else self.load_csv_into_bq
+        )
+
+        # Reuse the export of a previous attempt so only loading is retried.
+        export_file_path = self.get_export_file_path(
+            table_name, task_args, task_kwargs
+        )
+        if os.path.exists(export_file_path):
+            logging.info("Reusing exported file %s.", export_file_path)
+        elif not self.export_queryset_to_file_path(queryset, export_file_path):
+            return
+
+        with open(export_file_path, "rb") as export_file:
+            load_into_bq(
+                write_disposition,
+                self.settings.time_limit,
+                load_table_name,
+                t.cast("ExportFile", export_file),
+                schema=schema,
+            )
+
+        if merge:
+            try:
+                self.merge_into_bq(
+                    fields=self.settings.fields,
+                    id_field=self.settings.id_field,
                     time_limit=self.settings.time_limit,
                     table_name=table_name,
-                    csv_file=csv_file,
+                    staging_table_name=load_table_name,
+                )
+            finally:
+                # Don't leave staging tables behind in the dataset.
+                self.delete_table(
+                    time_limit=self.settings.time_limit,
+                    table_name=load_table_name,
                 )
 
+        os.remove(export_file_path)
+
     @classmethod
     def shared(cls, settings: Settings):
         """Create a shared BigQuery task.
@@ -380,6 +1270,14 @@ class BigQueryTask(Task):
                         self, table_name, *task_args, **task_kwargs
                     )
                 except Exception as exc:
+                    # Delete the exported file if the task won't be retried.
+                    if self.request.retries >= settings.max_retries:
+                        export_file_path = self.get_export_file_path(
+                            table_name, task_args, task_kwargs
+                        )
+                        if os.path.exists(export_file_path):
+                            os.remove(export_file_path)
+
                     raise self.retry(
                         args=task_args,
                         kwargs=task_kwargs,
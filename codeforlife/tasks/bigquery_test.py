@@ -4,21 +4,30 @@ Created on 02/10/2025 at 17:22:38(+01:00).
 """
 
 import csv
+import gzip
 import io
+import logging
 import os
 import typing as t
 from datetime import date, datetime, time, timedelta, timezone
-from tempfile import NamedTemporaryFile
-from unittest.mock import MagicMock
+from tempfile import NamedTemporaryFile, gettempdir
+from time import perf_counter
+from unittest.mock import ANY, MagicMock
 
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
 from celery import Celery
 from django.conf import settings
+from django.db import connection
+from django.db.models import DurationField, JSONField, Value
 from django.db.models.query import QuerySet
-from google.cloud.bigquery import CreateDisposition, SourceFormat
+from django.test.utils import CaptureQueriesContext
+from google.api_core.exceptions import NotFound
+from google.cloud.bigquery import CreateDisposition, SchemaField, SourceFormat
 
 from ..tests import CeleryTestCase
 from ..types import KwArgs
-from ..user.models import User
+from ..user.models import School, User
 from .bigquery import BigQueryTask
 
 if t.TYPE_CHECKING:
@@ -35,6 +44,13 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
 
     append_users: BigQueryTask
     truncate_users: BigQueryTask
+    parquet_users: BigQueryTask
+    incremental_users: BigQueryTask
+    merge_users: BigQueryTask
+    sharded_users: BigQueryTask
+    sharded_parquet_users: BigQueryTask
+    gzip_users: BigQueryTask
+    unretried_users: BigQueryTask
 
     @staticmethod
     def _get_users(order_by: t.Optional[str] = None):
@@ -65,6 +81,85 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
             )
         )(cls._get_users)
 
+        cls.parquet_users = BigQueryTask.shared(
+            BigQueryTask.Settings(
+                table_name="user__parquet",
+                write_disposition=BigQueryTask.WriteDisposition.WRITE_TRUNCATE,
+                chunk_size=10,
+                fields=["first_name", "is_active", "last_login"],
+                format=BigQueryTask.SourceFormat.PARQUET,
+                kwargs={"name": "parquet_users"},
+            )
+        )(cls._get_users)
+
+        cls.incremental_users = BigQueryTask.shared(
+            BigQueryTask.Settings(
+                table_name="user__incremental",
+                write_disposition=BigQueryTask.WriteDisposition.WRITE_APPEND,
+                chunk_size=10,
+                fields=["first_name", "is_active"],
+                watermark_field="id",
+                kwargs={"name": "incremental_users"},
+            )
+        )(cls._get_users)
+
+        cls.merge_users = BigQueryTask.shared(
+            BigQueryTask.Settings(
+                table_name="user__merge",
+                write_disposition=BigQueryTask.WriteDisposition.WRITE_APPEND,
+                chunk_size=10,
+                fields=["first_name", "is_active"],
+                watermark_field="date_joined",
+                merge=True,
+                kwargs={"name": "merge_users"},
+            )
+        )(cls._get_users)
+
+        cls.sharded_users = BigQueryTask.shared(
+            BigQueryTask.Settings(
+                table_name="user__sharded",
+                write_disposition=BigQueryTask.WriteDisposition.WRITE_TRUNCATE,
+                chunk_size=10,
+                fields=["first_name", "is_active"],
+                shards=3,
+                kwargs={"name": "sharded_users"},
+            )
+        )(cls._get_users)
+
+        cls.sharded_parquet_users = BigQueryTask.shared(
+            BigQueryTask.Settings(
+                table_name="user__sharded_parquet",
+                write_disposition=BigQueryTask.WriteDisposition.WRITE_TRUNCATE,
+                chunk_size=10,
+                fields=["first_name", "is_active", "last_login"],
+                format=BigQueryTask.SourceFormat.PARQUET,
+                shards=3,
+                kwargs={"name": "sharded_parquet_users"},
+            )
+        )(cls._get_users)
+
+        cls.gzip_users = BigQueryTask.shared(
+            BigQueryTask.Settings(
+                table_name="user__gzip",
+                write_disposition=BigQueryTask.WriteDisposition.WRITE_TRUNCATE,
+                chunk_size=10,
+                fields=["first_name", "is_active"],
+                gzip=True,
+                kwargs={"name": "gzip_users"},
+            )
+        )(cls._get_users)
+
+        cls.unretried_users = BigQueryTask.shared(
+            BigQueryTask.Settings(
+                table_name="user__unretried",
+                write_disposition=BigQueryTask.WriteDisposition.WRITE_TRUNCATE,
+                chunk_size=10,
+                fields=["first_name", "is_active"],
+                max_retries=0,
+                kwargs={"name": "unretried_users"},
+            )
+        )(cls._get_users)
+
         return super().setUpClass()
 
     def setUp(self):
@@ -76,7 +171,7 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
         self.csv_file = NamedTemporaryFile(
             mode="w+b", suffix=".csv", delete=False
         )
-        self.addCleanup(os.remove, self.csv_file.name)
+        self.addCleanup(self._remove_file, self.csv_file.name)
         self.mock_named_temporary_file = self.patch(
             target("NamedTemporaryFile"), return_value=self.csv_file
         )
@@ -99,7 +194,7 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
             self.mock_bq_client.load_table_from_file
         )
         self.mock_load_job = MagicMock()
-        self.mock_load_table_from_file.return_value = self.mock_load_job
+        self.mock_load_table_from_file.side_effect = self._load_table_from_file
         self.mock_load_job_result: MagicMock = self.mock_load_job.result
         self.job_config = MagicMock()
         self.mock_load_job_config_class = self.patch(
@@ -108,6 +203,18 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
 
         return super().setUp()
 
+    @staticmethod
+    def _remove_file(file_path: str):
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    # pylint: disable-next=unused-argument
+    def _load_table_from_file(self, file_obj: io.BufferedReader, **kwargs):
+        # Keep a copy of the loaded file as it's deleted after it's loaded.
+        self.loaded_file_path = file_obj.name
+        self.loaded_file = io.BytesIO(file_obj.read())
+        return self.mock_load_job
+
     # assertions
 
     def _assert_queryset_written_to_csv(
@@ -139,6 +246,29 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
         # Assert the actual CSV content matches the expected content.
         assert actual_content == expected_content
 
+    def _assert_queryset_written_to_parquet(
+        self,
+        queryset: QuerySet[t.Any],
+        fields: t.List[str],
+        parquet_file: t.Optional[CsvFile] = None,
+    ):
+        parquet_file = parquet_file or self.csv_file
+        parquet_file.seek(0)
+        table = pq.read_table(parquet_file)
+
+        assert table.column_names == fields
+        assert table.to_pylist() == [
+            {
+                field: (
+                    value.astimezone(timezone.utc).replace(tzinfo=None)
+                    if isinstance(value, datetime)
+                    else value
+                )
+                for field, value in zip(fields, values)
+            }
+            for values in queryset.values_list(*fields)
+        ]
+
     def _assert_csv_file_loaded_into_bigquery(
         self,
         table_name: str,
@@ -207,6 +337,47 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
             write_disposition="WRITE_INVALID",
         )
 
+    def test_settings__format_not_supported(self):
+        """Format must be supported."""
+        self._test_settings(
+            code="format_not_supported",
+            format=BigQueryTask.SourceFormat.ORC,
+        )
+
+    def test_settings__watermark_write_disposition_not_append(self):
+        """Write disposition must be WRITE_APPEND when exporting incrementally."""
+        self._test_settings(
+            code="watermark_write_disposition_not_append",
+            write_disposition=BigQueryTask.WriteDisposition.WRITE_TRUNCATE,
+            watermark_field="id",
+        )
+
+    def test_settings__merge_without_watermark_field(self):
+        """Must provide a watermark field to merge."""
+        self._test_settings(code="merge_without_watermark_field", merge=True)
+
+    def test_settings__watermark_field(self):
+        """The watermark field is always present."""
+        settings = BigQueryTask.Settings(
+            write_disposition=BigQueryTask.WriteDisposition.WRITE_APPEND,
+            chunk_size=10,
+            fields=["first_name"],
+            watermark_field="last_login",
+        )
+        assert settings.fields == ["first_name", "id", "last_login"]
+
+    def test_settings__gzip_not_csv(self):
+        """Only CSV files can be compressed with gzip."""
+        self._test_settings(
+            code="gzip_not_csv",
+            format=BigQueryTask.SourceFormat.PARQUET,
+            gzip=True,
+        )
+
+    def test_settings__shards_lt_1(self):
+        """Number of shards must be >= 1."""
+        self._test_settings(code="shards_lt_1", shards=0)
+
     def test_settings__chunk_size_lte_0(self):
         """Chunk size must be > 0."""
         self._test_settings(code="chunk_size_lte_0", chunk_size=0)
@@ -315,6 +486,156 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
         """Orders the queryset if not already ordered. The default is by ID."""
         self._test_get_ordered_queryset()
 
+    # get_watermark
+
+    def _test_get_watermark(self, value: t.Any, watermark: t.Any):
+        self.mock_bq_client.query.return_value.result.return_value = [(value,)]
+
+        assert watermark == BigQueryTask.get_watermark(
+            watermark_field="last_login", time_limit=60, table_name="user"
+        )
+
+        self.mock_bq_client.query.assert_called_once_with(
+            "SELECT MAX(`last_login`) FROM `"
+            + BigQueryTask.get_full_table_id("user")
+            + "`"
+        )
+
+    def test_get_watermark(self):
+        """Gets the greatest value of the watermark field."""
+        self._test_get_watermark(value=10, watermark=10)
+
+    def test_get_watermark__datetime(self):
+        """Datetimes without a timezone are in UTC."""
+        value = datetime(year=2025, month=2, day=1, hour=12)
+        self._test_get_watermark(
+            value=value, watermark=value.replace(tzinfo=timezone.utc)
+        )
+
+    def test_get_watermark__not_found(self):
+        """There's no watermark if the table does not exist."""
+        self.mock_bq_client.query.side_effect = NotFound("Table not found.")
+
+        assert (
+            BigQueryTask.get_watermark(
+                watermark_field="id", time_limit=60, table_name="user"
+            )
+            is None
+        )
+
+    # get_shard_querysets
+
+    def _test_get_shard_querysets(
+        self, queryset: QuerySet[User], shards: int, expected_shards: int
+    ):
+        shard_querysets = BigQueryTask.get_shard_querysets(
+            queryset, id_field="id", shards=shards
+        )
+        assert len(shard_querysets) == expected_shards
+
+        # Assert the shards are consecutive ranges of all the rows.
+        shard_ids = [
+            list(shard_queryset.order_by("id").values_list("id", flat=True))
+            for shard_queryset in shard_querysets
+        ]
+        assert [_id for ids in shard_ids for _id in ids] == list(
+            queryset.order_by("id").values_list("id", flat=True)
+        )
+
+        return shard_ids
+
+    def test_get_shard_querysets(self):
+        """Splits the rows evenly by their IDs."""
+        queryset = User.objects.all()
+        assert queryset.count() == 4
+        shard_ids = self._test_get_shard_querysets(
+            queryset, shards=2, expected_shards=2
+        )
+        assert [len(ids) for ids in shard_ids] == [2, 2]
+
+    def test_get_shard_querysets__keyset(self):
+        """Each bound is found by stepping from the previous bound."""
+        queryset = User.objects.all()
+        assert queryset.count() == 4
+        with CaptureQueriesContext(connection) as queries:
+            shard_ids = self._test_get_shard_querysets(
+                queryset, shards=4, expected_shards=4
+            )
+        assert [len(ids) for ids in shard_ids] == [1, 1, 1, 1]
+
+        # The count and then one step of 1 row per bound.
+        bound_queries = [query["sql"] for query in queries.captured_queries][
+            1:4
+        ]
+        assert all("OFFSET 1" in sql for sql in bound_queries)
+        assert all(">=" in sql for sql in bound_queries[1:])
+
+    def test_get_shard_querysets__fewer_rows(self):
+        """There are no more shards than rows."""
+        self._test_get_shard_querysets(
+            User.objects.all(), shards=10, expected_shards=4
+        )
+
+    def test_get_shard_querysets__none(self):
+        """An empty queryset has one empty shard."""
+        self._test_get_shard_querysets(
+            User.objects.none(), shards=2, expected_shards=1
+        )
+
+    # get_csv_formatters
+
+    def test_get_csv_formatters(self):
+        """The formatters are chosen from the model fields' types."""
+        assert BigQueryTask.get_csv_formatters(
+            fields=[
+                "id",
+                "first_name",
+                "is_active",
+                "date_joined",
+                "new_teacher__school",
+                "duration",
+            ],
+            queryset=User.objects.annotate(
+                duration=Value(timedelta(), output_field=DurationField())
+            ),
+        ) == [
+            None,
+            None,
+            None,
+            BigQueryTask.format_datetime_for_csv,
+            None,
+            BigQueryTask.format_value_for_csv,
+        ]
+
+    def test_get_csv_formatters__unresolved(self):
+        """Fields which aren't model fields are formatted by value."""
+        assert BigQueryTask.get_csv_formatters(
+            fields=["pk", "date_joined__year", "first_name__lower"],
+            queryset=User.objects.all(),
+        ) == [
+            None,
+            BigQueryTask.format_value_for_csv,
+            BigQueryTask.format_value_for_csv,
+        ]
+
+    def test_get_model_field(self):
+        """Resolves primary keys and relations, but not transforms."""
+        queryset = User.objects.all()
+        assert BigQueryTask.get_model_field(queryset, "pk") == (
+            User._meta.pk  # pylint: disable=protected-access
+        )
+        assert (
+            BigQueryTask.get_model_field(queryset, "new_teacher__school__pk")
+            == School._meta.pk
+        )  # pylint: disable=protected-access
+        assert (
+            BigQueryTask.get_model_field(queryset, "date_joined__year") is None
+        )
+        assert (
+            BigQueryTask.get_model_field(queryset, "first_name__lower") is None
+        )
+        assert BigQueryTask.get_model_field(queryset, "not_a_field") is None
+
     # write_queryset_to_csv
 
     def _test_write_queryset_to_csv(
@@ -338,12 +659,223 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
         assert queryset.exists()
         self._test_write_queryset_to_csv(queryset, fields=["first_name"])
 
+    def test_write_queryset_to_csv__transforms(self):
+        """Primary keys and transformed values are written to the CSV file."""
+        queryset = User.objects.order_by("pk")
+        fields = ["pk", "date_joined__year", "date_joined__date"]
+        assert BigQueryTask.write_queryset_to_csv(
+            fields=fields,
+            chunk_size=10,
+            queryset=queryset,
+            csv_file=self.csv_file,
+        )
+
+        self.csv_file.seek(0)
+        assert self.csv_file.read().decode("utf-8") == "\n".join(
+            [
+                ",".join(fields),
+                *(
+                    f"{pk},{year},{day.isoformat()}"
+                    for pk, year, day in queryset.values_list(*fields)
+                ),
+            ]
+        )
+
+    def test_write_queryset_to_csv__benchmark(self):
+        """
+        Benchmark formatting values by column against formatting each value by
+        its type. Both must write the same CSV.
+        """
+        fields = ["id", "first_name", "is_active", "date_joined", "last_login"]
+        date_joined = datetime(
+            year=2025, month=2, day=1, hour=12, minute=30, second=15
+        ).replace(tzinfo=timezone(timedelta(hours=1)))
+        rows = [
+            (
+                row_index,
+                f"name {row_index}",
+                row_index % 2 == 0,
+                date_joined + timedelta(seconds=row_index),
+                None if row_index % 3 else date_joined,
+            )
+            for row_index in range(20000)
+        ]
+
+        queryset = User.objects.all()
+        self.patch_object(
+            queryset,
+            "values_list",
+            side_effect=lambda *_: MagicMock(
+                iterator=MagicMock(side_effect=lambda _: iter(rows))
+            ),
+        )
+
+        def format_value(value: t.Any):
+            if value is None:
+                return ""
+            if isinstance(value, datetime):
+                return (
+                    value.astimezone(timezone.utc)
+                    .replace(tzinfo=None)
+                    .isoformat(sep=" ")
+                )
+            if isinstance(value, (date, time)):
+                return value.isoformat()
+            if not isinstance(value, str):
+                return str(value)
+            return value
+
+        def write_per_value(csv_file: io.BytesIO):
+            text_wrapper = io.TextIOWrapper(
+                csv_file, encoding="utf-8", newline=""
+            )
+            csv_writer = csv.writer(
+                text_wrapper, lineterminator="\n", quoting=csv.QUOTE_MINIMAL
+            )
+            csv_writer.writerow(fields)
+            for values in queryset.values_list(*fields).iterator(1000):
+                csv_writer.writerow([format_value(value) for value in values])
+            text_wrapper.seek(text_wrapper.tell() - 1)
+            text_wrapper.truncate()
+            text_wrapper.detach()
+
+        def write_per_column(csv_file: io.BytesIO):
+            BigQueryTask.write_queryset_to_csv(
+                fields=fields,
+                chunk_size=1000,
+                queryset=queryset,
+                csv_file=t.cast("_TemporaryFileWrapper[bytes]", csv_file),
+            )
+
+        def benchmark(write: t.Callable[[io.BytesIO], None]):
+            csv_file = io.BytesIO()
+            start = perf_counter()
+            write(csv_file)
+            logging.info(
+                "%s: %d rows/s",
+                write.__name__,
+                len(rows) / (perf_counter() - start),
+            )
+            return csv_file.getvalue()
+
+        assert benchmark(write_per_value) == benchmark(write_per_column)
+
     def test_write_queryset_to_csv__none(self):
         """No values are written to the CSV file."""
         queryset = User.objects.none()
         assert not queryset.exists()
         self._test_write_queryset_to_csv(queryset, fields=["first_name"])
 
+    # get_arrow_schema
+
+    def test_get_arrow_schema(self):
+        """The Arrow types are derived from the model fields."""
+        schema, converters = BigQueryTask.get_arrow_schema(
+            fields=[
+                "id",
+                "is_active",
+                "date_joined",
+                "first_name",
+                "new_teacher",
+                "new_teacher__school",
+            ],
+            queryset=User.objects.all(),
+        )
+
+        assert schema.types == [
+            pa.int64(),
+            pa.bool_(),
+            pa.timestamp("us"),
+            pa.string(),
+            pa.int64(),  # The teacher's ID.
+            pa.int64(),  # The school's ID.
+        ]
+        assert converters == [None] * 6
+
+    def test_get_arrow_schema__fallback(self):
+        """Fields without an Arrow type are converted to strings."""
+        schema, converters = BigQueryTask.get_arrow_schema(
+            fields=["data", "duration"],
+            queryset=User.objects.annotate(
+                data=Value({}, output_field=JSONField()),
+                duration=Value(timedelta(), output_field=DurationField()),
+            ),
+        )
+
+        assert schema.types == [pa.string(), pa.string()]
+        json_converter, duration_converter = converters
+        assert json_converter
+        assert json_converter({"a": 1}) == '{"a": 1}'
+        assert duration_converter is str
+
+    def test_get_arrow_schema__unresolved(self):
+        """Fields which aren't model fields are converted to strings."""
+        schema, converters = BigQueryTask.get_arrow_schema(
+            fields=["pk", "date_joined__year", "date_joined__date"],
+            queryset=User.objects.all(),
+        )
+
+        assert schema.types == [pa.int64(), pa.string(), pa.string()]
+        assert converters == [
+            None,
+            BigQueryTask.format_value_for_csv,
+            BigQueryTask.format_value_for_csv,
+        ]
+
+    # write_queryset_to_parquet
+
+    def _test_write_queryset_to_parquet(
+        self,
+        queryset: QuerySet[t.Any],
+        fields: t.List[str],
+        chunk_size: int = 10,
+    ):
+        assert queryset.exists() == BigQueryTask.write_queryset_to_parquet(
+            fields=fields,
+            chunk_size=chunk_size,
+            queryset=queryset,
+            parquet_file=self.csv_file,
+        )
+
+        self._assert_queryset_written_to_parquet(queryset, fields)
+
+    def test_write_queryset_to_parquet__all(self):
+        """Values are written to the Parquet file in row groups."""
+        queryset = User.objects.order_by("id")
+        assert queryset.count() > 2
+        self._test_write_queryset_to_parquet(
+            queryset,
+            fields=["id", "first_name", "date_joined", "last_login"],
+            chunk_size=2,
+        )
+
+        assert pq.ParquetFile(self.csv_file).num_row_groups == (
+            (queryset.count() + 1) // 2
+        )
+
+    def test_write_queryset_to_parquet__transforms(self):
+        """Primary keys and transformed values are written as text."""
+        queryset = User.objects.order_by("pk")
+        fields = ["pk", "date_joined__year"]
+        assert BigQueryTask.write_queryset_to_parquet(
+            fields=fields,
+            chunk_size=2,
+            queryset=queryset,
+            parquet_file=self.csv_file,
+        )
+
+        self.csv_file.seek(0)
+        assert pq.read_table(self.csv_file).to_pylist() == [
+            {"pk": pk, "date_joined__year": str(year)}
+            for pk, year in queryset.values_list(*fields)
+        ]
+
+    def test_write_queryset_to_parquet__none(self):
+        """No values are written to the Parquet file."""
+        queryset = User.objects.none()
+        assert not queryset.exists()
+        self._test_write_queryset_to_parquet(queryset, fields=["first_name"])
+
     # shared
 
     def _test_shared__write(self, task: BigQueryTask):
@@ -351,12 +883,12 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
 
         # Assert CSV file was created.
         self.mock_named_temporary_file.assert_called_once_with(
-            mode="w+b", suffix=".csv", delete=True
+            mode="w+b", suffix=".csv", dir=gettempdir(), delete=False
         )
 
         # Assert queryset was written to CSV.
         assert self.csv_file.closed
-        with open(self.csv_file.name, "rb") as csv_file:
+        with self.loaded_file as csv_file:
             self._assert_queryset_written_to_csv(
                 queryset=task.get_ordered_queryset(),
                 fields=task.settings.fields,
@@ -367,8 +899,10 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
             table_name=task.settings.table_name or task.get_queryset.__name__,
             token_lifetime_seconds=task.settings.time_limit,
             write_disposition=task.settings.write_disposition,
-            csv_file=self.csv_file,
+            csv_file=ANY,
         )
+        # Assert the exported file was deleted after it was loaded.
+        assert not os.path.exists(self.loaded_file_path)
 
     def test_shared__write_append(self):
         """The append_users task writes data to BigQuery in append mode."""
@@ -377,3 +911,270 @@ class TestLoadDataIntoBigQueryTask(CeleryTestCase):
     def test_shared__write_truncate(self):
         """The append_users task writes data to BigQuery in truncate mode."""
         self._test_shared__write(self.truncate_users)
+
+    def test_shared__parquet(self):
+        """The parquet_users task writes data to BigQuery as Parquet."""
+        task = self.parquet_users
+        self.apply_task(name=task.name)
+
+        # Assert Parquet file was created.
+        self.mock_named_temporary_file.assert_called_once_with(
+            mode="w+b", suffix=".parquet", dir=gettempdir(), delete=False
+        )
+
+        # Assert queryset was written to Parquet.
+        assert self.csv_file.closed
+        with self.loaded_file as parquet_file:
+            self._assert_queryset_written_to_parquet(
+                queryset=task.get_ordered_queryset(),
+                fields=task.settings.fields,
+                parquet_file=parquet_file,
+            )
+
+        # Assert load job was created and run.
+        self.mock_load_job_config_class.assert_called_once_with(
+            create_disposition=CreateDisposition.CREATE_IF_NEEDED,
+            source_format=SourceFormat.PARQUET,
+            write_disposition=task.settings.write_disposition,
+        )
+        self.mock_load_table_from_file.assert_called_once_with(
+            file_obj=ANY,
+            destination=".".join(
+                [
+                    settings.GOOGLE_CLOUD_PROJECT_ID,
+                    settings.GOOGLE_CLOUD_BIGQUERY_DATASET_ID,
+                    "user__parquet",
+                ]
+            ),
+            job_config=self.job_config,
+        )
+        self.mock_load_job_result.assert_called_once_with()
+
+    def test_shared__incremental(self):
+        """The incremental_users task only appends rows after the watermark."""
+        task = self.incremental_users
+        queryset = task.get_ordered_queryset()
+        watermark = t.cast(User, queryset.first()).id
+        self.mock_bq_client.query.return_value.result.return_value = [
+            (watermark,)
+        ]
+
+        self.apply_task(name=task.name)
+
+        with self.loaded_file as csv_file:
+            self._assert_queryset_written_to_csv(
+                queryset=queryset.filter(id__gt=watermark),
+                fields=task.settings.fields,
+                csv_file=csv_file,
+            )
+
+        self.mock_load_job_config_class.assert_called_once()
+        assert (
+            self.mock_load_job_config_class.call_args.kwargs[
+                "write_disposition"
+            ]
+            == BigQueryTask.WriteDisposition.WRITE_APPEND
+        )
+        self.mock_load_table_from_file.assert_called_once_with(
+            file_obj=ANY,
+            destination=BigQueryTask.get_full_table_id("user__incremental"),
+            job_config=self.job_config,
+        )
+        # Only the watermark was queried.
+        self.mock_bq_client.query.assert_called_once()
+
+    def test_shared__incremental__no_watermark(self):
+        """The merge_users task loads all rows if the table does not exist."""
+        task = self.merge_users
+        self.mock_bq_client.query.side_effect = NotFound("Table not found.")
+
+        self.apply_task(name=task.name)
+
+        with self.loaded_file as csv_file:
+            self._assert_queryset_written_to_csv(
+                queryset=task.get_ordered_queryset(),
+                fields=task.settings.fields,
+                csv_file=csv_file,
+            )
+
+        self.mock_load_table_from_file.assert_called_once_with(
+            file_obj=ANY,
+            destination=BigQueryTask.get_full_table_id("user__merge"),
+            job_config=self.job_config,
+        )
+
+    def test_shared__incremental__merge(self):
+        """The merge_users task merges rows after the watermark by their ID."""
+        task = self.merge_users
+        queryset = task.get_ordered_queryset()
+        watermark = t.cast(User, queryset.first()).date_joined
+        mock_query = self.mock_bq_client.query
+        mock_query.return_value.result.return_value = [(watermark,)]
+        schema = [
+            SchemaField(field, "STRING")
+            for field in reversed(task.settings.fields)
+        ]
+        mock_get_table = self.mock_bq_client.get_table
+        mock_get_table.return_value.schema = schema
+
+        self.apply_task(name=task.name)
+
+        with self.loaded_file as csv_file:
+            self._assert_queryset_written_to_csv(
+                # The rows at the watermark are exported again.
+                queryset=queryset.filter(date_joined__gte=watermark),
+                fields=task.settings.fields,
+                csv_file=csv_file,
+            )
+
+        # Assert the rows were loaded into the staging table.
+        assert (
+            self.mock_load_job_config_class.call_args.kwargs[
+                "write_disposition"
+            ]
+            == BigQueryTask.WriteDisposition.WRITE_TRUNCATE
+        )
+        staging_table_id = BigQueryTask.get_full_table_id(
+            "user__merge__staging"
+        )
+        self.mock_load_table_from_file.assert_called_once_with(
+            file_obj=ANY,
+            destination=staging_table_id,
+            job_config=self.job_config,
+        )
+        # Assert the staging table is created with the table's schema.
+        mock_get_table.assert_called_once_with(
+            BigQueryTask.get_full_table_id("user__merge")
+        )
+        assert self.job_config.schema == schema[::-1]
+
+        # Assert the staging table was merged into the table.
+        assert mock_query.call_count == 2
+        merge_query: str = mock_query.call_args.args[0]
+        assert merge_query.startswith(
+            f"MERGE `{BigQueryTask.get_full_table_id('user__merge')}` T"
+            f" USING `{staging_table_id}` S ON T.`id` = S.`id`"
+        )
+        assert (
+            " WHEN MATCHED THEN UPDATE SET `first_name` = S.`first_name`,"
+            " `is_active` = S.`is_active`, `date_joined` = S.`date_joined`"
+        ) in merge_query
+
+        # Assert the staging table was deleted.
+        self.mock_bq_client.delete_table.assert_called_once_with(
+            staging_table_id, not_found_ok=True
+        )
+
+    def _test_shared__sharded(self, task: BigQueryTask):
+        # Export the shards sequentially so they share the test's transaction.
+        mock_executor_class = self.patch(
+            f"{BigQueryTask.__module__}.ThreadPoolExecutor"
+        )
+        mock_executor = mock_executor_class.return_value.__enter__.return_value
+        mock_executor.map.side_effect = map
+
+        self.apply_task(name=task.name)
+
+        mock_executor_class.assert_called_once_with(
+            max_workers=task.settings.shards
+        )
+        mock_executor.map.assert_called_once()
+
+        self.mock_load_table_from_file.assert_called_once_with(
+            file_obj=ANY,
+            destination=BigQueryTask.get_full_table_id(
+                t.cast(str, task.settings.table_name)
+            ),
+            job_config=self.job_config,
+        )
+
+    def test_shared__sharded(self):
+        """The sharded_users task combines its shards into one CSV file."""
+        task = self.sharded_users
+        self._test_shared__sharded(task)
+        with self.loaded_file as csv_file:
+            self._assert_queryset_written_to_csv(
+                queryset=task.get_ordered_queryset(),
+                fields=task.settings.fields,
+                csv_file=csv_file,
+            )
+
+    def test_shared__sharded__parquet(self):
+        """
+        The sharded_parquet_users task combines its shards into one Parquet
+        file.
+        """
+        task = self.sharded_parquet_users
+        self._test_shared__sharded(task)
+        with self.loaded_file as parquet_file:
+            self._assert_queryset_written_to_parquet(
+                queryset=task.get_ordered_queryset(),
+                fields=task.settings.fields,
+                parquet_file=parquet_file,
+            )
+
+    def test_shared__gzip(self):
+        """The gzip_users task uploads a gzip-compressed CSV file."""
+        task = self.gzip_users
+        self.apply_task(name=task.name)
+
+        assert self.loaded_file_path.endswith(".csv.gz")
+        assert not os.path.exists(self.loaded_file_path)
+        with gzip.open(self.loaded_file) as csv_file:
+            self._assert_queryset_written_to_csv(
+                queryset=task.get_ordered_queryset(),
+                fields=task.settings.fields,
+                csv_file=t.cast(CsvFile, csv_file),
+            )
+
+    def test_get_export_file_path__no_task_id(self):
+        """Without a task ID, the path is derived from the task's arguments."""
+        task = self.append_users
+        assert not task.request.id
+
+        path = task.get_export_file_path("user", (1,), {"a": 2, "b": 3})
+        assert path == task.get_export_file_path("user", (1,), {"b": 3, "a": 2})
+        assert path != task.get_export_file_path("user", (2,), {"a": 2, "b": 3})
+
+    def test_shared__retry(self):
+        """A retry reuses the exported file and only retries loading it."""
+        task = self.append_users
+        load_table_from_file = self.mock_load_table_from_file.side_effect
+        loaded_file_paths: t.List[str] = []
+
+        def fail_once(file_obj: io.BufferedReader, **kwargs):
+            loaded_file_paths.append(file_obj.name)
+            if len(loaded_file_paths) == 1:
+                raise ConnectionError("Upload failed.")
+            return load_table_from_file(file_obj, **kwargs)
+
+        self.mock_load_table_from_file.side_effect = fail_once
+
+        self.apply_task(name=task.name)
+
+        # Assert the queryset was exported once and loaded twice.
+        self.mock_named_temporary_file.assert_called_once()
+        assert len(loaded_file_paths) == 2
+        assert loaded_file_paths[0] == loaded_file_paths[1]
+        assert not os.path.exists(self.loaded_file_path)
+        with self.loaded_file as csv_file:
+            self._assert_queryset_written_to_csv(
+                queryset=task.get_ordered_queryset(),
+                fields=task.settings.fields,
+                csv_file=csv_file,
+            )
+
+    def test_shared__retries_exceeded(self):
+        """The exported file is deleted if the task won't be retried."""
+        loaded_file_paths: t.List[str] = []
+
+        def fail(file_obj: io.BufferedReader, **_):
+            loaded_file_paths.append(file_obj.name)
+            raise ConnectionError("Upload failed.")
+
+        self.mock_load_table_from_file.side_effect = fail
+
+        self.apply_task(name=self.unretried_users.name)
+
+        assert len(loaded_file_paths) == 1
+        assert not os.path.exists(loaded_file_paths[0])
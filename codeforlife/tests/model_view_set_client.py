@@ -7,8 +7,10 @@ Base test case for all model view clients.
 
 import typing as t
 
+from django.db import connection
 from django.db.models import Model
 from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
 from django.utils.http import urlencode
 from rest_framework import status
 from rest_framework.response import Response
@@ -241,14 +243,18 @@ class BaseModelViewSetClient(
                 for value in values:
                     query.append((key, value))
 
-        response: Response = self.get(
-            (
-                self._test_case.reverse_action("list", kwargs=reverse_kwargs)
-                + f"?{urlencode(query)}"
-            ),
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with CaptureQueriesContext(connection) as queries:
+            response: Response = self.get(
+                (
+                    self._test_case.reverse_action(
+                        "list", kwargs=reverse_kwargs
+                    )
+                    + f"?{urlencode(query)}"
+                ),
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
+        self._model_view_set_class.check_query_budget("list", len(queries))
 
         if make_assertions:
 
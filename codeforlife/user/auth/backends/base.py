@@ -6,6 +6,7 @@ Created on 12/04/2024 at 17:02:48(+01:00).
 from django.contrib.auth.backends import BaseBackend as _BaseBackend
 
 from ...models import User
+from ..context import AuthContext
 
 
 class BaseBackend(_BaseBackend):
@@ -15,6 +16,9 @@ class BaseBackend(_BaseBackend):
 
     def get_user(self, user_id: int):
         try:
-            return self.user_class.objects.get(id=user_id)
+            # Load everything the user's auth state depends on up front.
+            return AuthContext.get_queryset(self.user_class.objects.all()).get(
+                id=user_id
+            )
         except self.user_class.DoesNotExist:
             return None
@@ -29,9 +29,9 @@ class OtpBackend(BaseBackend):
             or request is None
             or not isinstance(request.user, self.user_class)
             or not request.user.userprofile.otp_secret
-            or not request.user.session.auth_factors.filter(
-                auth_factor__type=AuthFactor.Type.OTP
-            ).exists()
+            or not request.user.auth_context.has_pending_auth_factor(
+                AuthFactor.Type.OTP
+            )
         ):
             return None
 
@@ -47,9 +47,7 @@ class OtpBackend(BaseBackend):
             user.userprofile.save()
 
             # Delete OTP auth factor from session.
-            user.session.auth_factors.filter(
-                auth_factor__type=AuthFactor.Type.OTP
-            ).delete()
+            user.auth_context.clear_pending_auth_factor(AuthFactor.Type.OTP)
 
             return user
 
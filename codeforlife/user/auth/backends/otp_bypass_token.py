@@ -25,18 +25,18 @@ class OtpBypassTokenBackend(BaseBackend):
             token is None
             or request is None
             or not isinstance(request.user, self.user_class)
-            or not request.user.session.auth_factors.filter(
-                auth_factor__type=AuthFactor.Type.OTP
-            ).exists()
+            or not request.user.auth_context.has_pending_auth_factor(
+                AuthFactor.Type.OTP
+            )
         ):
             return None
 
         for otp_bypass_token in request.user.otp_bypass_tokens.all():
             if otp_bypass_token.check_token(token):
                 # Delete OTP auth factor from session.
-                request.user.session.auth_factors.filter(
-                    auth_factor__type=AuthFactor.Type.OTP
-                ).delete()
+                request.user.auth_context.clear_pending_auth_factor(
+                    AuthFactor.Type.OTP
+                )
 
                 return request.user
 
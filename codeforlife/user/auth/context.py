@@ -0,0 +1,155 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 17:24:09(+01:00).
+
+A snapshot of a user's auth state, taken once per request.
+
+Authenticating a request used to query the user's session, pending auth factors
+and profiles several times: once to check if the user is authenticated, again
+in each auth backend and again in each permission. Instead, the user is loaded
+with everything its auth state depends on in one batch of queries (see
+`AuthContext.get_queryset`) and the backends and permissions read from the
+user's auth context.
+
+The snapshot lives as long as the user instance, which is loaded per request.
+Changes made through the auth context (e.g. clearing a pending auth factor) are
+reflected in the snapshot. Changes made elsewhere are not.
+"""
+
+import typing as t
+from functools import cached_property
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch
+from django.db.models.query import QuerySet
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ..models import AuthFactor, Session, Student, Teacher, User
+
+    AnyUser = t.TypeVar("AnyUser", bound=User)
+else:
+    AnyUser = t.TypeVar("AnyUser")
+
+
+class AuthContext:
+    """The auth state of a user."""
+
+    # The relations of a user its auth state depends on.
+    select_related = ("userprofile", "session", "new_teacher", "new_student")
+
+    def __init__(self, user: "User"):
+        self.user = user
+
+    @classmethod
+    def get_queryset(cls, queryset: QuerySet[AnyUser]):
+        """Load the users with everything their auth states depend on.
+
+        Args:
+            queryset: The users to load.
+
+        Returns:
+            The users with their relations selected and pending auth factors
+            prefetched.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from ..models import SessionAuthFactor
+
+        return queryset.select_related(*cls.select_related).prefetch_related(
+            Prefetch(
+                "session__auth_factors",
+                queryset=SessionAuthFactor.objects.select_related(
+                    "auth_factor"
+                ),
+            )
+        )
+
+    @property
+    def session(self) -> "Session":
+        """The user's session."""
+        return self.user.session
+
+    @cached_property
+    def pending_auth_factor_types(self) -> t.Set["AuthFactor.Type"]:
+        """The types of the auth factors the session has yet to pass."""
+        session = self.session
+        # pylint: disable-next=protected-access
+        if "auth_factors" in getattr(session, "_prefetched_objects_cache", {}):
+            return {
+                session_auth_factor.auth_factor.type
+                for session_auth_factor in session.auth_factors.all()
+            }
+
+        return set(
+            session.auth_factors.values_list("auth_factor__type", flat=True)
+        )
+
+    def has_pending_auth_factor(self, auth_factor_type: "AuthFactor.Type"):
+        """Check if the session has yet to pass an auth factor."""
+        return auth_factor_type in self.pending_auth_factor_types
+
+    def clear_pending_auth_factor(self, auth_factor_type: "AuthFactor.Type"):
+        """Mark an auth factor as passed by deleting it from the session."""
+        session = self.session
+        session.auth_factors.filter(auth_factor__type=auth_factor_type).delete()
+        # The prefetched auth factors are stale.
+        # pylint: disable-next=protected-access
+        getattr(session, "_prefetched_objects_cache", {}).pop(
+            "auth_factors", None
+        )
+        self.pending_auth_factor_types.discard(auth_factor_type)
+
+    @property
+    def is_verified(self) -> bool:
+        """Whether the user has verified their email."""
+        return self.user.userprofile.is_verified
+
+    @property
+    def teacher(self) -> t.Optional["Teacher"]:
+        """The user's teacher-profile."""
+        try:
+            # pylint: disable-next=no-member
+            return self.user.new_teacher  # type: ignore[attr-defined]
+        except ObjectDoesNotExist:
+            return None
+
+    @property
+    def student(self) -> t.Optional["Student"]:
+        """The user's student-profile."""
+        try:
+            # pylint: disable-next=no-member
+            return self.user.new_student  # type: ignore[attr-defined]
+        except ObjectDoesNotExist:
+            return None
+
+    @property
+    def is_teacher(self):
+        """Whether the user is a teacher-user."""
+        return (
+            self.user.is_active
+            and bool(self.user.email)
+            and self.teacher is not None
+            and self.student is None
+        )
+
+    @property
+    def is_student(self):
+        """Whether the user is a student-user."""
+        student = self.student
+        return (
+            self.user.is_active
+            and self.teacher is None
+            and student is not None
+            and student.class_field_id is not None  # type: ignore[attr-defined]
+        )
+
+    @property
+    def is_independent(self):
+        """Whether the user is an independent-user."""
+        student = self.student
+        return (
+            self.user.is_active
+            and bool(self.user.email)
+            and self.teacher is None
+            and student is not None
+            and student.class_field_id is None  # type: ignore[attr-defined]
+        )
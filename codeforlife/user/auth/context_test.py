@@ -0,0 +1,115 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 17:24:09(+01:00).
+"""
+
+from django.contrib.auth import SESSION_KEY
+
+from ...tests import TestCase
+from ..models import AuthFactor, StudentUser, TeacherUser, User
+from ..models.session import SessionStore
+from .backends.base import BaseBackend
+
+# pylint: disable=missing-class-docstring
+
+
+class TestAuthContext(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        teacher_user = TeacherUser.objects.filter(session__isnull=True).first()
+        assert teacher_user
+        self.teacher_user = teacher_user
+
+        student_user = StudentUser.objects.filter(session__isnull=True).first()
+        assert student_user
+        self.student_user = student_user
+
+    def login(self, user: User):
+        """Create a session for the user."""
+        store = SessionStore()
+        store.create()
+        store[SESSION_KEY] = str(user.pk)
+        store.save()
+
+    def test_get_user(self):
+        """Loads everything a user's auth state depends on up front."""
+        AuthFactor.objects.create(
+            user=self.teacher_user, type=AuthFactor.Type.OTP
+        )
+        self.login(self.teacher_user)
+
+        with self.assertNumQueries(2):
+            user = BaseBackend().get_user(self.teacher_user.pk)
+        assert user
+
+        with self.assertNumQueries(0):
+            auth_context = user.auth_context
+            assert auth_context.pending_auth_factor_types == {
+                AuthFactor.Type.OTP
+            }
+            assert auth_context.has_pending_auth_factor(AuthFactor.Type.OTP)
+            assert not user.is_authenticated
+            assert auth_context.teacher == self.teacher_user.teacher
+            assert auth_context.student is None
+            assert auth_context.is_teacher
+            assert not auth_context.is_student
+            assert not auth_context.is_independent
+
+    def test_get_user__student(self):
+        """Can tell a student-user from their profiles."""
+        self.login(self.student_user)
+
+        user = BaseBackend().get_user(self.student_user.pk)
+        assert user
+
+        with self.assertNumQueries(0):
+            auth_context = user.auth_context
+            assert not auth_context.pending_auth_factor_types
+            assert auth_context.student == self.student_user.student
+            assert not auth_context.is_teacher
+            assert auth_context.is_student
+            assert not auth_context.is_independent
+
+    def test_pending_auth_factor_types__not_prefetched(self):
+        """Queries the pending auth factors if they weren't prefetched."""
+        AuthFactor.objects.create(
+            user=self.teacher_user, type=AuthFactor.Type.OTP
+        )
+        self.login(self.teacher_user)
+
+        user = User.objects.select_related("session").get(
+            pk=self.teacher_user.pk
+        )
+        with self.assertNumQueries(1):
+            assert user.auth_context.pending_auth_factor_types == {
+                AuthFactor.Type.OTP
+            }
+
+    def test_clear_pending_auth_factor(self):
+        """Clearing a pending auth factor updates the snapshot."""
+        AuthFactor.objects.create(
+            user=self.teacher_user, type=AuthFactor.Type.OTP
+        )
+        self.login(self.teacher_user)
+
+        user = BaseBackend().get_user(self.teacher_user.pk)
+        assert user
+
+        user.auth_context.clear_pending_auth_factor(AuthFactor.Type.OTP)
+
+        assert not user.auth_context.pending_auth_factor_types
+        assert not user.session.auth_factors.exists()
+
+    def test_as_type(self):
+        """A typed user shares the auth state of the generic user."""
+        self.login(self.teacher_user)
+
+        user = BaseBackend().get_user(self.teacher_user.pk)
+        assert user
+        auth_context = user.auth_context
+
+        with self.assertNumQueries(0):
+            teacher_user = user.as_type(TeacherUser)
+            assert teacher_user.auth_context is auth_context
+            assert teacher_user.teacher == self.teacher_user.teacher
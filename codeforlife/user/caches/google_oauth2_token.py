@@ -3,10 +3,17 @@
 Created on 11/08/2025 at 11:07:45(+01:00).
 """
 
+import asyncio
+import time
 import typing as t
+from uuid import uuid4
 
+import httpx
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.redis import RedisCache
 
 from ...caches import BaseDynamicKeyCache
 from ...types import OAuth2TokenFromRefreshDict
@@ -14,6 +21,26 @@ from ..models import GoogleUser
 
 GoogleOAuth2TokenCacheKey = int
 
+# Where Google's OAuth 2.0 tokens are refreshed.
+GOOGLE_OAUTH2_TOKEN_URL = "https://oauth2.googleapis.com/token"
+
+# Deletes each lock whose value is the given lock ID, atomically.
+RELEASE_LOCKS_SCRIPT = """
+local released = 0
+for _, key in ipairs(KEYS) do
+    if redis.call("GET", key) == ARGV[1] then
+        released = released + redis.call("DEL", key)
+    end
+end
+return released
+"""
+
+
+def _get_redis_cache():
+    """Get the shared cache if it's Redis."""
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    return backend if isinstance(backend, RedisCache) else None
+
 
 class GoogleOAuth2TokenCacheValue(t.TypedDict):
     """A cached OAuth 2.0 token from Google."""
@@ -41,35 +68,283 @@ class GoogleOAuth2TokenCache(
     def make_key(key):
         return f"{key}.google.access_token"
 
+    # How many seconds a worker may hold the lock to refresh a user's token.
+    refresh_lock_timeout = 15
+    # How many seconds to wait for another worker to refresh a user's token.
+    refresh_wait_timeout = 10
+    # How many seconds to wait between checks for another worker's refresh.
+    refresh_poll_interval = 0.1
+
+    @classmethod
+    def make_lock_key(cls, key: GoogleOAuth2TokenCacheKey):
+        """Make the key of the lock to refresh a user's token."""
+        return f"{cls.make_key(key)}.lock"
+
+    @classmethod
+    def release_locks(
+        cls,
+        keys: t.List[GoogleOAuth2TokenCacheKey],
+        lock_id: str,
+        version: t.Optional[int] = None,
+    ):
+        """
+        Release the locks to refresh users' tokens which are still held by a
+        worker. On Redis, the locks are compared and deleted atomically in one
+        round trip, so a lock which expired and was acquired by another worker
+        is never released.
+        """
+        lock_keys = [cls.make_lock_key(key) for key in keys]
+        if not lock_keys:
+            return
+
+        redis_cache = _get_redis_cache()
+        if redis_cache is None:
+            # Other backends can't compare and delete atomically.
+            cache.delete_many(
+                keys=[
+                    lock_key
+                    for lock_key, value in cache.get_many(
+                        keys=lock_keys, version=version
+                    ).items()
+                    if value == lock_id
+                ],
+                version=version,
+            )
+            return
+
+        # pylint: disable=protected-access
+        redis_cache._cache.get_client(write=True).eval(
+            RELEASE_LOCKS_SCRIPT,
+            len(lock_keys),
+            *(
+                redis_cache.make_and_validate_key(lock_key, version=version)
+                for lock_key in lock_keys
+            ),
+            redis_cache._cache._serializer.dumps(lock_id),
+        )
+        # pylint: enable=protected-access
+
+    @classmethod
+    def make_renewal_key(cls, key: GoogleOAuth2TokenCacheKey):
+        """Make the key of the ID of a user's current renewal chain."""
+        return f"{cls.make_key(key)}.renewal"
+
+    @classmethod
+    def schedule_renewal(
+        cls,
+        key: GoogleOAuth2TokenCacheKey,
+        countdown: int,
+        renew_until: float,
+        version: t.Optional[int] = None,
+    ):
+        """
+        Schedule the renewal of a user's token.
+
+        Each renewal replaces the user's current renewal chain, whose scheduled
+        task then exits without renewing the token. This keeps one chain per
+        user, even if a renewal task is delivered more than once.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from ..tasks import renew_google_oauth2_token
+
+        renewal_id = uuid4().hex
+        cache.set(
+            key=cls.make_renewal_key(key),
+            value=renewal_id,
+            timeout=countdown + settings.GOOGLE_OAUTH2_TOKEN_RENEWAL_MARGIN,
+            version=version,
+        )
+        renew_google_oauth2_token.apply_async(
+            kwargs={
+                "user_id": key,
+                "renew_until": renew_until,
+                "renewal_id": renewal_id,
+                "version": version,
+            },
+            countdown=countdown,
+        )
+
+    @classmethod
+    def is_current_renewal(
+        cls,
+        key: GoogleOAuth2TokenCacheKey,
+        renewal_id: str,
+        version: t.Optional[int] = None,
+    ):
+        """Check whether a renewal is part of a user's current renewal chain."""
+        return (
+            cache.get(key=cls.make_renewal_key(key), version=version)
+            == renewal_id
+        )
+
+    @classmethod
+    def refresh(
+        cls,
+        keys: t.Iterable[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int] = None,
+        renew_until: t.Optional[float] = None,
+    ):
+        """
+        Retrieve and cache an access-token for each user that has a
+        refresh-token stored in the database.
+
+        Only one worker refreshes a user's token at a time. If another worker
+        is already refreshing a user's token, this waits for its result instead
+        of refreshing the token again.
+
+        Each refreshed token is renewed shortly before it expires until
+        `renew_until`, which defaults to `GOOGLE_OAUTH2_TOKEN_RENEWAL_PERIOD`
+        seconds from now.
+        """
+        keys = list(dict.fromkeys(keys))
+        if renew_until is None:
+            renew_until = (
+                time.time() + settings.GOOGLE_OAUTH2_TOKEN_RENEWAL_PERIOD
+            )
+
+        lock_id = uuid4().hex
+        locked_keys = [
+            key
+            for key in keys
+            if cache.add(
+                key=cls.make_lock_key(key),
+                value=lock_id,
+                timeout=cls.refresh_lock_timeout,
+                version=version,
+            )
+        ]
+
+        values: t.Dict[
+            GoogleOAuth2TokenCacheKey, GoogleOAuth2TokenCacheValue
+        ] = {}
+        try:
+            if locked_keys:
+                values.update(cls._refresh(locked_keys, version, renew_until))
+        finally:
+            cls.release_locks(locked_keys, lock_id, version)
+
+        waiting_keys = [key for key in keys if key not in locked_keys]
+        if waiting_keys:
+            values.update(cls.wait_for_refresh(waiting_keys, version))
+
+        return values
+
+    @staticmethod
+    def _make_refresh_data(user: GoogleUser):
+        """Make the form data to refresh a user's token."""
+        return {
+            "grant_type": "refresh_token",
+            "refresh_token": user.userprofile.google_refresh_token,
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+        }
+
+    @staticmethod
+    def _parse_token(token: OAuth2TokenFromRefreshDict):
+        """Split a refreshed token into its value and its lifetime."""
+        expires_in = token["expires_in"]
+        del token["expires_in"]  # type: ignore[misc]
+        return t.cast(GoogleOAuth2TokenCacheValue, token), expires_in
+
+    @staticmethod
+    def _get_renewal_countdown(expires_in: int, renew_until: float):
+        """
+        Get how many seconds until a refreshed token is renewed, or None if it's
+        not renewed.
+        """
+        countdown = max(
+            expires_in - settings.GOOGLE_OAUTH2_TOKEN_RENEWAL_MARGIN, 0
+        )
+        return countdown if time.time() + countdown < renew_until else None
+
+    @classmethod
+    def _refresh(
+        cls,
+        keys: t.List[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int],
+        renew_until: float,
+    ):
+        """Refresh the tokens of users whose locks are held by this worker."""
+        values: t.Dict[
+            GoogleOAuth2TokenCacheKey, GoogleOAuth2TokenCacheValue
+        ] = {}
+        for user in GoogleUser.objects.filter(id__in=keys).select_related(
+            "userprofile"
+        ):
+            response = requests.post(
+                url=GOOGLE_OAUTH2_TOKEN_URL,
+                data=cls._make_refresh_data(user),
+                timeout=10,
+            )
+            if response.ok:
+                value, expires_in = cls._parse_token(response.json())
+
+                # -3 seconds to reduce likeliness of using an expired token.
+                cls.set(
+                    key=user.id,
+                    value=value,
+                    timeout=expires_in - 3,
+                    version=version,
+                )
+                values[user.id] = value
+
+                countdown = cls._get_renewal_countdown(expires_in, renew_until)
+                if countdown is not None:
+                    cls.schedule_renewal(
+                        user.id, countdown, renew_until, version
+                    )
+
+        return values
+
+    @classmethod
+    def wait_for_refresh(
+        cls,
+        keys: t.List[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int] = None,
+    ):
+        """
+        Wait for other workers to refresh the tokens of users. Users whose
+        tokens are not refreshed before the wait times out are left out.
+        """
+        values: t.Dict[
+            GoogleOAuth2TokenCacheKey, GoogleOAuth2TokenCacheValue
+        ] = {}
+        deadline = time.monotonic() + cls.refresh_wait_timeout
+        while keys and time.monotonic() < deadline:
+            time.sleep(cls.refresh_poll_interval)
+            values.update(super().get_many(keys, version))
+
+            # Stop waiting for users whose refreshes ended without a token.
+            lock_keys = cache.get_many(
+                keys=[cls.make_lock_key(key) for key in keys],
+                version=version,
+            )
+            keys = [
+                key
+                for key in keys
+                if key not in values and cls.make_lock_key(key) in lock_keys
+            ]
+
+        return values
+
     @classmethod
     def get(cls, key, default=None, version=None):
         value = super().get(key, default, version)
         if not value:
-            user_queryset = GoogleUser.objects.filter(id=key)
-            if user_queryset.exists():
-                user = user_queryset.get()
-
-                response = requests.post(
-                    url="https://oauth2.googleapis.com/token",
-                    data={
-                        "grant_type": "refresh_token",
-                        "refresh_token": user.userprofile.google_refresh_token,
-                        "client_id": settings.GOOGLE_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                    },
-                    timeout=10,
-                )
-                if response.ok:
-                    token: OAuth2TokenFromRefreshDict = response.json()
-                    expires_in = token["expires_in"]
-                    del token["expires_in"]  # type: ignore[misc]
-                    value = t.cast(GoogleOAuth2TokenCacheValue, token)
-
-                    # -3 seconds to reduce likeliness of using an expired token.
-                    cls.set(key=key, value=value, timeout=expires_in - 3)
+            value = cls.refresh([key], version).get(key, value)
 
         return value
 
+    @classmethod
+    def get_many(cls, keys, version=None):
+        keys = list(keys)
+        values = super().get_many(keys, version)
+        missing_keys = [key for key in keys if not values.get(key)]
+        if missing_keys:
+            values.update(cls.refresh(missing_keys, version))
+
+        return values
+
     @classmethod
     def get_auth_header(
         cls, key: GoogleOAuth2TokenCacheKey, default=None, version=None
@@ -82,3 +357,186 @@ class GoogleOAuth2TokenCache(
             return f"{value['token_type']} {value['access_token']}"
 
         return None
+
+    @classmethod
+    def get_auth_headers(
+        cls,
+        keys: t.Iterable[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int] = None,
+    ):
+        """
+        Get many Google OAuth 2.0 tokens in the form of Authorization headers.
+        Users without a token are left out.
+        """
+        return {
+            key: f"{value['token_type']} {value['access_token']}"
+            for key, value in cls.get_many(keys, version).items()
+        }
+
+    # Async counterparts, which refresh tokens without blocking the event loop.
+
+    @classmethod
+    async def arefresh(
+        cls,
+        keys: t.Iterable[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int] = None,
+        renew_until: t.Optional[float] = None,
+    ):
+        """Async counterpart of `refresh`."""
+        keys = list(dict.fromkeys(keys))
+        if renew_until is None:
+            renew_until = (
+                time.time() + settings.GOOGLE_OAUTH2_TOKEN_RENEWAL_PERIOD
+            )
+
+        lock_id = uuid4().hex
+        locked_keys = [
+            key
+            for key in keys
+            if await cache.aadd(
+                key=cls.make_lock_key(key),
+                value=lock_id,
+                timeout=cls.refresh_lock_timeout,
+                version=version,
+            )
+        ]
+
+        values: t.Dict[
+            GoogleOAuth2TokenCacheKey, GoogleOAuth2TokenCacheValue
+        ] = {}
+        try:
+            if locked_keys:
+                values.update(
+                    await cls._arefresh(locked_keys, version, renew_until)
+                )
+        finally:
+            await sync_to_async(cls.release_locks)(
+                locked_keys, lock_id, version
+            )
+
+        waiting_keys = [key for key in keys if key not in locked_keys]
+        if waiting_keys:
+            values.update(await cls.await_refresh(waiting_keys, version))
+
+        return values
+
+    @classmethod
+    async def _arefresh(
+        cls,
+        keys: t.List[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int],
+        renew_until: float,
+    ):
+        """Async counterpart of `_refresh`. Refreshes tokens concurrently."""
+        users = [
+            user
+            async for user in GoogleUser.objects.filter(
+                id__in=keys
+            ).select_related("userprofile")
+        ]
+        if not users:
+            return {}
+
+        async with httpx.AsyncClient(timeout=10) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        url=GOOGLE_OAUTH2_TOKEN_URL,
+                        data=cls._make_refresh_data(user),
+                    )
+                    for user in users
+                )
+            )
+
+        values: t.Dict[
+            GoogleOAuth2TokenCacheKey, GoogleOAuth2TokenCacheValue
+        ] = {}
+        for user, response in zip(users, responses):
+            if response.is_success:
+                value, expires_in = cls._parse_token(response.json())
+
+                # -3 seconds to reduce likeliness of using an expired token.
+                await cls.aset(
+                    key=user.id,
+                    value=value,
+                    timeout=expires_in - 3,
+                    version=version,
+                )
+                values[user.id] = value
+
+                countdown = cls._get_renewal_countdown(expires_in, renew_until)
+                if countdown is not None:
+                    await sync_to_async(cls.schedule_renewal)(
+                        user.id, countdown, renew_until, version
+                    )
+
+        return values
+
+    @classmethod
+    async def await_refresh(
+        cls,
+        keys: t.List[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int] = None,
+    ):
+        """Async counterpart of `wait_for_refresh`."""
+        values: t.Dict[
+            GoogleOAuth2TokenCacheKey, GoogleOAuth2TokenCacheValue
+        ] = {}
+        deadline = time.monotonic() + cls.refresh_wait_timeout
+        while keys and time.monotonic() < deadline:
+            await asyncio.sleep(cls.refresh_poll_interval)
+            values.update(await super().aget_many(keys, version))
+
+            # Stop waiting for users whose refreshes ended without a token.
+            lock_keys = await cache.aget_many(
+                keys=[cls.make_lock_key(key) for key in keys],
+                version=version,
+            )
+            keys = [
+                key
+                for key in keys
+                if key not in values and cls.make_lock_key(key) in lock_keys
+            ]
+
+        return values
+
+    @classmethod
+    async def aget(cls, key, default=None, version=None):
+        value = await super().aget(key, default, version)
+        if not value:
+            value = (await cls.arefresh([key], version)).get(key, value)
+
+        return value
+
+    @classmethod
+    async def aget_many(cls, keys, version=None):
+        keys = list(keys)
+        values = await super().aget_many(keys, version)
+        missing_keys = [key for key in keys if not values.get(key)]
+        if missing_keys:
+            values.update(await cls.arefresh(missing_keys, version))
+
+        return values
+
+    @classmethod
+    async def aget_auth_header(
+        cls, key: GoogleOAuth2TokenCacheKey, default=None, version=None
+    ):
+        """Async counterpart of `get_auth_header`."""
+        value = await cls.aget(key, default, version)
+        if value:
+            return f"{value['token_type']} {value['access_token']}"
+
+        return None
+
+    @classmethod
+    async def aget_auth_headers(
+        cls,
+        keys: t.Iterable[GoogleOAuth2TokenCacheKey],
+        version: t.Optional[int] = None,
+    ):
+        """Async counterpart of `get_auth_headers`."""
+        return {
+            key: f"{value['token_type']} {value['access_token']}"
+            for key, value in (await cls.aget_many(keys, version)).items()
+        }
@@ -0,0 +1,258 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 14:21:40(+01:00).
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from django.core.cache import cache
+from django.test import override_settings
+
+from ...tests import TestCase
+from . import google_oauth2_token
+from .google_oauth2_token import GoogleOAuth2TokenCache
+
+# pylint: disable=missing-class-docstring
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class TestGoogleOAuth2TokenCache(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.token: GoogleOAuth2TokenCache.Value = {
+            "access_token": "access-token",
+            "token_type": "Bearer",
+            "scope": "email",
+        }
+
+    def test_get_many(self):
+        """Gets cached tokens and refreshes the missing ones together."""
+        GoogleOAuth2TokenCache.set(key=1, value=self.token)
+
+        with patch.object(
+            GoogleOAuth2TokenCache, "refresh", return_value={2: self.token}
+        ) as refresh:
+            assert GoogleOAuth2TokenCache.get_many([1, 2, 3]) == {
+                1: self.token,
+                2: self.token,
+            }
+            refresh.assert_called_once_with([2, 3], None)
+
+    def test_get_auth_headers(self):
+        """Gets many tokens as Authorization headers."""
+        GoogleOAuth2TokenCache.set(key=1, value=self.token)
+
+        with patch.object(GoogleOAuth2TokenCache, "refresh", return_value={}):
+            assert GoogleOAuth2TokenCache.get_auth_headers([1, 2]) == {
+                1: "Bearer access-token"
+            }
+
+    def test_refresh(self):
+        """Refreshes a user's token and schedules its renewal."""
+        user = MagicMock(id=1)
+        response = MagicMock(ok=True)
+        response.json.return_value = {**self.token, "expires_in": 3600}
+
+        with patch.object(
+            google_oauth2_token, "GoogleUser"
+        ) as google_user, patch.object(
+            google_oauth2_token.requests, "post", return_value=response
+        ), patch(
+            "codeforlife.user.tasks.renew_google_oauth2_token.apply_async"
+        ) as apply_async:
+            users = google_user.objects.filter.return_value
+            users.select_related.return_value = [user]
+            renew_until = time.time() + 60 * 60 * 2
+
+            assert GoogleOAuth2TokenCache.refresh(
+                [1], renew_until=renew_until
+            ) == {1: self.token}
+            apply_async.assert_called_once()
+            renewal_id = apply_async.call_args.kwargs["kwargs"]["renewal_id"]
+            apply_async.assert_called_once_with(
+                kwargs={
+                    "user_id": 1,
+                    "renew_until": renew_until,
+                    "renewal_id": renewal_id,
+                    "version": None,
+                },
+                countdown=3600 - 300,
+            )
+
+        assert GoogleOAuth2TokenCache.is_current_renewal(1, renewal_id)
+        assert GoogleOAuth2TokenCache.get(1) == self.token
+        assert cache.get(GoogleOAuth2TokenCache.make_lock_key(1)) is None
+
+    def test_refresh__renew_until(self):
+        """Doesn't schedule a renewal after the renewal period."""
+        user = MagicMock(id=1)
+        response = MagicMock(ok=True)
+        response.json.return_value = {**self.token, "expires_in": 3600}
+
+        with patch.object(
+            google_oauth2_token, "GoogleUser"
+        ) as google_user, patch.object(
+            google_oauth2_token.requests, "post", return_value=response
+        ), patch(
+            "codeforlife.user.tasks.renew_google_oauth2_token.apply_async"
+        ) as apply_async:
+            users = google_user.objects.filter.return_value
+            users.select_related.return_value = [user]
+
+            GoogleOAuth2TokenCache.refresh([1], renew_until=time.time() + 60)
+            apply_async.assert_not_called()
+
+    def test_release_locks(self):
+        """Only releases the locks which are still held by the worker."""
+        cache.add(GoogleOAuth2TokenCache.make_lock_key(1), "worker")
+        cache.add(GoogleOAuth2TokenCache.make_lock_key(2), "another-worker")
+
+        GoogleOAuth2TokenCache.release_locks([1, 2], "worker")
+
+        assert cache.get(GoogleOAuth2TokenCache.make_lock_key(1)) is None
+        assert (
+            cache.get(GoogleOAuth2TokenCache.make_lock_key(2))
+            == "another-worker"
+        )
+
+    def test_release_locks__redis(self):
+        """Compares and deletes the locks atomically in one round trip."""
+        redis_cache = MagicMock()
+        redis_cache.make_and_validate_key.side_effect = (
+            lambda key, version: f"{version}:{key}"
+        )
+        serializer = redis_cache._cache._serializer
+        serializer.dumps.side_effect = lambda value: f"dumped-{value}"
+        client = redis_cache._cache.get_client.return_value
+
+        with patch.object(
+            google_oauth2_token, "_get_redis_cache", return_value=redis_cache
+        ):
+            GoogleOAuth2TokenCache.release_locks([1, 2], "worker", version=3)
+
+        client.eval.assert_called_once_with(
+            google_oauth2_token.RELEASE_LOCKS_SCRIPT,
+            2,
+            f"3:{GoogleOAuth2TokenCache.make_lock_key(1)}",
+            f"3:{GoogleOAuth2TokenCache.make_lock_key(2)}",
+            "dumped-worker",
+        )
+
+    def test_schedule_renewal(self):
+        """Replaces the user's current renewal chain."""
+        with patch(
+            "codeforlife.user.tasks.renew_google_oauth2_token.apply_async"
+        ) as apply_async:
+            GoogleOAuth2TokenCache.schedule_renewal(1, 60, time.time() + 120)
+            GoogleOAuth2TokenCache.schedule_renewal(1, 60, time.time() + 120)
+
+            first_renewal_id, second_renewal_id = (
+                call.kwargs["kwargs"]["renewal_id"]
+                for call in apply_async.call_args_list
+            )
+
+        assert not GoogleOAuth2TokenCache.is_current_renewal(
+            1, first_renewal_id
+        )
+        assert GoogleOAuth2TokenCache.is_current_renewal(1, second_renewal_id)
+
+    def test_refresh__single_flight(self):
+        """Waits for another worker's refresh instead of refreshing again."""
+        cache.add(GoogleOAuth2TokenCache.make_lock_key(2), "another-worker")
+
+        def wait_for_refresh(keys, version):
+            # The other worker finishes refreshing while this one waits.
+            GoogleOAuth2TokenCache.set(key=2, value=self.token)
+            cache.delete(GoogleOAuth2TokenCache.make_lock_key(2))
+            return original_wait_for_refresh(keys, version)
+
+        original_wait_for_refresh = GoogleOAuth2TokenCache.wait_for_refresh
+        with patch.object(
+            GoogleOAuth2TokenCache, "_refresh", return_value={1: self.token}
+        ) as refresh, patch.object(
+            GoogleOAuth2TokenCache, "wait_for_refresh", wait_for_refresh
+        ), patch.object(
+            GoogleOAuth2TokenCache, "refresh_poll_interval", 0
+        ):
+            assert GoogleOAuth2TokenCache.refresh([1, 2]) == {
+                1: self.token,
+                2: self.token,
+            }
+            refresh.assert_called_once()
+            assert refresh.call_args.args[0] == [1]
+
+        assert cache.get(GoogleOAuth2TokenCache.make_lock_key(1)) is None
+
+    def test_wait_for_refresh__released(self):
+        """Stops waiting when another worker's refresh ends without a token."""
+        with patch.object(GoogleOAuth2TokenCache, "refresh_poll_interval", 0):
+            assert not GoogleOAuth2TokenCache.wait_for_refresh([1])
+
+    def test_wait_for_refresh__timeout(self):
+        """Stops waiting when the wait times out."""
+        cache.add(GoogleOAuth2TokenCache.make_lock_key(1), "another-worker")
+
+        with patch.object(
+            GoogleOAuth2TokenCache, "refresh_poll_interval", 0
+        ), patch.object(GoogleOAuth2TokenCache, "refresh_wait_timeout", 0.01):
+            assert not GoogleOAuth2TokenCache.wait_for_refresh([1])
+
+    async def test_arefresh(self):
+        """Refreshes users' tokens concurrently without blocking."""
+        users = [MagicMock(id=1), MagicMock(id=2)]
+
+        async def iterate_users():
+            for user in users:
+                yield user
+
+        def handle_request(request: httpx.Request):
+            assert request.url == google_oauth2_token.GOOGLE_OAUTH2_TOKEN_URL
+            return httpx.Response(200, json={**self.token, "expires_in": 60})
+
+        async_client = httpx.AsyncClient
+
+        def make_client(**kwargs):
+            return async_client(
+                transport=httpx.MockTransport(handle_request), **kwargs
+            )
+
+        with patch.object(
+            google_oauth2_token, "GoogleUser"
+        ) as google_user, patch.object(
+            google_oauth2_token.httpx, "AsyncClient", side_effect=make_client
+        ):
+            queryset = google_user.objects.filter.return_value
+            queryset.select_related.return_value.__aiter__.side_effect = (
+                iterate_users
+            )
+
+            assert await GoogleOAuth2TokenCache.arefresh(
+                [1, 2], renew_until=time.time()
+            ) == {1: self.token, 2: self.token}
+
+        assert await GoogleOAuth2TokenCache.aget_many([1, 2]) == {
+            1: self.token,
+            2: self.token,
+        }
+
+    async def test_aget_auth_header(self):
+        """Gets a token as an Authorization header asynchronously."""
+        with patch.object(
+            GoogleOAuth2TokenCache,
+            "arefresh",
+            AsyncMock(return_value={1: self.token}),
+        ) as arefresh:
+            assert (
+                await GoogleOAuth2TokenCache.aget_auth_header(1)
+                == "Bearer access-token"
+            )
+            arefresh.assert_awaited_once_with([1], None)
@@ -5,13 +5,12 @@ Created on 03/04/2024 at 16:37:44(+01:00).
 
 import typing as t
 
-from django.db.models import Q  # isort: skip
 from django.db.models.query import QuerySet  # isort: skip
 from django_filters import (  # type: ignore[import-untyped] # isort: skip
     rest_framework as filters,
 )
 
-from ...filters import FilterSet  # isort: skip
+from ...filters import FilterSet, search  # isort: skip
 from ..models import (  # isort: skip
     User,
     TeacherUser,
@@ -51,11 +50,8 @@ class UserFilterSet(FilterSet):
             names if len(names) == 2 else (names[0], names[0])
         )
 
-        # TODO: use PostgreSQL specific lookup
-        # https://docs.djangoproject.com/en/5.0/ref/contrib/postgres/lookups/#std-fieldlookup-trigram_similar
-        return queryset.filter(
-            Q(first_name__icontains=first_name)
-            | Q(last_name__icontains=last_name)
+        return search(
+            queryset, {"first_name": first_name, "last_name": last_name}
         )
 
     def type__method(
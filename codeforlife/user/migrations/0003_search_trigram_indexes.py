@@ -0,0 +1,60 @@
+"""
+Index the columns searched by the user and class filter sets with trigrams, so
+that substring searches (icontains) don't scan the tables. Only PostgreSQL
+supports trigram indexes, so other databases are left as they are.
+"""
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# The columns of each model which are searched.
+SEARCH_COLUMNS = {
+    "User": ["first_name", "last_name"],
+    "Class": ["name", "access_code"],
+}
+
+
+def get_trigram_indexes(apps, schema_editor):
+    """Get the name, table and column of each trigram index."""
+    for model_name, columns in SEARCH_COLUMNS.items():
+        # pylint: disable-next=protected-access
+        db_table = apps.get_model("user", model_name)._meta.db_table
+        for column in columns:
+            yield (
+                schema_editor.quote_name(f"{db_table}_{column}_trgm"),
+                schema_editor.quote_name(db_table),
+                schema_editor.quote_name(column),
+            )
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Index the upper-cased columns, as icontains compares them."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, db_table, column in get_trigram_indexes(apps, schema_editor):
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {db_table}"
+            f" USING gin (UPPER({column}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Drop the trigram indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, _, _ in get_trigram_indexes(apps, schema_editor):
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0002_user_proxies_and_new_models"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
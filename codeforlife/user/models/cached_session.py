@@ -0,0 +1,9 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 16:41:27(+01:00).
+
+The session engine which caches sessions. To enable it, set:
+SESSION_ENGINE = "codeforlife.user.models.cached_session"
+"""
+
+from .session import CachedSessionStore as SessionStore
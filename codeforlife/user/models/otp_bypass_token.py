@@ -19,6 +19,7 @@ from ...validators import CharSetValidatorBuilder
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from django_stubs_ext.db.models import TypedModelMeta
+    from tink.aead import Aead  # type: ignore[import]
 
     from .user import User
 else:
@@ -63,13 +64,9 @@ class OtpBypassToken(EncryptedModel):
 
             user.otp_bypass_tokens.all().delete()
 
-            otp_bypass_tokens = [
-                OtpBypassToken(user=user, token=token) for token in tokens
-            ]
-            for otp_bypass_token in otp_bypass_tokens:
-                otp_bypass_token.save()
-
-            return otp_bypass_tokens
+            return super().bulk_create(
+                [OtpBypassToken(user=user, token=token) for token in tokens]
+            )
 
     objects: Manager = Manager()  # type: ignore[assignment]
 
@@ -95,6 +92,16 @@ class OtpBypassToken(EncryptedModel):
     def dek_aead(self):
         return self.user.userprofile.dek_aead  # type: ignore[attr-defined]
 
+    @classmethod
+    def get_dek_aeads(cls, instances):
+        # All of a user's tokens share the user's DEK.
+        dek_aeads: t.Dict[int, "Aead"] = {}
+        for instance in instances:
+            if instance.user_id not in dek_aeads:
+                dek_aeads[instance.user_id] = instance.dek_aead
+
+        return [dek_aeads[instance.user_id] for instance in instances]
+
     def save(self, *args, **kwargs):
         raise IntegrityError("Cannot create or update a single instance.")
 
@@ -5,14 +5,22 @@ Created on 20/02/2024 at 15:31:38(+00:00).
 
 import typing as t
 
+from django.conf import settings
 from django.db.models.query import QuerySet
 
-from ...models import AbstractBaseSession, BaseSessionStore
+from ...models import (
+    AbstractBaseSession,
+    BaseCachedSessionStore,
+    BaseSessionStore,
+)
 from .user import User
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from .session_auth_factor import SessionAuthFactor
 
+# The session engine which caches sessions.
+CACHED_SESSION_ENGINE = "codeforlife.user.models.cached_session"
+
 
 class Session(AbstractBaseSession):
     """
@@ -26,6 +34,10 @@ class Session(AbstractBaseSession):
 
     @classmethod
     def get_session_store_class(cls):
+        # Keep the cached sessions consistent when they're enabled.
+        if settings.SESSION_ENGINE == CACHED_SESSION_ENGINE:
+            return CachedSessionStore
+
         return SessionStore
 
 
@@ -49,3 +61,10 @@ class SessionStore(BaseSessionStore[Session, User]):
                 for auth_factor in session.user.auth_factors.all()
             ]
         )
+
+
+class CachedSessionStore(BaseCachedSessionStore[Session, User], SessionStore):
+    """
+    A write-through cached variant of the session store. To enable it, set:
+    SESSION_ENGINE = "codeforlife.user.models.cached_session"
+    """
@@ -3,13 +3,19 @@
 Created on 16/04/2024 at 14:40:11(+01:00).
 """
 
-from datetime import timedelta
+import typing as t
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.test import override_settings
 from django.utils import timezone
 
-from ...tests import ModelTestCase
-from .session import Session
+from ...tests import ModelTestCase, TestCase
+from .auth_factor import AuthFactor
+from .session import CachedSessionStore, Session, SessionStore
+from .user import User
 
 
 # pylint: disable-next=missing-class-docstring
@@ -27,3 +33,198 @@ class TestSession(ModelTestCase[Session]):
         with patch.object(timezone, "now", return_value=now) as timezone_now:
             assert not session.is_expired
             timezone_now.assert_called_once()
+
+
+@override_settings(SESSION_TOUCH_THRESHOLD=60 * 10)
+# pylint: disable-next=missing-class-docstring
+class TestSessionStore(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        user = User.objects.filter(session__isnull=True).first()
+        assert user
+
+        store = SessionStore()
+        store.create()
+        store[SESSION_KEY] = str(user.pk)
+        store.save()
+        self.session_key = t.cast(str, store.session_key)
+
+    def set_expire_date(self, expire_date: datetime):
+        """Set when the session expires in the database."""
+        Session.objects.filter(session_key=self.session_key).update(
+            expire_date=expire_date
+        )
+
+    def test_save__unchanged(self):
+        """An unchanged session which isn't about to expire isn't saved."""
+        expire_date = timezone.now() + timedelta(minutes=30)
+        self.set_expire_date(expire_date)
+
+        store = SessionStore(self.session_key)
+        with self.assertNumQueries(1):  # Load only.
+            store.save()
+
+        session = Session.objects.get(session_key=self.session_key)
+        assert session.expire_date == expire_date
+
+    def test_save__touch(self):
+        """An unchanged session which is about to expire is saved."""
+        self.set_expire_date(timezone.now() + timedelta(minutes=5))
+
+        store = SessionStore(self.session_key)
+        store.save()
+
+        session = Session.objects.get(session_key=self.session_key)
+        assert session.expire_date > timezone.now() + timedelta(minutes=30)
+
+    def test_save__modified(self):
+        """A changed session is saved."""
+        self.set_expire_date(timezone.now() + timedelta(minutes=30))
+
+        store = SessionStore(self.session_key)
+        store["example"] = 1
+        store.save()
+
+        session = Session.objects.get(session_key=self.session_key)
+        assert session.get_decoded()["example"] == 1
+
+    def test_save__expired_user_session(self):
+        """Replaces the user's expired session when the user logs in again."""
+        self.set_expire_date(timezone.now() - timedelta(minutes=1))
+        user_id = Session.objects.get(session_key=self.session_key).user_id
+
+        store = SessionStore()
+        store.create()
+        store[SESSION_KEY] = str(user_id)
+        store.save()
+
+        session = Session.objects.get(user_id=user_id)
+        assert session.session_key == store.session_key
+        assert not Session.objects.filter(session_key=self.session_key).exists()
+
+    @override_settings(SESSION_TOUCH_THRESHOLD=None)
+    def test_save__every_request(self):
+        """An unchanged session is saved if the threshold isn't set."""
+        store = SessionStore(self.session_key)
+        # Load, get the user's session and update it in a savepoint.
+        with self.assertNumQueries(5):
+            store.save()
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+# pylint: disable-next=missing-class-docstring
+class TestCachedSessionStore(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        cache.clear()
+
+        user = User.objects.filter(session__isnull=True).first()
+        assert user
+        self.user = user
+        AuthFactor.objects.create(user=user, type=AuthFactor.Type.OTP)
+
+    def login(self):
+        """Create a session and associate it to the user."""
+        store = CachedSessionStore()
+        store.create()
+        store[SESSION_KEY] = str(self.user.pk)
+        store.save()
+
+        return store
+
+    def test_save__associate(self):
+        """Associates the session to the user and sets its auth factors."""
+        store = self.login()
+
+        session = Session.objects.get(user=self.user)
+        assert session.session_key == store.session_key
+        assert session.auth_factors.count() == 1
+
+    def test_load(self):
+        """Loads the session from the cache."""
+        store = self.login()
+
+        with self.assertNumQueries(0):
+            data = CachedSessionStore(store.session_key).load()
+
+        assert data[SESSION_KEY] == str(self.user.pk)
+
+    def test_load__miss(self):
+        """Loads the session from the database on a miss and caches it."""
+        store = self.login()
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            data = CachedSessionStore(store.session_key).load()
+        assert data[SESSION_KEY] == str(self.user.pk)
+
+        with self.assertNumQueries(0):
+            CachedSessionStore(store.session_key).load()
+
+    def test_save(self):
+        """Only updates the data of a session which belongs to its user."""
+        store = self.login()
+        expire_date = Session.objects.get(user=self.user).expire_date
+
+        store = CachedSessionStore(store.session_key)
+        store["example"] = 1
+        with self.assertNumQueries(1):
+            store.save()
+
+        session = Session.objects.get(user=self.user)
+        assert session.get_decoded()["example"] == 1
+        assert session.expire_date == expire_date
+        assert CachedSessionStore(store.session_key).load()["example"] == 1
+
+    def test_save__existing_session(self):
+        """
+        Saves to the user's existing session and invalidates the cached data
+        of both sessions.
+        """
+        existing_store = self.login()
+        existing_store.load()
+
+        store = self.login()
+        assert store.session_key != existing_store.session_key
+
+        session = Session.objects.get(user=self.user)
+        assert session.session_key == existing_store.session_key
+        assert not CachedSessionStore(store.session_key).load()
+        assert (
+            CachedSessionStore(existing_store.session_key).load()
+            == session.get_decoded()
+        )
+
+    @override_settings(SESSION_TOUCH_THRESHOLD=60 * 10)
+    def test_save__unchanged(self):
+        """An unchanged session which isn't about to expire isn't saved."""
+        store = self.login()
+
+        store = CachedSessionStore(store.session_key)
+        with self.assertNumQueries(0):
+            store.save()
+
+    @override_settings(SESSION_TOUCH_THRESHOLD=60 * 10)
+    def test_save__touch(self):
+        """An unchanged session which is about to expire is extended."""
+        store = self.login()
+        Session.objects.filter(session_key=store.session_key).update(
+            expire_date=timezone.now() + timedelta(minutes=5)
+        )
+        cache.clear()
+
+        store = CachedSessionStore(store.session_key)
+        with self.assertNumQueries(2):  # Load, update.
+            store.save()
+
+        session = Session.objects.get(session_key=store.session_key)
+        assert session.expire_date > timezone.now() + timedelta(minutes=30)
+        assert store.loaded_expire_date == session.expire_date
@@ -5,6 +5,7 @@ Created on 19/02/2024 at 21:54:04(+00:00).
 
 import typing as t
 
+from ....models import as_proxy
 from .admin_school import AdminSchoolTeacher
 from .non_admin_school import NonAdminSchoolTeacher
 from .non_school import NonSchoolTeacher
@@ -33,15 +34,6 @@ def teacher_as_type(
         typed_teacher_class: The type of teacher to convert to.
 
     Returns:
-        An instance of the typed teacher.
+        A view of the teacher as the typed teacher.
     """
-
-    return typed_teacher_class(
-        pk=teacher.pk,
-        user=teacher.user,
-        new_user=teacher.new_user,
-        school=teacher.school,
-        is_admin=teacher.is_admin,
-        blocked_time=teacher.blocked_time,
-        invited_by=teacher.invited_by,
-    )
+    return as_proxy(teacher, typed_teacher_class)
@@ -7,6 +7,7 @@ Created on 05/02/2024 at 09:50:04(+00:00).
 
 import typing as t
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from django.conf import settings
 
@@ -19,13 +20,14 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from pyotp import TOTP
 
-from ....models import AbstractBaseUser
+from ....models import AbstractBaseUser, as_proxy
 from ....types import Validators
 from ....validators import UnicodeAlphanumericCharSetValidator
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from django_stubs_ext.db.models import TypedModelMeta
 
+    from ...auth.context import AuthContext
     from ..auth_factor import AuthFactor
     from ..otp_bypass_token import OtpBypassToken
     from ..session import Session
@@ -102,13 +104,21 @@ class User(
             True
             if getattr(settings, "OLD_SYSTEM", True)
             else (
-                not self.session.auth_factors.exists()
-                and self.userprofile.is_verified
+                not self.auth_context.pending_auth_factor_types
+                and self.auth_context.is_verified
                 if super().is_authenticated
                 else False
             )
         )
 
+    @cached_property
+    def auth_context(self) -> "AuthContext":
+        """A snapshot of the user's auth state."""
+        # pylint: disable-next=import-outside-toplevel
+        from ...auth.context import AuthContext
+
+        return AuthContext(self)
+
     @property
     def student(self) -> t.Optional["Student"]:
         """A user's student-profile."""
@@ -167,25 +177,16 @@ class User(
     def as_type(self, user_class: t.Type["AnyUser"]):
         """Convert this generic user to a typed user.
 
+        The typed user is a view of this user which shares its fields and
+        caches, so no fields are copied and no relations are fetched again.
+
         Args:
             user_class: The type of user to convert to.
 
         Returns:
             An instance of the typed user.
         """
-        return user_class(
-            pk=self.pk,
-            first_name=self.first_name,
-            last_name=self.last_name,
-            username=self.username,
-            is_active=self.is_active,
-            email=self.email,
-            is_staff=self.is_staff,
-            date_joined=self.date_joined,
-            is_superuser=self.is_superuser,
-            password=self.password,
-            last_login=self.last_login,
-        )
+        return as_proxy(self, user_class)
 
     def anonymize(self):
         """Anonymize the user."""
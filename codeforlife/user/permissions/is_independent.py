@@ -7,7 +7,7 @@ Created on 12/12/2023 at 13:55:47(+00:00).
 import typing as t
 
 from ...permissions import IsAuthenticated
-from ..models import IndependentUser, User
+from ..models import Student, User
 
 
 class IsIndependent(IsAuthenticated):
@@ -34,19 +34,19 @@ class IsIndependent(IsAuthenticated):
         if (
             not super().has_permission(request, view)
             or not isinstance(user, User)
-            or not IndependentUser.objects.filter(id=user.id).exists()
+            or not user.auth_context.is_independent
         ):
             return False
 
-        user = user.as_type(IndependentUser)
+        student = t.cast(Student, user.auth_context.student)
         return (
             self.is_requesting_to_join_class is None
             or (
                 self.is_requesting_to_join_class
-                and user.student.pending_class_request is not None
+                and student.pending_class_request is not None
             )
             or (
                 not self.is_requesting_to_join_class
-                and user.student.pending_class_request is None
+                and student.pending_class_request is None
             )
         )
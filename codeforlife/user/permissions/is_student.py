@@ -5,7 +5,7 @@ Created on 12/12/2023 at 13:55:40(+00:00).
 """
 
 from ...permissions import IsAuthenticated
-from ..models import StudentUser, User
+from ..models import User
 
 
 class IsStudent(IsAuthenticated):
@@ -16,5 +16,5 @@ class IsStudent(IsAuthenticated):
         return (
             super().has_permission(request, view)
             and isinstance(user, User)
-            and StudentUser.objects.filter(id=user.id).exists()
+            and user.auth_context.is_student
         )
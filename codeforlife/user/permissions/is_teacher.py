@@ -7,7 +7,7 @@ Created on 12/12/2023 at 13:55:22(+00:00).
 import typing as t
 
 from ...permissions import IsAuthenticated
-from ..models import TeacherUser, User
+from ..models import Teacher, User
 
 
 class IsTeacher(IsAuthenticated):
@@ -50,26 +50,21 @@ class IsTeacher(IsAuthenticated):
         if (
             not super().has_permission(request, view)
             or not isinstance(user, User)
-            or not TeacherUser.objects.filter(id=user.id).exists()
+            or not user.auth_context.is_teacher
         ):
             return False
 
-        user = user.as_type(TeacherUser)
+        teacher = t.cast(Teacher, user.auth_context.teacher)
         return (
             (
                 self.in_school is None
-                or (self.in_school and user.teacher.school_id is not None)
-                or (not self.in_school and user.teacher.school_id is None)
-            )
-            and (
-                self.is_admin is None or user.teacher.is_admin == self.is_admin
+                or (self.in_school and teacher.school_id is not None)
+                or (not self.in_school and teacher.school_id is None)
             )
+            and (self.is_admin is None or teacher.is_admin == self.is_admin)
             and (
                 self.in_class is None
-                or (self.in_class and user.teacher.class_teacher.exists())
-                or (
-                    not self.in_class
-                    and not user.teacher.class_teacher.exists()
-                )
+                or (self.in_class and teacher.class_teacher.exists())
+                or (not self.in_class and not teacher.class_teacher.exists())
             )
         )
@@ -83,42 +83,57 @@ class UserSerializer(BaseUserSerializer[AnyUser], t.Generic[AnyUser]):
         fields = [*BaseUserSerializer.Meta.fields, "student", "teacher"]
 
     def to_representation(self, instance):
-        try:
-            student = (
-                dict(StudentSerializer(instance.new_student).data)
-                if instance.new_student and instance.new_student.class_field
-                else None
-            )
-        except Student.DoesNotExist:
-            student = None
-
-        try:
-            requesting_to_join_class = (
-                instance.new_student.pending_class_request.access_code
-                if instance.new_student
-                and instance.new_student.pending_class_request
-                else None
-            )
-        except Student.DoesNotExist:
-            requesting_to_join_class = None
-
-        try:
-            teacher = (
-                dict(TeacherSerializer[Teacher](instance.new_teacher).data)
-                if instance.new_teacher
-                else None
-            )
-        except Teacher.DoesNotExist:
-            teacher = None
-
-        return {
-            "id": instance.id,
-            "first_name": instance.first_name,
-            "last_name": instance.last_name,
-            "email": instance.email,
-            "is_active": instance.is_active,
-            "date_joined": instance.date_joined,
-            "requesting_to_join_class": requesting_to_join_class,
-            "student": student,
-            "teacher": teacher,
+        fields = self.fields
+        representation: t.Dict[str, t.Any] = {
+            name: getattr(instance, name)
+            for name in [
+                "id",
+                "first_name",
+                "last_name",
+                "email",
+                "is_active",
+                "date_joined",
+            ]
+            if name in fields
         }
+
+        if "requesting_to_join_class" in fields:
+            try:
+                representation["requesting_to_join_class"] = (
+                    instance.new_student.pending_class_request.access_code
+                    if instance.new_student
+                    and instance.new_student.pending_class_request
+                    else None
+                )
+            except Student.DoesNotExist:
+                representation["requesting_to_join_class"] = None
+
+        if "student" in fields:
+            try:
+                representation["student"] = (
+                    dict(
+                        fields["student"].to_representation(
+                            instance.new_student
+                        )
+                    )
+                    if instance.new_student and instance.new_student.class_field
+                    else None
+                )
+            except Student.DoesNotExist:
+                representation["student"] = None
+
+        if "teacher" in fields:
+            try:
+                representation["teacher"] = (
+                    dict(
+                        fields["teacher"].to_representation(
+                            instance.new_teacher
+                        )
+                    )
+                    if instance.new_teacher
+                    else None
+                )
+            except Teacher.DoesNotExist:
+                representation["teacher"] = None
+
+        return representation
@@ -0,0 +1,86 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 15:22:09(+01:00).
+"""
+
+import logging
+import time
+import typing as t
+
+from django.utils import timezone
+
+from ..tasks import shared_task
+from .caches import GoogleOAuth2TokenCache
+from .models import Session, SessionAuthFactor
+
+
+@shared_task
+def renew_google_oauth2_token(
+    user_id: int,
+    renew_until: float,
+    renewal_id: str,
+    version: t.Optional[int] = None,
+):
+    """
+    Renew a user's Google OAuth 2.0 token shortly before it expires, so that
+    requests never wait for the token to be refreshed.
+
+    The token isn't renewed if the renewal was replaced by another, such as
+    when the task is delivered more than once.
+
+    Args:
+        user_id: The ID of the user whose token to renew.
+        renew_until: The timestamp after which the token is no longer renewed.
+        renewal_id: The ID of the renewal chain this renewal is part of.
+        version: The version of the cached token.
+    """
+    if time.time() < renew_until and GoogleOAuth2TokenCache.is_current_renewal(
+        user_id, renewal_id, version
+    ):
+        GoogleOAuth2TokenCache.refresh(
+            [user_id], version=version, renew_until=renew_until
+        )
+
+
+@shared_task
+def purge_expired_sessions(batch_size: int = 1000, max_batches: int = 100):
+    """
+    Delete expired sessions, and their auth factors, in batches so that each
+    delete is short and the sessions table stays small. Sessions which are
+    still expired after the max number of batches are deleted by the next run.
+
+    This task isn't scheduled by this package. Services must trigger it
+    periodically (e.g. every 15 minutes) from their scheduler, or expired
+    sessions are never deleted.
+
+    Args:
+        batch_size: The max number of sessions deleted per batch.
+        max_batches: The max number of batches per run.
+
+    Returns:
+        The number of batches run and rows deleted.
+    """
+    metrics = {"batches": 0, "sessions": 0, "session_auth_factors": 0}
+    while metrics["batches"] < max_batches:
+        now = timezone.now()
+        session_keys = list(
+            Session.objects.filter(expire_date__lt=now).values_list(
+                "pk", flat=True
+            )[:batch_size]
+        )
+        if not session_keys:
+            break
+
+        # A session may have been renewed since it was selected.
+        _, deleted = Session.objects.filter(
+            pk__in=session_keys, expire_date__lt=now
+        ).delete()
+        metrics["batches"] += 1
+        metrics["sessions"] += deleted.get(Session._meta.label, 0)
+        metrics["session_auth_factors"] += deleted.get(
+            SessionAuthFactor._meta.label, 0
+        )
+
+        logging.info("Purged expired sessions: %s", metrics)
+
+    return metrics
@@ -0,0 +1,136 @@
+"""
+© Ocado Group
+Created on 18/10/2026 at 15:22:09(+01:00).
+"""
+
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+
+from ..tests import TestCase
+from .caches import GoogleOAuth2TokenCache
+from .models import AuthFactor, Session, SessionAuthFactor, User
+from .tasks import purge_expired_sessions, renew_google_oauth2_token
+
+# pylint: disable=missing-class-docstring
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+)
+class TestRenewGoogleOAuth2Token(TestCase):
+    def setUp(self):
+        cache.clear()
+        cache.set(GoogleOAuth2TokenCache.make_renewal_key(1), "renewal")
+
+    def test_renew(self):
+        """Renews the token during the renewal period."""
+        renew_until = time.time() + 60
+
+        with patch.object(GoogleOAuth2TokenCache, "refresh") as refresh:
+            renew_google_oauth2_token.apply(
+                kwargs={
+                    "user_id": 1,
+                    "renew_until": renew_until,
+                    "renewal_id": "renewal",
+                }
+            )
+            refresh.assert_called_once_with(
+                [1], version=None, renew_until=renew_until
+            )
+
+    def test_renew__expired(self):
+        """Doesn't renew the token after the renewal period."""
+        with patch.object(GoogleOAuth2TokenCache, "refresh") as refresh:
+            renew_google_oauth2_token.apply(
+                kwargs={
+                    "user_id": 1,
+                    "renew_until": time.time() - 1,
+                    "renewal_id": "renewal",
+                }
+            )
+            refresh.assert_not_called()
+
+    def test_renew__replaced(self):
+        """Doesn't renew the token if the renewal was replaced by another."""
+        with patch.object(GoogleOAuth2TokenCache, "refresh") as refresh:
+            renew_google_oauth2_token.apply(
+                kwargs={
+                    "user_id": 1,
+                    "renew_until": time.time() + 60,
+                    "renewal_id": "replaced-renewal",
+                }
+            )
+            refresh.assert_not_called()
+
+
+class TestPurgeExpiredSessions(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        now = timezone.now()
+        for index, user in enumerate(User.objects.all()[:3]):
+            session = Session.objects.create(
+                session_key=f"session-{index}",
+                session_data="",
+                # Only the last session hasn't expired.
+                expire_date=now + timedelta(hours=index - 1),
+                user=user,
+            )
+            SessionAuthFactor.objects.create(
+                session=session,
+                auth_factor=AuthFactor.objects.create(
+                    user=user, type=AuthFactor.Type.OTP
+                ),
+            )
+
+    def test_purge(self):
+        """Deletes the expired sessions and their auth factors in batches."""
+        result = purge_expired_sessions.apply(kwargs={"batch_size": 1})
+
+        assert result.get() == {
+            "batches": 2,
+            "sessions": 2,
+            "session_auth_factors": 2,
+        }
+        assert list(Session.objects.values_list("pk", flat=True)) == [
+            "session-2"
+        ]
+        assert SessionAuthFactor.objects.count() == 1
+
+    def test_purge__max_batches(self):
+        """Stops after the max number of batches."""
+        result = purge_expired_sessions.apply(
+            kwargs={"batch_size": 1, "max_batches": 1}
+        )
+
+        assert result.get()["sessions"] == 1
+        assert Session.objects.count() == 2
+
+    def test_purge__renewed(self):
+        """Doesn't delete sessions which were renewed after being selected."""
+        filter_sessions = Session.objects.filter
+
+        def renew_sessions(*args, **kwargs):
+            if "pk__in" in kwargs:
+                filter_sessions(pk__in=kwargs["pk__in"]).update(
+                    expire_date=timezone.now() + timedelta(hours=1)
+                )
+
+            return filter_sessions(*args, **kwargs)
+
+        with patch.object(Session.objects, "filter", renew_sessions):
+            result = purge_expired_sessions.apply(
+                kwargs={"batch_size": 1, "max_batches": 1}
+            )
+
+        assert result.get()["sessions"] == 0
+        assert Session.objects.count() == 3
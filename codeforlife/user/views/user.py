@@ -20,6 +20,7 @@ class UserViewSet(ModelViewSet[User, User]):
     http_method_names = ["get"]
     serializer_class = UserSerializer[User]
     filterset_class = UserFilterSet
+    list_query_budget = 10
 
     # pylint: disable-next=missing-function-docstring
     def get_queryset(
@@ -4,11 +4,17 @@ Created on 19/01/2024 at 17:15:56(+00:00).
 """
 
 import typing as t
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.db.models import Q
 from django.db.models.query import QuerySet
+from django.test import override_settings
+from rest_framework import status
 
+from ...caches import ModelVersionCache, ResponseCache
 from ...tests import ModelViewSetTestCase
+from ...views import QueryBudgetWarning
 from ..models import (
     AdminSchoolTeacherUser,
     Class,
@@ -145,6 +151,146 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
         self.client.login_as(user)
         self.client.list(models=users)
 
+    def test_filter_queryset__plan_related(self):
+        """Only the planned actions select the relations the serializer reads."""
+        user = self.admin_school_teacher_user
+        request = self.client.request_factory.get(user=user)
+
+        with patch.object(
+            UserViewSet, "get_related_plan", autospec=True
+        ) as get_related_plan:
+            UserViewSet(
+                request=request, action="retrieve", format_kwarg=None
+            ).filter_queryset(User.objects.all())
+            get_related_plan.assert_called_once()
+
+            get_related_plan.reset_mock()
+            UserViewSet(
+                request=request, action="partial_update", format_kwarg=None
+            ).filter_queryset(User.objects.all())
+            get_related_plan.assert_not_called()
+
+    def test_list__query_budget(self):
+        """Listing users over the query budget warns."""
+        user = self.admin_school_teacher_user
+        users = list(user.teacher.school_teacher_users.order_by("pk"))
+
+        self.client.login_as(user)
+        with patch.object(UserViewSet, "list_query_budget", 1):
+            with self.assertWarns(QueryBudgetWarning):
+                self.client.list(models=users, filters={"type": "teacher"})
+
+    def test_list__fields(self):
+        """Can list only the selected fields of users."""
+        user = self.admin_school_teacher_user
+        users = list(user.teacher.school_teacher_users.order_by("pk"))
+
+        self.client.login_as(user)
+        response = self.client.list(
+            models=users,
+            make_assertions=False,
+            filters={"type": "teacher", "fields": "id,first_name"},
+        )
+
+        assert response.json()["data"] == [
+            {"id": teacher_user.id, "first_name": teacher_user.first_name}
+            for teacher_user in users
+        ]
+
+    def _list_etag(self, user: User):
+        cache.clear()
+        local_cache = ModelVersionCache.get_local_cache()
+        assert local_cache
+        local_cache.clear()
+
+        # ETags are opt-in.
+        etag_models = (User, Student, Class)
+        self.patch_object(UserViewSet, "etag_models", new=etag_models)
+        self.patch_object(ModelVersionCache, "tracked", new=set())
+        ModelVersionCache.track(*etag_models)
+
+        self.client.login_as(user)
+        response = self.client.list(
+            models=[], make_assertions=False, filters={"type": "teacher"}
+        )
+        assert response["ETag"]
+        assert "Last-Modified" not in response
+
+        return response["ETag"]
+
+    def test_list__no_etag(self):
+        """Responses have no ETag unless the view set opts in."""
+        self.client.login_as(self.admin_school_teacher_user)
+        response = self.client.list(
+            models=[], make_assertions=False, filters={"type": "teacher"}
+        )
+        assert "ETag" not in response
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        }
+    )
+    def test_list__not_modified(self):
+        """Unchanged users are not modified, without reading the users."""
+        user = self.admin_school_teacher_user
+        etag = self._list_etag(user)
+
+        with patch.object(
+            UserViewSet, "filter_queryset", autospec=True
+        ) as filter_queryset:
+            response = self.client.list(
+                models=[],
+                status_code_assertion=status.HTTP_304_NOT_MODIFIED,
+                make_assertions=False,
+                filters={"type": "teacher"},
+                HTTP_IF_NONE_MATCH=etag,
+            )
+            filter_queryset.assert_not_called()
+        assert response["ETag"] == etag
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        }
+    )
+    def test_list__modified(self):
+        """Changing a class the users depend on changes the ETag."""
+        user = self.admin_school_teacher_user
+        etag = self._list_etag(user)
+
+        klass = Class.objects.first()
+        assert klass
+        with self.captureOnCommitCallbacks(execute=True):
+            klass.save()
+
+        response = self.client.list(
+            models=[],
+            make_assertions=False,
+            filters={"type": "teacher"},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response["ETag"] != etag
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        }
+    )
+    def test_list__response_cache(self):
+        """Responses are cached by their ETag."""
+        user = self.admin_school_teacher_user
+        with patch.object(UserViewSet, "response_cache_timeout", 60):
+            etag = self._list_etag(user)
+
+        assert ResponseCache.get(etag.strip('"')) is not None
+
     def test_list__students_in_class(self):
         """Can successfully list student-users in a class."""
         user = self.admin_school_teacher_user
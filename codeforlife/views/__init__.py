@@ -9,5 +9,5 @@ from .base_login import BaseLoginView
 from .csrf import CsrfCookieView
 from .decorators import action
 from .health_check import HealthCheckView
-from .model import BaseModelViewSet, ModelViewSet
+from .model import BaseModelViewSet, ModelViewSet, QueryBudgetWarning
 from .session import LogoutView, session_expired_view
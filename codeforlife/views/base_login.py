@@ -63,9 +63,6 @@ class BaseLoginView(
     ):
         user = form.user
 
-        # Clear expired sessions.
-        self.request.session.clear_expired(user_id=user.pk)
-
         # Create session (without data).
         login(self.request, user)  # type: ignore[arg-type]
 
@@ -4,15 +4,23 @@ Created on 24/01/2024 at 13:08:23(+00:00).
 """
 
 import typing as t
-from functools import cached_property
+import warnings
+from functools import cached_property, partial
+from hashlib import sha256
 
 from django.db.models import Model
 from django.db.models.query import QuerySet
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from rest_framework import status
+from rest_framework.pagination import BasePagination
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework.serializers import ListSerializer
 from rest_framework.viewsets import ModelViewSet as DrfModelViewSet
 
+from ..caches import ModelVersion, ModelVersionCache, ResponseCache
+from ..models.signals import bump_model_versions
 from ..permissions import Permission
 from ..request import BaseRequest, Request
 from ..types import KwArgs
@@ -54,6 +62,10 @@ AnyBaseRequest = t.TypeVar("AnyBaseRequest", bound=BaseRequest)
 # pylint: enable=duplicate-code
 
 
+class QueryBudgetWarning(UserWarning):
+    """A view made more queries than its budget allows."""
+
+
 # pylint: disable-next=too-many-ancestors
 class BaseModelViewSet(
     BaseAPIView[AnyBaseRequest],
@@ -67,6 +79,30 @@ class BaseModelViewSet(
 
     REQUIRED_ATTRS: t.Set[str] = {"request_class", "model_class"}
 
+    # The actions which select and prefetch the relations the serializer reads.
+    # Other actions, such as updates and custom actions, may not serialize the
+    # relations or may serialize them with another serializer.
+    plan_related_actions: t.Set[str] = {"list", "retrieve"}
+    # The most queries a list action should make, including authenticating the
+    # request. If None, there's no budget. Exceeding it only warns in tests.
+    list_query_budget: t.Optional[int] = None
+    # The pagination classes of actions which don't use pagination_class, such
+    # as {"list": CursorPagination}.
+    action_pagination_classes: t.Dict[str, t.Type[BasePagination]] = {}
+    # The models the list and retrieve actions read. If set, their responses
+    # have an ETag which changes when a row of any of the models changes, and
+    # conditional requests for unchanged responses are answered with 304 Not
+    # Modified without reading the rows. Only set this if the models' rows are
+    # only changed in ways which send signals (see ModelVersionCache).
+    etag_models: t.Tuple[t.Type[Model], ...] = ()
+    # How many seconds to cache the list and retrieve actions' responses by
+    # their ETag. If None, responses aren't cached. Requires etag_models.
+    response_cache_timeout: t.Optional[int] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        ModelVersionCache.track(*cls.etag_models)
+
     @cached_property
     def lookup_field_name(self):
         """The name of the lookup field."""
@@ -79,7 +115,185 @@ class BaseModelViewSet(
     def get_permissions(self):
         return t.cast(t.List[Permission], super().get_permissions())
 
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            pagination_class = self.action_pagination_classes.get(
+                t.cast(str, self.action), self.pagination_class
+            )
+            self._paginator = (
+                None if pagination_class is None else pagination_class()
+            )
+
+        return self._paginator
+
+    def get_related_plan(self, model: t.Type[AnyModel]):
+        """Plan the relations to select and prefetch for the serializer.
+
+        Args:
+            model: The model of the instances to serialize.
+
+        Returns:
+            The relations the serializer reads.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from ..serializers import RelatedPlan
+
+        return RelatedPlan.from_serializer(self.get_serializer(), model)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in self.plan_related_actions and isinstance(
+            queryset, QuerySet
+        ):
+            queryset = self.get_related_plan(queryset.model).apply(queryset)
+
+        return queryset
+
+    @classmethod
+    def check_query_budget(cls, action: str, num_queries: int):
+        """Warn if an action made more queries than its budget allows.
+
+        Args:
+            action: The action that was called.
+            num_queries: The number of queries the action made.
+        """
+        if (
+            action == "list"
+            and cls.list_query_budget is not None
+            and num_queries > cls.list_query_budget
+        ):
+            warnings.warn(
+                f"{cls.__name__}.list made {num_queries} queries, which is"
+                f" more than its budget of {cls.list_query_budget}.",
+                QueryBudgetWarning,
+                stacklevel=2,
+            )
+
+    def get_field_selection(self):
+        """Get the fields the request selected to read.
+
+        Fields are selected with the "fields" and "expand" query parameters.
+        See `codeforlife.serializers.parse_field_selection`.
+
+        Returns:
+            The selected fields or, if the request doesn't select any or isn't
+            a read, None.
+        """
+        if self.request.method not in SAFE_METHODS:
+            return None
+
+        # pylint: disable-next=import-outside-toplevel
+        from ..serializers import parse_field_selection
+
+        return parse_field_selection(
+            self.request.query_params.get("fields"),
+            self.request.query_params.get("expand"),
+        )
+
+    def get_etag(self, versions: t.Dict[t.Type[Model], ModelVersion]):
+        """Get the ETag of the response to the request.
+
+        Args:
+            versions: The versions of the models the response is built from.
+
+        Returns:
+            A hash of the models' versions and everything else the response
+            depends on.
+        """
+        request = self.request
+        etag = sha256()
+        for label, token in sorted(
+            # pylint: disable-next=protected-access
+            (model._meta.label_lower, version)
+            for model, version in versions.items()
+        ):
+            etag.update(f"{label}={token};".encode())
+        etag.update(
+            "\n".join(
+                [
+                    str(self.action),
+                    request.get_full_path(),
+                    str(getattr(request.user, "pk", None)),
+                    request.META.get("HTTP_ACCEPT", ""),
+                ]
+            ).encode()
+        )
+
+        return etag.hexdigest()
+
+    def get_conditional_response(
+        self, request: AnyBaseRequest, get_response: t.Callable[[], Response]
+    ):
+        """Answer a conditional request without reading unchanged rows.
+
+        If the response hasn't changed since the ETag the client sent, 304 Not
+        Modified is returned without getting the response. Otherwise, the
+        response is loaded from the response cache or got.
+
+        Args:
+            request: The request to respond to.
+            get_response: Gets the response from the rows.
+
+        Returns:
+            The response, with its ETag.
+        """
+        versions = (
+            ModelVersionCache.get_versions(self.etag_models)
+            if self.etag_models
+            else None
+        )
+        if versions is None:
+            return get_response()
+
+        etag = self.get_etag(versions)
+
+        response = get_conditional_response(
+            request._request,  # pylint: disable=protected-access
+            etag=quote_etag(etag),
+        )
+        if response is None:
+            data = None
+            if self.response_cache_timeout is not None:
+                try:
+                    data = ResponseCache.get(etag)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    data = None
+
+            if data is None:
+                response = get_response()
+                if (
+                    self.response_cache_timeout is not None
+                    and response.status_code == status.HTTP_200_OK
+                ):
+                    try:
+                        ResponseCache.set(
+                            etag,
+                            response.data,
+                            timeout=self.response_cache_timeout,
+                        )
+                    except Exception:  # pylint: disable=broad-exception-caught
+                        pass
+            else:
+                response = Response(data)
+
+        response["ETag"] = quote_etag(etag)
+        # Clients must revalidate as responses depend on the user.
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return response
+
     def get_serializer(self, *args, **kwargs):
+        # pylint: disable-next=import-outside-toplevel
+        from ..serializers import BaseModelSerializer
+
+        if "field_selection" not in kwargs and issubclass(
+            self.get_serializer_class(), BaseModelSerializer
+        ):
+            field_selection = self.get_field_selection()
+            if field_selection is not None:
+                kwargs["field_selection"] = field_selection
+
         serializer = super().get_serializer(*args, **kwargs)
 
         if self.action == "bulk":
@@ -127,15 +341,23 @@ class BaseModelViewSet(
     ):
         return super().create(request, *args, **kwargs)
 
-    def list(  # type: ignore[override] # pragma: no cover
+    # pylint: enable=useless-parent-delegation
+
+    def list(  # type: ignore[override]
         self, request: AnyBaseRequest, *args, **kwargs
     ):
-        return super().list(request, *args, **kwargs)
+        return self.get_conditional_response(
+            request, partial(super().list, request, *args, **kwargs)
+        )
 
-    def retrieve(  # type: ignore[override] # pragma: no cover
+    def retrieve(  # type: ignore[override]
         self, request: AnyBaseRequest, *args, **kwargs
     ):
-        return super().retrieve(request, *args, **kwargs)
+        return self.get_conditional_response(
+            request, partial(super().retrieve, request, *args, **kwargs)
+        )
+
+    # pylint: disable=useless-parent-delegation
 
     def update(  # type: ignore[override] # pragma: no cover
         self, request: AnyBaseRequest, *args, **kwargs
@@ -214,6 +436,8 @@ class ModelViewSet(
             serializer: A model serializer for the specific model.
         """
         serializer.save()
+        # Bulk saves don't send signals.
+        bump_model_versions(self.model_class)
 
     def bulk_partial_update(self, request: Request[RequestUser]):
         # pylint: disable=line-too-long
@@ -252,6 +476,8 @@ class ModelViewSet(
             serializer: A model serializer for the specific model.
         """
         serializer.save()
+        # Bulk saves don't send signals.
+        bump_model_versions(self.model_class)
 
     def bulk_destroy(self, request: Request[RequestUser]):
         """Bulk destroy many instances of a model.
@@ -276,6 +502,8 @@ class ModelViewSet(
             queryset: A queryset of the models to delete.
         """
         queryset.delete()
+        # Deletes which don't fetch the rows first don't send signals.
+        bump_model_versions(self.model_class)
 
     @action(detail=False, methods=["post", "patch", "delete"])
     def bulk(self, request: Request[RequestUser]):